@@ -48,6 +48,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "answerking_app.utils.db_router.ReplicaRoutingMiddleware",
     "django.middleware.common.CommonMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -86,9 +87,63 @@ REST_FRAMEWORK = {
     "DATETIME_FORMAT": "%Y-%m-%dT%H:%M:%S.%fZ",
 }
 
+# JSON_BACKEND=orjson swaps the stdlib JSON renderer and parser for orjson
+if os.environ.get("JSON_BACKEND") == "orjson":
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = [
+        "answerking_app.utils.orjson_backend.ORJSONParser",
+    ]
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [
+        "answerking_app.utils.orjson_backend.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ]
+
+# Page size of paginated lists, and the largest a client may request with
+# ?pageSize=
+PAGE_SIZE = int(os.environ.get("PAGE_SIZE", 100))
+MAX_PAGE_SIZE = int(os.environ.get("MAX_PAGE_SIZE", 1000))
+
+# Cache used for rendered catalog responses. Locmem is per process, so use
+# the file-based backend (or a shared cache) when running several workers.
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", "answerking"),
+        "TIMEOUT": int(os.environ.get("CACHE_TIMEOUT", 3600)),
+    },
+    # Rendered JSON of single products and categories, keyed by row
+    # version so entries never need invalidating.
+    "fragments": {
+        "BACKEND": os.environ.get(
+            "FRAGMENT_CACHE_BACKEND",
+            "django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": os.environ.get("FRAGMENT_CACHE_LOCATION", "fragments"),
+        "TIMEOUT": int(os.environ.get("FRAGMENT_CACHE_TIMEOUT", 86400)),
+        "OPTIONS": {"MAX_ENTRIES": 100000},
+    },
+}
+
+# File the catalog snapshot is memory-mapped from, shared by all workers.
+# When unset every process keeps its own in-memory snapshot.
+CATALOG_SNAPSHOT_PATH = os.environ.get("CATALOG_SNAPSHOT_PATH")
+
+# Serve plain GET requests for products, categories and orders from async
+# views. Only for ASGI servers, compare with benchmarkAsgi before enabling.
+ASYNC_READ_VIEWS = (
+    os.environ.get("ASYNC_READ_VIEWS", "false").lower() == "true"
+)
+
 # Database
 # https://docs.djangoproject.com/en/4.0/ref/settings/#databases
 
+DATABASE_CONN_HEALTH_CHECKS = (
+    os.environ.get("DATABASE_CONN_HEALTH_CHECKS", "true").lower() == "true"
+)
+
 DATABASES = {
     "default": {
         "ENGINE": os.environ.get("DATABASE_ENGINE"),
@@ -97,9 +152,46 @@ DATABASES = {
         "PORT": os.environ.get("DATABASE_PORT"),
         "USER": os.environ.get("DATABASE_USER"),
         "PASSWORD": os.environ.get("DATABASE_PASS"),
+        # Keep connections open between requests, checking them before
+        # reuse, instead of reconnecting on every request.
+        "CONN_MAX_AGE": int(os.environ.get("DATABASE_CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": DATABASE_CONN_HEALTH_CHECKS,
     }
 }
 
+# DATABASE_POOL_SIZE switches to the pooled MySQL backend, which caps the
+# connections of each process. They go back to the pool after every
+# request rather than staying with one thread.
+if os.environ.get("DATABASE_POOL_SIZE"):
+    DATABASES["default"].update(
+        {
+            "ENGINE": "answerking_app.backends.mysql_pool",
+            "CONN_MAX_AGE": 0,
+            "POOL_SIZE": int(os.environ["DATABASE_POOL_SIZE"]),
+            "POOL_TIMEOUT": float(os.environ.get("DATABASE_POOL_TIMEOUT", 5)),
+        }
+    )
+
+# DATABASE_REPLICAS is a comma-separated list of read replica hosts, or of
+# database files when using SQLite copies as local stand-ins. Safe requests
+# read from one of them unless the client wrote within the sticky window.
+_replica_key = (
+    "NAME" if "sqlite" in (DATABASES["default"]["ENGINE"] or "") else "HOST"
+)
+REPLICA_DATABASES = []
+for _number, _replica in enumerate(
+    filter(None, os.environ.get("DATABASE_REPLICAS", "").split(",")), 1
+):
+    DATABASES[f"replica{_number}"] = {
+        **DATABASES["default"],
+        _replica_key: _replica.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+    REPLICA_DATABASES.append(f"replica{_number}")
+
+DATABASE_ROUTERS = ["answerking_app.utils.db_router.ReplicaRouter"]
+REPLICA_STICKY_SECONDS = int(os.environ.get("REPLICA_STICKY_SECONDS", 5))
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 
@@ -142,7 +234,12 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 CORS_ALLOW_METHODS = default_methods
-CORS_ALLOW_HEADERS = default_headers + ("Access-Control-Allow-Origin",)
+CORS_ALLOW_HEADERS = default_headers + (
+    "Access-Control-Allow-Origin",
+    "if-none-match",
+    "if-modified-since",
+)
+CORS_EXPOSE_HEADERS = ["ETag", "Last-Modified"]
 CORS_ALLOW_ALL_ORIGINS = True
 
 CORS_REPLACE_HTTPS_REFERER = False
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AnswerkingAppConfig(AppConfig):
     default_auto_field: str = "django.db.models.BigAutoField"
     name: str = "answerking_app"
+
+    def ready(self):
+        from answerking_app import signals  # noqa: F401
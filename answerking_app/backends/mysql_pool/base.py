@@ -0,0 +1,45 @@
+from functools import partial
+from typing import Any
+
+from django.db.backends.mysql.base import Database
+from django.db.backends.mysql.base import (
+    DatabaseWrapper as MySQLDatabaseWrapper,
+)
+
+from answerking_app.utils.connection_pool import ConnectionPool, get_pool
+
+
+def ping(connection: Any) -> bool:
+    try:
+        connection.ping()
+    except Database.Error:
+        return False
+    return True
+
+
+class DatabaseWrapper(MySQLDatabaseWrapper):
+    """MySQL backend that borrows connections from a bounded pool.
+
+    Closing the connection at the end of a request returns it to the pool
+    instead of disconnecting, unless it was left mid-transaction or after
+    an error. Sized by the POOL_SIZE and POOL_TIMEOUT database settings.
+    """
+
+    @property
+    def pool(self) -> ConnectionPool:
+        return get_pool(
+            self.alias,
+            self.settings_dict["POOL_SIZE"],
+            self.settings_dict["POOL_TIMEOUT"],
+            ping if self.settings_dict["CONN_HEALTH_CHECKS"] else None,
+        )
+
+    def get_new_connection(self, conn_params: dict) -> Any:
+        return self.pool.checkout(
+            partial(super().get_new_connection, conn_params)
+        )
+
+    def _close(self):
+        idle: bool = not (self.in_atomic_block or self.errors_occurred)
+        default: bool = self.autocommit == self.settings_dict["AUTOCOMMIT"]
+        self.pool.release(self.connection, reusable=idle and default)
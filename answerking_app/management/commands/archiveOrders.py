@@ -0,0 +1,52 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.utils import timezone
+
+from answerking_app.utils.order_archive import archive_orders
+
+
+class Command(BaseCommand):
+    """Move old paid and cancelled orders into the archive tables.
+
+    With --every the command keeps running and archives on that interval,
+    for use as a long-running scheduled process.
+    """
+
+    help = "Archive paid and cancelled orders older than --days"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=90)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.1,
+            help="Seconds to sleep between batches",
+        )
+        parser.add_argument(
+            "--every",
+            type=int,
+            default=0,
+            help="Run every N seconds instead of once",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            created_before: datetime.datetime = (
+                timezone.now() - datetime.timedelta(days=options["days"])
+            )
+            archived: int = archive_orders(
+                created_before, options["batch_size"], options["pause"]
+            )
+            self.stdout.write(
+                f"Archived {archived} orders created before "
+                f"{created_before.isoformat()}"
+            )
+            if not options["every"]:
+                return
+            # Don't hold a connection the server may drop while sleeping.
+            connections.close_all()
+            time.sleep(options["every"])
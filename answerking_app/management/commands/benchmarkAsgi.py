@@ -0,0 +1,243 @@
+import asyncio
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+
+from answerking_app.models.models import Category, Order, Product
+from answerking_app.utils.benchmark import seed_catalog, seed_orders
+from answerking_app.utils.catalog_snapshot import bump_catalog_generation
+
+WARMUP_REQUESTS = 20
+DELETE_BATCH_SIZE = 500
+CATEGORY_COUNT = 5
+
+
+def wsgi_environ(path: str) -> dict:
+    return {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "SERVER_NAME": settings.ALLOWED_HOSTS[0],
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_ACCEPT": "application/json",
+        "wsgi.input": io.BytesIO(),
+        "wsgi.url_scheme": "http",
+    }
+
+
+def asgi_scope(path: str) -> dict:
+    host: str = settings.ALLOWED_HOSTS[0]
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", host.encode()),
+            (b"accept", b"application/json"),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": (host, 80),
+    }
+
+
+def run_wsgi(path: str, requests: int, concurrency: int) -> list[tuple]:
+    """Threads calling the WSGI application, like a threaded server."""
+    application = get_wsgi_application()
+
+    def request(_) -> tuple[float, str]:
+        statuses: list[str] = []
+        start: float = time.perf_counter()
+        body = application(
+            wsgi_environ(path),
+            lambda status, headers, exc_info=None: statuses.append(status),
+        )
+        try:
+            b"".join(body)
+        finally:
+            body.close()
+        return time.perf_counter() - start, statuses[0][:3]
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        return list(pool.map(request, range(requests)))
+
+
+def run_asgi(path: str, requests: int, concurrency: int) -> list[tuple]:
+    """Concurrent calls of the ASGI application on one event loop."""
+    application = get_asgi_application()
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def request(slots: asyncio.Semaphore) -> tuple[float, str]:
+        statuses: list[str] = []
+
+        async def send(message: dict):
+            if message["type"] == "http.response.start":
+                statuses.append(str(message["status"]))
+
+        async with slots:
+            start: float = time.perf_counter()
+            await application(asgi_scope(path), receive, send)
+            return time.perf_counter() - start, statuses[0]
+
+    async def run() -> list[tuple]:
+        slots = asyncio.Semaphore(concurrency)
+        return list(
+            await asyncio.gather(*(request(slots) for _ in range(requests)))
+        )
+
+    return asyncio.run(run())
+
+
+def delete_seeded(model: type[Category | Order | Product], ids: list[int]):
+    for offset in range(0, len(ids), DELETE_BATCH_SIZE):
+        end: int = offset + DELETE_BATCH_SIZE
+        model.objects.filter(id__in=ids[offset:end]).delete()
+
+
+# Handler and environment of each configuration.
+SERVERS: dict[str, tuple[Callable, dict[str, str]]] = {
+    "wsgi": (run_wsgi, {"ASYNC_READ_VIEWS": "false"}),
+    "asgi": (run_asgi, {"ASYNC_READ_VIEWS": "false"}),
+    "asgi-async": (run_asgi, {"ASYNC_READ_VIEWS": "true"}),
+}
+
+
+class Command(BaseCommand):
+    """Compare WSGI, ASGI and ASGI with async views under concurrent GETs.
+
+    Each configuration runs in its own process, as ASYNC_READ_VIEWS is read
+    when the URLs are loaded. Requests are made in-process, without a
+    network server, against the configured database.
+    Seeded rows are committed so every connection sees them, and only those
+    rows are deleted once the benchmark finishes.
+    """
+
+    help = "Benchmark GET throughput and latency under WSGI against ASGI"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, default=64)
+        parser.add_argument("--products", type=int, default=50)
+        parser.add_argument("--orders", type=int, default=100)
+        parser.add_argument(
+            "--server",
+            choices=SERVERS,
+            help="Run the requests under one configuration and print the "
+            "timings as JSON, used by the benchmark for each process.",
+        )
+        parser.add_argument("--paths", nargs="+", default=[])
+
+    def handle(self, *args, **options):
+        if options["server"]:
+            self.serve(options)
+            return
+        product_ids: list[int] = []
+        category_ids: list[int] = []
+        order_ids: list[int] = []
+        try:
+            products: list[Product] = seed_catalog(
+                product_count=options["products"],
+                category_count=CATEGORY_COUNT,
+            )
+            product_ids = [product.id for product in products]
+            # Names are unique, so these are the categories just created.
+            category_ids = list(
+                Category.objects.filter(
+                    name__in=[
+                        f"Benchmark category {i}"
+                        for i in range(CATEGORY_COUNT)
+                    ]
+                ).values_list("id", flat=True)
+            )
+            order_ids = seed_orders(options["orders"], products)
+            bump_catalog_generation()
+            paths: list[str] = [
+                "/api/products",
+                f"/api/products/{product_ids[0]}",
+                "/api/categories",
+                f"/api/categories/{category_ids[0]}",
+                "/api/orders",
+                f"/api/orders/{order_ids[0]}",
+            ]
+            for server in SERVERS:
+                self.benchmark(server, paths, options)
+        finally:
+            delete_seeded(Order, order_ids)
+            delete_seeded(Category, category_ids)
+            delete_seeded(Product, product_ids)
+            bump_catalog_generation()
+
+    def benchmark(self, server: str, paths: list[str], options: dict):
+        output: str = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "django",
+                "benchmarkAsgi",
+                "--server",
+                server,
+                "--requests",
+                str(options["requests"]),
+                "--concurrency",
+                str(options["concurrency"]),
+                "--paths",
+                *paths,
+            ],
+            env={**os.environ, **SERVERS[server][1]},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for line in output.splitlines():
+            result: dict = json.loads(line)
+            self.stdout.write(
+                f"{server:<10} {result['path']:<24} "
+                f"{result['throughput']:>8.0f} req/s, "
+                f"p50 {result['p50_ms']:.1f} ms, "
+                f"p99 {result['p99_ms']:.1f} ms, "
+                f"{result['errors']} errors"
+            )
+
+    def serve(self, options: dict):
+        run: Callable = SERVERS[options["server"]][0]
+        for path in options["paths"]:
+            run(path, WARMUP_REQUESTS, options["concurrency"])
+            start: float = time.perf_counter()
+            timings: list[tuple] = run(
+                path, options["requests"], options["concurrency"]
+            )
+            elapsed: float = time.perf_counter() - start
+            latencies: list[float] = [timing[0] for timing in timings]
+            percentiles: list[float] = statistics.quantiles(latencies, n=100)
+            self.stdout.write(
+                json.dumps(
+                    {
+                        "path": path,
+                        "throughput": len(timings) / elapsed,
+                        "p50_ms": statistics.median(latencies) * 1000,
+                        "p99_ms": percentiles[98] * 1000,
+                        "errors": sum(
+                            timing[1] != "200" for timing in timings
+                        ),
+                    }
+                )
+            )
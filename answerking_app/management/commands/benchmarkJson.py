@@ -0,0 +1,61 @@
+import io
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from answerking_app.models.models import Order, Product
+from answerking_app.models.read_serializers import (
+    OrderReadSerializer,
+    ProductReadSerializer,
+)
+from answerking_app.utils.benchmark import measure, seed_catalog, seed_orders
+from answerking_app.utils.orjson_backend import ORJSONParser, ORJSONRenderer
+
+
+class Command(BaseCommand):
+    """Compare encode and decode times of the stdlib and orjson backends.
+
+    All seeded rows are rolled back once the benchmark finishes.
+    """
+
+    help = "Benchmark the JSON renderer and parser backends"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=2000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows: int = options["rows"]
+        with transaction.atomic():
+            products = seed_catalog(
+                product_count=rows, category_count=max(rows // 20, 1)
+            )
+            seed_orders(rows, products)
+            payloads = [
+                (
+                    "products",
+                    ProductReadSerializer(Product.objects.all()).data,
+                ),
+                ("orders", OrderReadSerializer(Order.objects.all()).data),
+            ]
+            transaction.set_rollback(True)
+        backends = [
+            ("json", JSONRenderer(), JSONParser()),
+            ("orjson", ORJSONRenderer(), ORJSONParser()),
+        ]
+        for name, data in payloads:
+            for backend, renderer, parser in backends:
+                body: bytes = renderer.render(data)
+                encode = measure(
+                    lambda: renderer.render(data), options["repeat"]
+                )
+                decode = measure(
+                    lambda: parser.parse(io.BytesIO(body)), options["repeat"]
+                )
+                self.stdout.write(
+                    f"{name:>8} {backend:>6}: {len(body):,} bytes, "
+                    f"encode {encode.median_ms:.1f} ms, "
+                    f"decode {decode.median_ms:.1f} ms"
+                )
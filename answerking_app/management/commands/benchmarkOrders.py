@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.http import HttpResponseBase
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from answerking_app.models.models import Order
+from answerking_app.models.serializers import OrderSerializer
+from answerking_app.utils.benchmark import measure, seed_catalog, seed_orders
+from answerking_app.views.order_views import OrderListView
+
+
+def render(response: HttpResponseBase) -> bytes:
+    # Order lists are served as pre-rendered documents.
+    if isinstance(response, Response):
+        response.render()
+    return response.content
+
+
+class Command(BaseCommand):
+    """Time GET /api/orders against a growing number of seeded orders.
+
+    All seeded rows are rolled back once the benchmark finishes.
+    """
+
+    help = "Benchmark the order list endpoint at different table sizes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[1000, 10000, 100000],
+        )
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "--naive",
+            action="store_true",
+            help="Also time serialization without the prefetch plan.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            products = seed_catalog(product_count=50, category_count=5)
+            seeded: int = 0
+            for size in sorted(options["sizes"]):
+                seed_orders(size - seeded, products)
+                seeded = size
+                self.benchmark(size, options["repeat"], options["naive"])
+            transaction.set_rollback(True)
+
+    def benchmark(self, size: int, repeat: int, naive: bool):
+        view = OrderListView.as_view()
+        request = APIRequestFactory().get("/api/orders")
+        result = measure(lambda: render(view(request)), repeat)
+        self.stdout.write(
+            f"{size:>7} orders: median {result.median_ms:.1f} ms, "
+            f"best {result.best_ms:.1f} ms, {result.queries} queries"
+        )
+        if naive:
+            result = measure(
+                lambda: OrderSerializer(Order.objects.all(), many=True).data,
+                repeat,
+            )
+            self.stdout.write(
+                f"{size:>7} orders (no prefetch): "
+                f"median {result.median_ms:.1f} ms, {result.queries} queries"
+            )
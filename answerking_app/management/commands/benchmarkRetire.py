@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from answerking_app.models.models import Order
+from answerking_app.utils.benchmark import measure, seed_catalog, seed_orders
+from answerking_app.utils.mixins.RetireMixin import (
+    product_active_order_check,
+)
+
+
+class Command(BaseCommand):
+    """Time the active order check run before a product is retired.
+
+    All seeded rows are rolled back once the benchmark finishes.
+    """
+
+    help = "Benchmark product retirement against a large order history"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--history", type=int, default=500000)
+        parser.add_argument("--active", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            products = seed_catalog(product_count=10, category_count=2)
+            retiring, others = products[0], products[1:]
+            seed_orders(
+                options["history"],
+                [retiring],
+                lines_per_order=1,
+                order_status=Order.Status.PAID,
+            )
+            seed_orders(options["active"], others)
+            result = measure(
+                lambda: product_active_order_check(retiring),
+                options["repeat"],
+            )
+            self.stdout.write(
+                f"{options['history']} historical line items, "
+                f"{options['active']} active orders: "
+                f"median {result.median_ms:.2f} ms, "
+                f"best {result.best_ms:.2f} ms, {result.queries} queries"
+            )
+            transaction.set_rollback(True)
@@ -0,0 +1,79 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from answerking_app.models.models import Category, Order, Product
+from answerking_app.models.read_serializers import (
+    CategoryReadSerializer,
+    OrderReadSerializer,
+    ProductReadSerializer,
+)
+from answerking_app.models.serializers import (
+    CategorySerializer,
+    OrderSerializer,
+    ProductSerializer,
+)
+from answerking_app.utils.benchmark import measure, seed_catalog, seed_orders
+
+
+class Command(BaseCommand):
+    """Compare rows per second of the DRF serializers and read serializers.
+
+    All seeded rows are rolled back once the benchmark finishes.
+    """
+
+    help = "Benchmark ModelSerializer output against the read-only path"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=2000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows: int = options["rows"]
+        with transaction.atomic():
+            products = seed_catalog(
+                product_count=rows, category_count=max(rows // 20, 1)
+            )
+            seed_orders(rows, products)
+            cases = [
+                (
+                    "products",
+                    Product.objects.prefetch_related("category_set"),
+                    ProductSerializer,
+                    ProductReadSerializer,
+                ),
+                (
+                    "categories",
+                    Category.objects.prefetch_related("products"),
+                    CategorySerializer,
+                    CategoryReadSerializer,
+                ),
+                (
+                    "orders",
+                    OrderSerializer.setup_eager_loading(Order.objects.all()),
+                    OrderSerializer,
+                    OrderReadSerializer,
+                ),
+            ]
+            for name, queryset, serializer, read_serializer in cases:
+                count: int = queryset.count()
+                before = measure(
+                    lambda: self.render(
+                        serializer(queryset.all(), many=True).data
+                    ),
+                    options["repeat"],
+                )
+                after = measure(
+                    lambda: self.render(read_serializer(queryset.all()).data),
+                    options["repeat"],
+                )
+                self.stdout.write(
+                    f"{name:>10}: "
+                    f"{count / before.median_ms * 1000:,.0f} rows/s before, "
+                    f"{count / after.median_ms * 1000:,.0f} rows/s after"
+                )
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def render(data: list) -> bytes:
+        return JSONRenderer().render(data)
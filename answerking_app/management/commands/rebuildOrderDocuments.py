@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from answerking_app.utils.order_documents import (
+    REBUILD_BATCH_SIZE,
+    rebuild_order_documents,
+)
+
+
+class Command(BaseCommand):
+    """Render the read document of every order.
+
+    Run once after migrating to backfill existing orders, or to pick up
+    a change to the order representation.
+    """
+
+    help = "Rebuild the stored JSON documents of all orders"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=REBUILD_BATCH_SIZE
+        )
+
+    def handle(self, *args, **options):
+        rebuilt: int = rebuild_order_documents(options["batch_size"])
+        self.stdout.write(f"Rebuilt {rebuilt} order documents")
@@ -0,0 +1,19 @@
+# Generated by Django 4.1.5 on 2026-10-18 19:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answerking_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(
+                fields=['order_status', 'created_on'],
+                name='order_status_created_idx'),
+        ),
+    ]
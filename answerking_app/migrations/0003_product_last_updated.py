@@ -0,0 +1,21 @@
+# Generated by Django 4.1.5 on 2026-10-18 21:12
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answerking_app', '0002_order_status_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='last_updated',
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
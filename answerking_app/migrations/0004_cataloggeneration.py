@@ -0,0 +1,36 @@
+# Generated by Django 4.1.5 on 2026-10-18 21:40
+
+import secrets
+
+from django.db import migrations, models
+
+CATALOG_GENERATION_ID = 1
+
+
+def create_generation(apps, schema_editor):
+    # A random start keeps a recreated row from repeating a generation
+    # that some process still holds a snapshot of.
+    apps.get_model('answerking_app', 'CatalogGeneration').objects.get_or_create(
+        pk=CATALOG_GENERATION_ID,
+        defaults={'generation': secrets.randbits(62)},
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answerking_app', '0003_product_last_updated'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogGeneration',
+            fields=[
+                ('id', models.BigAutoField(
+                    auto_created=True, primary_key=True,
+                    serialize=False, verbose_name='ID')),
+                ('generation', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_generation, migrations.RunPython.noop),
+    ]
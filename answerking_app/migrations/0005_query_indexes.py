@@ -0,0 +1,37 @@
+# Generated by Django 4.1.5 on 2026-10-18 19:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answerking_app', '0004_cataloggeneration'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(
+                fields=['created_on'],
+                name='order_created_on_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lineitem',
+            index=models.Index(
+                fields=['product', 'order'],
+                name='lineitem_product_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(
+                fields=['retired'],
+                name='product_retired_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(
+                fields=['retired'],
+                name='category_retired_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.1.5 on 2026-10-18 19:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answerking_app', '0005_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedOrder',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('order_status', models.CharField(
+                    choices=[
+                        ('Created', 'Created'),
+                        ('Paid', 'Paid'),
+                        ('Cancelled', 'Cancelled'),
+                    ],
+                    max_length=10)),
+                ('order_total', models.DecimalField(decimal_places=2, max_digits=18)),
+                ('created_on', models.DateTimeField()),
+                ('last_updated', models.DateTimeField()),
+                ('archived_on', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedLineItem',
+            fields=[
+                ('id', models.BigAutoField(
+                    auto_created=True, primary_key=True,
+                    serialize=False, verbose_name='ID')),
+                ('quantity', models.IntegerField()),
+                ('sub_total', models.DecimalField(decimal_places=2, max_digits=18)),
+                ('order', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    to='answerking_app.archivedorder')),
+                ('product', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    to='answerking_app.product')),
+            ],
+            options={
+                'unique_together': {('order', 'product')},
+            },
+        ),
+    ]
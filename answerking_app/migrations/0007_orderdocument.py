@@ -0,0 +1,25 @@
+# Generated by Django 4.1.5 on 2026-10-18 19:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answerking_app', '0006_order_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderDocument',
+            fields=[
+                ('order', models.OneToOneField(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    primary_key=True, related_name='document',
+                    serialize=False, to='answerking_app.order')),
+                ('document', models.BinaryField()),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.1.5 on 2026-10-18 22:10
+
+from django.db import migrations, models
+
+ORDER_LIST_VERSION_ID = 1
+
+
+def create_version(apps, schema_editor):
+    apps.get_model('answerking_app', 'OrderListVersion').objects.get_or_create(
+        pk=ORDER_LIST_VERSION_ID,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answerking_app', '0008_product_price_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderListVersion',
+            fields=[
+                ('id', models.BigAutoField(
+                    auto_created=True, primary_key=True,
+                    serialize=False, verbose_name='ID')),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(create_version, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+from rest_framework import serializers
+
+from answerking_app.models.models import Order
+
+# Each field is a query parameter, its source the ORM lookup it filters on.
+
+
+class ProductFilterSerializer(serializers.Serializer):
+    retired = serializers.BooleanField(
+        required=False, help_text="Only retired or only active products."
+    )
+    category = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        help_text="Only products in the category with this id.",
+    )
+    minPrice = serializers.DecimalField(
+        max_digits=18,
+        decimal_places=2,
+        min_value=0,
+        required=False,
+        source="price__gte",
+        help_text="Lowest price, inclusive.",
+    )
+    maxPrice = serializers.DecimalField(
+        max_digits=18,
+        decimal_places=2,
+        min_value=0,
+        required=False,
+        source="price__lte",
+        help_text="Highest price, inclusive.",
+    )
+
+
+class OrderFilterSerializer(serializers.Serializer):
+    orderStatus = serializers.ChoiceField(
+        choices=Order.Status.choices,
+        required=False,
+        source="order_status",
+        help_text="Only orders with this status.",
+    )
+    createdAfter = serializers.DateTimeField(
+        required=False,
+        source="created_on__gte",
+        help_text="Earliest creation time, inclusive.",
+    )
+    createdBefore = serializers.DateTimeField(
+        required=False,
+        source="created_on__lt",
+        help_text="Latest creation time, exclusive.",
+    )
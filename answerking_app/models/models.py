@@ -1,16 +1,101 @@
 from decimal import Decimal
+from typing import Iterable
 
 from django.db import models
 
 
-class Product(models.Model):
+class DirtyFieldsModel(models.Model):
+    """Save only the fields that changed since the row was loaded.
+
+    A save without update_fields writes the changed fields and any auto_now
+    ones, and is skipped, signals included, when nothing changed. Fields
+    deferred when loaded are written once assigned. Explicit update_fields
+    are written as given.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_loaded_values()
+        return instance
+
+    def remember_loaded_values(self, fields: Iterable[str] | None = None):
+        """Snapshot the loaded values, or only those of `fields` if given."""
+        names: set[str] | None = None if fields is None else set(fields)
+        loaded: dict = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if not field.primary_key and field.attname in self.__dict__
+            if names is None or {field.name, field.attname} & names
+        }
+        if fields is None:
+            self._loaded_values: dict = loaded
+        else:
+            self._loaded_values.update(loaded)
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using, fields)
+        if fields is None:
+            self.remember_loaded_values()
+        elif hasattr(self, "_loaded_values"):
+            # Also how a deferred field is loaded when first read.
+            self.remember_loaded_values(fields)
+
+    def is_dirty(self, field: models.Field) -> bool:
+        if field.primary_key or getattr(field, "auto_now", False):
+            return False
+        if field.attname not in self.__dict__:
+            # Deferred, and neither read nor assigned.
+            return False
+        if field.attname not in self._loaded_values:
+            # Deferred when loaded, and assigned since.
+            return True
+        loaded = self._loaded_values[field.attname]
+        return getattr(self, field.attname) != loaded
+
+    def get_dirty_fields(self) -> list[str]:
+        return [
+            field.name
+            for field in self._meta.concrete_fields
+            if self.is_dirty(field)
+        ]
+
+    def save(self, *args, **kwargs):
+        tracked: bool = hasattr(self, "_loaded_values")
+        explicit: bool = kwargs.get("update_fields") is not None
+        explicit |= bool(kwargs.get("force_insert"))
+        if tracked and not explicit and not self._state.adding:
+            dirty_fields: list[str] = self.get_dirty_fields()
+            if not dirty_fields:
+                return
+            kwargs["update_fields"] = dirty_fields + [
+                field.name
+                for field in self._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+            ]
+        super().save(*args, **kwargs)
+        self.remember_loaded_values()
+
+
+class Product(DirtyFieldsModel):
     name = models.CharField(max_length=50, unique=True)
     description = models.CharField(max_length=200, blank=True, null=True)
     price = models.DecimalField(max_digits=18, decimal_places=2, default=0.00)
     retired = models.BooleanField(default=False, null=False)
+    last_updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["retired"], name="product_retired_idx"),
+            # Price range filters and ?sort=price on the product list.
+            models.Index(fields=["price"], name="product_price_idx"),
+        ]
 
 
-class Category(models.Model):
+class Category(DirtyFieldsModel):
     name = models.CharField(max_length=50, unique=True)
     description = models.CharField(max_length=200, blank=True, null=True)
     created_on = models.DateTimeField(auto_now_add=True)
@@ -18,8 +103,13 @@ class Category(models.Model):
     products = models.ManyToManyField(Product)
     retired = models.BooleanField(default=False, null=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["retired"], name="category_retired_idx")
+        ]
+
 
-class Order(models.Model):
+class Order(DirtyFieldsModel):
     class Status(models.TextChoices):
         CREATED = "Created", "Created"
         PAID = "Paid", "Paid"
@@ -34,16 +124,26 @@ class Order(models.Model):
     created_on = models.DateTimeField(auto_now_add=True)
     last_updated = models.DateTimeField(auto_now=True)
 
-    def calculate_total(self):
+    def calculate_total(self, line_items: list["LineItem"] | None = None):
         total = Decimal(0.00)
-        line_items = LineItem.objects.filter(order=self.pk).values()
+        if line_items is None:
+            line_items = list(LineItem.objects.filter(order=self.pk))
 
-        if line_items:
-            for ol in line_items:
-                total += ol["sub_total"]
+        for ol in line_items:
+            total += ol.sub_total
 
         self.order_total = total
-        self.save()
+        self.save(update_fields=["order_total", "last_updated"])
+
+    class Meta:
+        indexes = [
+            # Status filters, alone or with a creation date range.
+            models.Index(
+                fields=["order_status", "created_on"],
+                name="order_status_created_idx",
+            ),
+            models.Index(fields=["created_on"], name="order_created_on_idx"),
+        ]
 
 
 class LineItem(models.Model):
@@ -54,9 +154,60 @@ class LineItem(models.Model):
         max_digits=18, decimal_places=2, default=0.00
     )
 
-    def calculate_sub_total(self):
-        self.sub_total = self.quantity * self.product.price
-        self.save()
+    class Meta:
+        unique_together = [["order", "product"]]
+        indexes = [
+            # Orders containing a product, e.g. the active order check
+            # before retiring it.
+            models.Index(
+                fields=["product", "order"], name="lineitem_product_order_idx"
+            )
+        ]
+
+
+class ArchivedOrder(models.Model):
+    """Paid or cancelled order moved out of Order, see utils.order_archive."""
+
+    id = models.BigIntegerField(primary_key=True)
+    order_status = models.CharField(
+        max_length=10, choices=Order.Status.choices
+    )
+    order_total = models.DecimalField(max_digits=18, decimal_places=2)
+    created_on = models.DateTimeField()
+    last_updated = models.DateTimeField()
+    archived_on = models.DateTimeField(auto_now_add=True)
+
+
+class ArchivedLineItem(models.Model):
+    order = models.ForeignKey(ArchivedOrder, on_delete=models.CASCADE)
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    quantity = models.IntegerField()
+    sub_total = models.DecimalField(max_digits=18, decimal_places=2)
 
     class Meta:
         unique_together = [["order", "product"]]
+
+
+class OrderDocument(models.Model):
+    """Rendered JSON of an order, see utils.order_documents."""
+
+    order = models.OneToOneField(
+        Order,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="document",
+    )
+    document = models.BinaryField()
+    last_updated = models.DateTimeField(auto_now=True)
+
+
+class OrderListVersion(models.Model):
+    """Single row touched by every order write, see utils.order_documents."""
+
+    last_updated = models.DateTimeField(auto_now=True)
+
+
+class CatalogGeneration(models.Model):
+    """Single row bumped on every catalog write, see utils.catalog_snapshot."""
+
+    generation = models.BigIntegerField(default=0)
@@ -0,0 +1,297 @@
+import datetime
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+from answerking_app.models.models import (
+    ArchivedLineItem,
+    Category,
+    LineItem,
+)
+from answerking_app.utils.field_selection import FieldSelection
+
+format_datetime = serializers.DateTimeField().to_representation
+format_decimal = serializers.DecimalField(
+    max_digits=18, decimal_places=2
+).to_representation
+
+
+class ReadSerializer(ABC):
+    """Read-only counterpart of a ModelSerializer built from .values() rows.
+
+    `data` is identical to `serializer_class(queryset, many=True).data`
+    without instantiating fields per object, so GET endpoints can skip the
+    DRF field machinery. The returned dicts are only meant to be rendered.
+    Relations left out by the field selection are not queried.
+    """
+
+    def __init__(
+        self, queryset: QuerySet, selection: FieldSelection | None = None
+    ):
+        self.queryset = queryset.prefetch_related(None)
+        self.selection = selection or FieldSelection({})
+
+    @property
+    def data(self) -> list[dict]:
+        data: list[dict] = self.representations()
+        if self.selection.is_full:
+            return data
+        return [self.selection.apply(item) for item in data]
+
+    async def adata(self) -> list[dict]:
+        data: list[dict] = await self.arepresentations()
+        if self.selection.is_full:
+            return data
+        return [self.selection.apply(item) for item in data]
+
+    @abstractmethod
+    def representations(self) -> list[dict]:
+        ...
+
+    async def arepresentations(self) -> list[dict]:
+        """representations() for async views, in a thread unless overridden."""
+        return await sync_to_async(self.representations)()
+
+
+def category_details(product_ids: list[int]) -> dict[int, list[dict]]:
+    categories: dict[int, list[dict]] = defaultdict(list)
+    rows = (
+        Category.products.through.objects.filter(product_id__in=product_ids)
+        .order_by("category_id")
+        .values_list(
+            "product_id",
+            "category_id",
+            "category__name",
+            "category__description",
+        )
+    )
+    for product_id, category_id, name, description in rows:
+        categories[product_id].append(
+            category_detail_representation(category_id, name, description)
+        )
+    return categories
+
+
+def category_detail_representation(
+    category_id: int, name: str, description: str | None
+) -> dict:
+    return {"id": category_id, "name": name, "description": description}
+
+
+def product_representation(
+    product_id: int,
+    name: str,
+    description: str | None,
+    price: Decimal,
+    retired: bool,
+    categories: list[dict],
+) -> dict:
+    return {
+        "id": product_id,
+        "name": name,
+        "description": description,
+        "price": format_decimal(price),
+        "categories": categories,
+        "retired": retired,
+    }
+
+
+def category_representation(
+    category_id: int,
+    name: str,
+    description: str | None,
+    created_on: datetime.datetime,
+    last_updated: datetime.datetime,
+    retired: bool,
+    products: list[int],
+) -> dict:
+    return {
+        "id": category_id,
+        "name": name,
+        "description": description,
+        "createdOn": format_datetime(created_on),
+        "lastUpdated": format_datetime(last_updated),
+        "products": products,
+        "retired": retired,
+    }
+
+
+class ProductReadSerializer(ReadSerializer):
+    def representations(self) -> list[dict]:
+        rows = list(
+            self.queryset.values_list(
+                "id", "name", "description", "price", "retired"
+            )
+        )
+        categories = (
+            category_details([row[0] for row in rows])
+            if self.selection.renders("categories")
+            else {}
+        )
+        return [
+            product_representation(
+                product_id,
+                name,
+                description,
+                price,
+                retired,
+                categories.get(product_id, []),
+            )
+            for product_id, name, description, price, retired in rows
+        ]
+
+
+class CategoryReadSerializer(ReadSerializer):
+    """Categories with the ids of their products.
+
+    The rows and links are plain querysets, so arepresentations() reads
+    them with the async ORM instead of a thread.
+    """
+
+    def representations(self) -> list[dict]:
+        rows: list[tuple] = list(self.rows())
+        links: list[tuple[int, int]] = (
+            list(self.links(rows))
+            if self.selection.renders("products")
+            else []
+        )
+        return self.build(rows, links)
+
+    async def arepresentations(self) -> list[dict]:
+        rows: list[tuple] = [row async for row in self.rows()]
+        links: list[tuple[int, int]] = (
+            [link async for link in self.links(rows)]
+            if self.selection.renders("products")
+            else []
+        )
+        return self.build(rows, links)
+
+    def rows(self) -> QuerySet:
+        return self.queryset.values_list(
+            "id",
+            "name",
+            "description",
+            "created_on",
+            "last_updated",
+            "retired",
+        )
+
+    @staticmethod
+    def links(rows: list[tuple]) -> QuerySet:
+        return (
+            Category.products.through.objects.filter(
+                category_id__in=[row[0] for row in rows]
+            )
+            .order_by("product_id")
+            .values_list("category_id", "product_id")
+        )
+
+    @staticmethod
+    def build(rows: list[tuple], links: list[tuple[int, int]]) -> list[dict]:
+        products: dict[int, list[int]] = defaultdict(list)
+        for category_id, product_id in links:
+            products[category_id].append(product_id)
+        return [
+            category_representation(*row, products.get(row[0], []))
+            for row in rows
+        ]
+
+
+class OrderReadSerializer(ReadSerializer):
+    line_item_model: type[LineItem] | type[ArchivedLineItem] = LineItem
+
+    def representations(self) -> list[dict]:
+        rows = list(
+            self.queryset.values_list(
+                "id",
+                "created_on",
+                "last_updated",
+                "order_status",
+                "order_total",
+            )
+        )
+        line_items: dict[int, list[dict]] = defaultdict(list)
+        if self.selection.renders("lineItems"):
+            self.add_line_items(line_items, [row[0] for row in rows])
+        return [
+            {
+                "id": order_id,
+                "createdOn": format_datetime(created_on),
+                "lastUpdated": format_datetime(last_updated),
+                "orderStatus": order_status,
+                "orderTotal": format_decimal(order_total),
+                "lineItems": line_items.get(order_id, []),
+            }
+            for (
+                order_id,
+                created_on,
+                last_updated,
+                order_status,
+                order_total,
+            ) in rows
+        ]
+
+    def add_line_items(
+        self, line_items: dict[int, list[dict]], order_ids: list[int]
+    ):
+        lines = self.line_item_model.objects.filter(
+            order_id__in=order_ids
+        ).order_by("id")
+        if not self.selection.embeds("lineItems.product"):
+            for order_id, product_id, quantity, sub_total in lines.values_list(
+                "order_id", "product_id", "quantity", "sub_total"
+            ):
+                line_items[order_id].append(
+                    {
+                        "product": {"id": product_id},
+                        "quantity": quantity,
+                        "subTotal": format_decimal(sub_total),
+                    }
+                )
+            return
+        rows = list(
+            lines.values_list(
+                "order_id",
+                "product_id",
+                "quantity",
+                "sub_total",
+                "product__name",
+                "product__description",
+                "product__price",
+            )
+        )
+        categories = (
+            category_details(list({row[1] for row in rows}))
+            if self.selection.renders("lineItems.product.categories")
+            else {}
+        )
+        for (
+            order_id,
+            product_id,
+            quantity,
+            sub_total,
+            name,
+            description,
+            price,
+        ) in rows:
+            line_items[order_id].append(
+                {
+                    "product": {
+                        "id": product_id,
+                        "categories": categories.get(product_id, []),
+                        "price": format_decimal(price),
+                        "name": name,
+                        "description": description,
+                    },
+                    "quantity": quantity,
+                    "subTotal": format_decimal(sub_total),
+                }
+            )
+
+
+class ArchivedOrderReadSerializer(OrderReadSerializer):
+    line_item_model = ArchivedLineItem
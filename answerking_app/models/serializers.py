@@ -5,6 +5,8 @@ from django.core.validators import (
     MinValueValidator,
     RegexValidator,
 )
+from django.db import transaction
+from django.db.models import Prefetch, QuerySet
 from rest_framework import serializers, status
 
 from answerking_app.models.models import (
@@ -13,15 +15,32 @@ from answerking_app.models.models import (
     Order,
     LineItem,
 )
+from answerking_app.utils.field_selection import (
+    FieldSelection,
+    SelectedFieldsSerializerMixin,
+)
 from answerking_app.utils.serializer_data_functions import (
     products_check,
     compress_white_spaces,
 )
 from answerking_app.utils.mixins.ApiExceptions import ProblemDetails
+from answerking_app.utils.order_documents import write_order_documents
 
 MAXNUMBERSIZE = 2147483647
 
 
+class ProductIdField(serializers.PrimaryKeyRelatedField):
+    """Leaves product lookups to products_check, which batches them."""
+
+    def to_internal_value(self, data) -> dict:
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return {"id": int(data)}
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
 class CategoryDetailSerializer(serializers.ModelSerializer):
     id = serializers.IntegerField(required=False)
     name = serializers.CharField(
@@ -42,11 +61,13 @@ class CategoryDetailSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data: dict) -> Category:
         products: list[Product] = products_check(validated_data)
-        category: Category = Category.objects.create(
-            name=validated_data["name"],
-            description=validated_data["description"],
-        )
-        category.products.add(*products)
+        # One transaction, so the catalog is rebuilt once for the write.
+        with transaction.atomic():
+            category: Category = Category.objects.create(
+                name=validated_data["name"],
+                description=validated_data["description"],
+            )
+            category.products.add(*products)
         return category
 
     def update(self, category: Category, validated_data: dict) -> Category:
@@ -58,8 +79,9 @@ class CategoryDetailSerializer(serializers.ModelSerializer):
         products: list[Product] = products_check(validated_data)
         category.name = validated_data["name"]
         category.description = validated_data["description"]
-        category.save()
-        category.products.set(objs=products)
+        with transaction.atomic():
+            category.save()
+            category.products.set(objs=products)
         return category
 
     class Meta:
@@ -70,7 +92,9 @@ class CategoryDetailSerializer(serializers.ModelSerializer):
         return compress_white_spaces(value)
 
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(
+    SelectedFieldsSerializerMixin, serializers.ModelSerializer
+):
     id = serializers.IntegerField(
         required=False, validators=[MinValueValidator(0)]
     )
@@ -117,14 +141,14 @@ class ProductSerializer(serializers.ModelSerializer):
         return compress_white_spaces(value)
 
 
-class CategorySerializer(CategoryDetailSerializer):
+class CategorySerializer(
+    SelectedFieldsSerializerMixin, CategoryDetailSerializer
+):
     createdOn = serializers.DateTimeField(source="created_on", read_only=True)
     lastUpdated = serializers.DateTimeField(
         source="last_updated", read_only=True
     )
-    products = serializers.PrimaryKeyRelatedField(
-        many=True, queryset=Product.objects.all()
-    )
+    products = ProductIdField(many=True, queryset=Product.objects.all())
     retired = serializers.BooleanField(required=False)
 
     class Meta:
@@ -152,7 +176,7 @@ class LineItemProductSerializer(serializers.ModelSerializer):
     class Meta:
         model = Product
         read_only_fields = ["name", "description", "price", "categories"]
-        exclude = ["retired"]
+        exclude = ["retired", "last_updated"]
 
 
 class LineItemSerializer(serializers.ModelSerializer):
@@ -173,7 +197,9 @@ class LineItemSerializer(serializers.ModelSerializer):
         depth = 2
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(
+    SelectedFieldsSerializerMixin, serializers.ModelSerializer
+):
     createdOn = serializers.DateTimeField(source="created_on", read_only=True)
     lastUpdated = serializers.DateTimeField(
         source="last_updated", read_only=True
@@ -189,45 +215,129 @@ class OrderSerializer(serializers.ModelSerializer):
         source="lineitem_set", many=True, required=False
     )
 
-    def create(self, validated_data: dict) -> Order:
-        order: Order = Order.objects.create()
-        if "lineitem_set" in validated_data:
-            line_items_data = validated_data["lineitem_set"]
-            self.create_order_line_items(
-                order=order, line_items_data=line_items_data
+    @staticmethod
+    def setup_eager_loading(
+        queryset: QuerySet[Order], selection: FieldSelection | None = None
+    ) -> QuerySet[Order]:
+        selection = selection or FieldSelection({})
+        if not selection.renders("lineItems"):
+            return queryset
+        queryset = queryset.prefetch_related(
+            Prefetch(
+                "lineitem_set",
+                queryset=LineItem.objects.select_related("product"),
+            )
+        )
+        if selection.renders("lineItems.product.categories"):
+            queryset = queryset.prefetch_related(
+                "lineitem_set__product__category_set"
             )
-        order.calculate_total()
+        return queryset
+
+    def create(self, validated_data: dict) -> Order:
+        with transaction.atomic():
+            order: Order = Order.objects.create()
+            line_items: list[LineItem] = []
+            if "lineitem_set" in validated_data:
+                line_items_data = validated_data["lineitem_set"]
+                line_items = self.create_order_line_items(
+                    order=order, line_items_data=line_items_data
+                )
+            order.calculate_total(line_items)
+            write_order_documents([order.id])
         return order
 
     def update(self, order_to_update: Order, validated_data: dict) -> Order:
-        if "lineitem_set" in validated_data:
-            line_items_data: list[OrderedDict] = validated_data["lineitem_set"]
-            LineItem.objects.filter(order_id=order_to_update.id).delete()
-            self.create_order_line_items(
-                order=order_to_update, line_items_data=line_items_data
+        with transaction.atomic():
+            line_items, changed = self.update_order_line_items(
+                order=order_to_update,
+                line_items_data=validated_data.get("lineitem_set", []),
             )
-        else:
-            LineItem.objects.filter(order_id=order_to_update.id).delete()
-        order_to_update.calculate_total()
+            if changed:
+                order_to_update.calculate_total(line_items)
+                write_order_documents([order_to_update.id])
 
         return order_to_update
 
+    def update_order_line_items(
+        self, order: Order, line_items_data: list[OrderedDict]
+    ) -> tuple[list[LineItem], bool]:
+        """Write only the line items that differ from the request.
+
+        Lines are matched on product, so unchanged lines keep their rows
+        and the result is at most one DELETE, UPDATE and INSERT. Returns
+        the order's lines and whether any of them were written.
+        """
+        existing: dict[int, LineItem] = {
+            line_item.product_id: line_item
+            for line_item in LineItem.objects.select_for_update().filter(
+                order_id=order.id
+            )
+        }
+        line_items: list[LineItem] = []
+        created: list[LineItem] = []
+        changed: list[LineItem] = []
+        requested: list[LineItem] = (
+            self.build_order_line_items(order, line_items_data)
+            if line_items_data
+            else []
+        )
+        for line_item in requested:
+            current: LineItem | None = existing.pop(line_item.product_id, None)
+            if current is None:
+                created.append(line_item)
+                continue
+            if (current.quantity, current.sub_total) != (
+                line_item.quantity,
+                line_item.sub_total,
+            ):
+                current.quantity = line_item.quantity
+                current.sub_total = line_item.sub_total
+                changed.append(current)
+            line_items.append(current)
+        if existing:
+            LineItem.objects.filter(
+                pk__in=[line_item.pk for line_item in existing.values()]
+            ).delete()
+        if changed:
+            LineItem.objects.bulk_update(changed, ["quantity", "sub_total"])
+        if created:
+            line_items += LineItem.objects.bulk_create(created)
+        return line_items, bool(existing or changed or created)
+
     def create_order_line_items(
         self,
         order: Order,
         line_items_data: list[OrderedDict],
-    ):
+    ) -> list[LineItem]:
+        return LineItem.objects.bulk_create(
+            self.build_order_line_items(order, line_items_data)
+        )
+
+    def build_order_line_items(
+        self,
+        order: Order,
+        line_items_data: list[OrderedDict],
+    ) -> list[LineItem]:
         products_id_list = []
         for product in line_items_data:
             products_id_list.append(product["product"])
         products = products_check({"products": products_id_list})
+        quantities: dict[Product, int] = {}
         for order_item, product in zip(line_items_data, products):
-            if order_item["quantity"] < 1:
-                continue
-            new_line_item = LineItem.objects.create(
-                order=order, product=product, quantity=order_item["quantity"]
+            quantities[product] = (
+                quantities.get(product, 0) + order_item["quantity"]
+            )
+        return [
+            LineItem(
+                order=order,
+                product=product,
+                quantity=quantity,
+                sub_total=quantity * product.price,
             )
-            new_line_item.calculate_sub_total()
+            for product, quantity in quantities.items()
+            if quantity >= 1
+        ]
 
     class Meta:
         model = Order
@@ -0,0 +1,76 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from answerking_app.models.models import Category, Product
+from answerking_app.utils.catalog_snapshot import (
+    catalog_changed,
+    create_catalog_generation,
+)
+from answerking_app.utils.order_documents import create_order_list_version
+from answerking_app.utils.response_cache import catalog_keys
+
+
+def product_category_ids(product: Product) -> set[int]:
+    return set(product.category_set.values_list("id", flat=True))
+
+
+@receiver(post_save, sender=Product)
+def product_saved(sender, instance: Product, created: bool, **kwargs):
+    # Category lists only embed product ids, so they are unaffected.
+    category_ids: set[int] = (
+        set() if created else product_category_ids(instance)
+    )
+    catalog_changed(catalog_keys(products=True, category_ids=category_ids))
+
+
+@receiver(pre_delete, sender=Product)
+def product_deleted(sender, instance: Product, **kwargs):
+    catalog_changed(
+        catalog_keys(
+            products=True,
+            categories=True,
+            category_ids=product_category_ids(instance),
+        )
+    )
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def category_changed(sender, instance: Category, **kwargs):
+    # Products embed their categories, so every product list is stale.
+    catalog_changed(
+        catalog_keys(
+            products=True, categories=True, category_ids={instance.pk}
+        )
+    )
+
+
+@receiver(m2m_changed, sender=Category.products.through)
+def category_products_changed(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        category_ids: set[int] = {instance.pk}
+    elif action == "pre_clear":
+        category_ids = product_category_ids(instance)
+    else:
+        category_ids = set(pk_set)
+    catalog_changed(
+        catalog_keys(products=True, categories=True, category_ids=category_ids)
+    )
+
+
+@receiver(post_migrate)
+def version_rows_created(sender, app_config, using: str, **kwargs):
+    # Runs after migrate and flush.
+    if app_config.name == "answerking_app":
+        create_catalog_generation(using)
+        create_order_list_version(using)
@@ -1,26 +1,69 @@
+from django.core.cache import cache
 from django.test import TransactionTestCase
-from answerking_app.models.models import Product
+from answerking_app.models.models import Category, Order, Product
+from answerking_app.models.serializers import OrderSerializer
+from answerking_app.utils.order_documents import write_order_documents
 
 from snapshottest import TestCase
 import json
 
 
 class TestBase(TransactionTestCase, TestCase):
+    def setUp(self):
+        cache.clear()
+
     def seedFixture(self, fixture_type, fixture_name):
-        if fixture_type == "products":
-            data = self.getFixture(fixture_type, fixture_name)
-            if isinstance(data, list):
-                for item in data:
-                    Product.objects.create(**item)
-            elif isinstance(data, dict):
-                Product.objects.create(**data)
-            else:
-                raise ValueError(f"{data} is not valid json")
-            return data
-        else:
+        seeders = {
+            "products": self.seedProduct,
+            "categories": self.seedCategory,
+            "orders": self.seedOrder,
+        }
+        if fixture_type not in seeders:
             raise ValueError(
                 f"{fixture_type} is not a valid data seeding type"
             )
+        data = self.getFixture(fixture_type, fixture_name)
+        if isinstance(data, list):
+            for item in data:
+                seeders[fixture_type](item)
+        elif isinstance(data, dict):
+            seeders[fixture_type](data)
+        else:
+            raise ValueError(f"{data} is not valid json")
+        return data
+
+    @staticmethod
+    def seedProduct(item):
+        Product.objects.create(**item)
+
+    @staticmethod
+    def seedCategory(item):
+        # Products are listed by id, as in request bodies.
+        fields = {
+            key: value for key, value in item.items() if key != "products"
+        }
+        Category.objects.create(**fields).products.set(item["products"])
+
+    @staticmethod
+    def seedOrder(item):
+        # Line items name products by id, and are written and totalled
+        # as by the order endpoints.
+        order = Order.objects.create(
+            id=item["id"],
+            order_status=item.get("orderStatus", Order.Status.CREATED),
+        )
+        line_items = OrderSerializer().create_order_line_items(
+            order,
+            [
+                {
+                    "product": {"id": line["product"]},
+                    "quantity": line["quantity"],
+                }
+                for line in item["lineItems"]
+            ],
+        )
+        order.calculate_total(line_items)
+        write_order_documents([order.id])
 
     def getFixture(self, fixture_type, fixture_name):
         fixture_path = "answerking_app/tests/fixtures"
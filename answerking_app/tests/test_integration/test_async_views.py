@@ -0,0 +1,126 @@
+import json
+
+from asgiref.sync import async_to_sync
+from assertpy import assert_that
+from django.test import AsyncRequestFactory, Client
+
+from answerking_app.models.models import OrderDocument
+from answerking_app.tests.BaseTestClass import TestBase
+from answerking_app.utils.catalog_snapshot import bump_catalog_generation
+from answerking_app.views import (
+    async_views,
+    category_views,
+    order_views,
+    product_views,
+)
+
+client = Client()
+factory = AsyncRequestFactory()
+
+product_detail = async_views.ProductDetailAsyncView.as_view(
+    sync_view=product_views.ProductDetailView.as_view()
+)
+category_detail = async_views.CategoryDetailAsyncView.as_view(
+    sync_view=category_views.CategoryDetailView.as_view()
+)
+order_list = async_views.OrderListAsyncView.as_view(
+    sync_view=order_views.OrderListView.as_view()
+)
+order_detail = async_views.OrderDetailAsyncView.as_view(
+    sync_view=order_views.OrderDetailView.as_view()
+)
+
+
+def get(view, request, **kwargs):
+    response = async_to_sync(view)(request, **kwargs)
+    if hasattr(response, "render"):
+        # Done by the handler for responses of the DRF views.
+        response.render()
+    return response
+
+
+def assert_same_response(response, path):
+    expected = client.get(path)
+    assert_that(response.status_code).is_equal_to(expected.status_code)
+    assert_that(json.loads(response.content)).is_equal_to(expected.json())
+    assert_that(response["ETag"]).is_equal_to(expected["ETag"])
+
+
+class AsyncReadViewTests(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.seedFixture("products", "basic-3.json")
+        self.seedFixture("categories", "basic-1.json")
+        self.seedFixture("orders", "basic-3.json")
+        bump_catalog_generation()
+
+    def test_product_detail_is_served_from_snapshot(self):
+        # Builds the snapshot, after which a request is one lookup.
+        client.get("/api/products/1")
+        with self.assertNumQueries(1):
+            response = get(
+                product_detail, factory.get("/api/products/1"), pk="1"
+            )
+        assert_same_response(response, "/api/products/1")
+        response = get(
+            product_detail,
+            factory.get(
+                "/api/products/1", **{"If-None-Match": response["ETag"]}
+            ),
+            pk="1",
+        )
+        assert_that(response.status_code).is_equal_to(304)
+
+    def test_category_detail_matches_sync_view(self):
+        response = get(
+            category_detail, factory.get("/api/categories/1"), pk="1"
+        )
+        assert_same_response(response, "/api/categories/1")
+        assert_that(json.loads(response.content)["products"]).is_equal_to(
+            [1, 2]
+        )
+        response = get(
+            category_detail,
+            factory.get(
+                "/api/categories/1", **{"If-None-Match": response["ETag"]}
+            ),
+            pk="1",
+        )
+        assert_that(response.status_code).is_equal_to(304)
+
+    def test_orders_are_served_from_documents(self):
+        with self.assertNumQueries(2):
+            response = get(order_list, factory.get("/api/orders"))
+        assert_same_response(response, "/api/orders")
+        with self.assertNumQueries(1):
+            response = get(order_detail, factory.get("/api/orders/1"), pk="1")
+        assert_same_response(response, "/api/orders/1")
+
+    def test_orders_without_document_are_listed(self):
+        OrderDocument.objects.filter(pk=1).delete()
+        response = get(order_list, factory.get("/api/orders"))
+        assert_same_response(response, "/api/orders")
+        assert_that(json.loads(response.content)).is_length(3)
+
+    def test_other_requests_go_to_drf_view(self):
+        response = get(order_detail, factory.get("/api/orders/a"), pk="a")
+        assert_that(response.status_code).is_equal_to(400)
+        response = get(order_detail, factory.get("/api/orders/0"), pk="0")
+        assert_that(response.status_code).is_equal_to(400)
+        response = get(
+            category_detail, factory.get("/api/categories/999"), pk="999"
+        )
+        assert_that(response.status_code).is_equal_to(404)
+        response = get(order_list, factory.get("/api/orders?fields=id"))
+        assert_that(json.loads(response.content)).is_equal_to(
+            [{"id": 1}, {"id": 2}, {"id": 3}]
+        )
+        response = get(
+            order_list,
+            factory.post(
+                "/api/orders",
+                {"lineItems": []},
+                content_type="application/json",
+            ),
+        )
+        assert_that(response.status_code).is_equal_to(201)
@@ -0,0 +1,56 @@
+from assertpy import assert_that
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from answerking_app.tests.BaseTestClass import TestBase
+from answerking_app.utils.catalog_snapshot import current_generation
+
+client = Client()
+
+
+class UnchangedPutTests(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.seedFixture("products", "basic-3.json")
+        self.seedFixture("categories", "basic-1.json")
+        self.seedFixture("orders", "basic-1.json")
+
+    def put_writes(self, path, data):
+        generation = current_generation()
+        with CaptureQueriesContext(connection) as context:
+            response = client.put(path, data, content_type="application/json")
+        assert_that(response.status_code).is_equal_to(200)
+        writes = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+        ]
+        if not writes:
+            assert_that(current_generation()).is_equal_to(generation)
+        return writes
+
+    def test_unchanged_product_put_writes_nothing(self):
+        data = {"name": "Burger", "description": "desc", "price": 1.2}
+        assert_that(self.put_writes("/api/products/1", data)).is_empty()
+
+    def test_changed_product_put_writes_changed_fields(self):
+        writes = self.put_writes(
+            "/api/products/1",
+            {"name": "Burger", "description": "Juicy", "price": 1.2},
+        )
+        product_update = next(
+            sql for sql in writes if "answerking_app_product" in sql
+        )
+        assert_that(product_update).contains(
+            '"description" = ', '"last_updated" = '
+        )
+        assert_that(product_update).does_not_contain('"name" = ', '"price" = ')
+
+    def test_unchanged_category_put_writes_nothing(self):
+        data = {"name": "Burgers", "description": "desc", "products": [1, 2]}
+        assert_that(self.put_writes("/api/categories/1", data)).is_empty()
+
+    def test_unchanged_order_put_writes_nothing(self):
+        data = {"lineItems": [{"product": {"id": 1}, "quantity": 1}]}
+        assert_that(self.put_writes("/api/orders/1", data)).is_empty()
@@ -0,0 +1,99 @@
+import json
+
+from assertpy import assert_that
+from django.test import Client
+
+from answerking_app.models.models import OrderDocument
+from answerking_app.tests.BaseTestClass import TestBase
+
+client = Client()
+
+KITCHEN_DISPLAY_PATH = (
+    "/api/orders/1?fields=id,lineItems.quantity,"
+    "lineItems.product.id,lineItems.product.name"
+)
+
+
+def get(path):
+    response = client.get(path)
+    assert_that(response.status_code).is_equal_to(200)
+    return json.loads(response.content)
+
+
+class FieldSelectionTests(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.seedFixture("products", "basic-3.json")
+        self.seedFixture("categories", "basic-1.json")
+        self.seedFixture("orders", "basic-3.json")
+
+    def test_product_fields(self):
+        assert_that(get("/api/products?fields=id,name")).is_equal_to(
+            [
+                {"id": 1, "name": "Burger"},
+                {"id": 2, "name": "Coke"},
+                {"id": 3, "name": "Chips"},
+            ]
+        )
+
+    def test_unselected_categories_are_not_queried(self):
+        with self.assertNumQueries(1):
+            client.get("/api/products?fields=id,name,price")
+        with self.assertNumQueries(2):
+            client.get("/api/products?fields=id,categories.name")
+
+    def test_product_categories_collapse_to_ids(self):
+        product = get("/api/products/1?expand=")
+        assert_that(product["categories"]).is_equal_to([1])
+
+    def test_category_fields(self):
+        assert_that(get("/api/categories?fields=id,name")).is_equal_to(
+            [{"id": 1, "name": "Burgers"}]
+        )
+
+    def test_kitchen_display_order(self):
+        expected = {
+            "id": 1,
+            "lineItems": [
+                {"product": {"id": 1, "name": "Burger"}, "quantity": 2},
+                {"product": {"id": 2, "name": "Coke"}, "quantity": 1},
+            ],
+        }
+        with self.assertNumQueries(1):
+            assert_that(get(KITCHEN_DISPLAY_PATH)).is_equal_to(expected)
+        OrderDocument.objects.all().delete()
+        # Document lookup, order and line items, without their categories.
+        with self.assertNumQueries(3):
+            assert_that(get(KITCHEN_DISPLAY_PATH)).is_equal_to(expected)
+
+    def test_order_list_products_collapse_to_ids(self):
+        orders = get("/api/orders?expand=&pageSize=1")["results"]
+        assert_that(
+            [line["product"] for line in orders[0]["lineItems"]]
+        ).is_equal_to([1, 2])
+
+    def test_streamed_orders_keep_selected_fields(self):
+        response = client.get("/api/orders?stream=true&fields=orderTotal")
+        orders = json.loads(b"".join(response.streaming_content))
+        assert_that(orders).is_equal_to(
+            [{"orderTotal": 3.9}, {"orderTotal": 1.5}, {"orderTotal": 0.0}]
+        )
+
+    def test_write_response_uses_selection(self):
+        response = client.post(
+            "/api/orders?fields=id,orderTotal",
+            {"lineItems": [{"product": {"id": 1}, "quantity": 1}]},
+            content_type="application/json",
+        )
+        assert_that(response.status_code).is_equal_to(201)
+        assert_that(response.json()).contains_only("id", "orderTotal")
+
+    def test_unknown_fields_return_bad_request(self):
+        for path in (
+            "/api/products?fields=id,colour",
+            "/api/products?fields=name.first",
+            "/api/orders?expand=lineItems",
+            "/api/orders/1?fields=lineItems.product.colour",
+        ):
+            with self.subTest(path=path):
+                assert_that(client.get(path).status_code).is_equal_to(400)
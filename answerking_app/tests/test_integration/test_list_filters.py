@@ -0,0 +1,109 @@
+import datetime
+import json
+
+from assertpy import assert_that
+from django.test import Client
+from django.utils import timezone
+
+from answerking_app.models.models import Order
+from answerking_app.tests.BaseTestClass import TestBase
+from answerking_app.utils.order_documents import rebuild_order_documents
+
+client = Client()
+
+
+def ids(path):
+    response = client.get(path)
+    assert_that(response.status_code).is_equal_to(200)
+    return [item["id"] for item in json.loads(response.content)]
+
+
+class ProductFilterTests(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.seedFixture("products", "filters-6.json")
+        self.seedFixture("categories", "basic-2.json")
+
+    def test_filter_by_retired(self):
+        assert_that(ids("/api/products?retired=true")).is_equal_to([4])
+        assert_that(ids("/api/products?retired=false")).does_not_contain(4)
+
+    def test_filter_by_category(self):
+        assert_that(ids("/api/products?category=2")).contains_only(2, 3, 6)
+
+    def test_filter_by_price_range(self):
+        assert_that(
+            ids("/api/products?minPrice=3&maxPrice=5.50")
+        ).contains_only(4, 5, 6)
+
+    def test_sort_by_price_descending(self):
+        assert_that(ids("/api/products?sort=-price")).is_equal_to(
+            [1, 6, 5, 4, 3, 2]
+        )
+
+    def test_sorted_pages_follow_sort(self):
+        page = client.get("/api/products?sort=price&pageSize=4").json()
+        sorted_ids = [product["id"] for product in page["results"]]
+        while page["next"]:
+            page = client.get(page["next"]).json()
+            sorted_ids += [product["id"] for product in page["results"]]
+        assert_that(sorted_ids).is_equal_to([2, 3, 4, 5, 6, 1])
+
+    def test_unknown_parameter_returns_bad_request(self):
+        with self.assertNumQueries(0):
+            response = client.get("/api/products?colour=red")
+        assert_that(response.status_code).is_equal_to(400)
+
+    def test_invalid_value_returns_bad_request(self):
+        for path in (
+            "/api/products?minPrice=cheap",
+            "/api/products?retired=maybe",
+            "/api/products?sort=description",
+            "/api/products?sort=price&stream=true",
+        ):
+            with self.subTest(path=path):
+                assert_that(client.get(path).status_code).is_equal_to(400)
+
+
+class OrderFilterTests(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.seedFixture("products", "basic-3.json")
+        self.seedFixture("orders", "closed-4.json")
+        Order.objects.filter(id=1).update(
+            created_on=timezone.now() - datetime.timedelta(days=10)
+        )
+        rebuild_order_documents()
+
+    def test_filter_by_status(self):
+        assert_that(ids("/api/orders?orderStatus=Paid")).is_equal_to([1, 4])
+
+    def test_filter_by_date_range(self):
+        cutoff = (timezone.now() - datetime.timedelta(days=1)).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
+        assert_that(ids(f"/api/orders?createdBefore={cutoff}")).is_equal_to(
+            [1]
+        )
+        assert_that(ids(f"/api/orders?createdAfter={cutoff}")).is_equal_to(
+            [2, 3, 4]
+        )
+
+    def test_sort_by_creation_descending(self):
+        assert_that(ids("/api/orders?sort=-createdOn")).is_equal_to(
+            [4, 3, 2, 1]
+        )
+        page = client.get("/api/orders?sort=-createdOn&pageSize=10").json()
+        assert_that([order["id"] for order in page["results"]]).is_equal_to(
+            [4, 3, 2, 1]
+        )
+
+    def test_filtered_stream(self):
+        response = client.get("/api/orders?orderStatus=Created&stream=true")
+        orders = json.loads(b"".join(response.streaming_content))
+        assert_that([order["id"] for order in orders]).is_equal_to([3])
+        assert_that(orders[0]["orderStatus"]).is_equal_to("Created")
+
+    def test_invalid_status_returns_bad_request(self):
+        response = client.get("/api/orders?orderStatus=Lost")
+        assert_that(response.status_code).is_equal_to(400)
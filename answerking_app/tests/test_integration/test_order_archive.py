@@ -0,0 +1,52 @@
+import datetime
+
+from assertpy import assert_that
+from django.test import Client
+from django.utils import timezone
+
+from answerking_app.models.models import Order
+from answerking_app.tests.BaseTestClass import TestBase
+from answerking_app.utils.order_archive import archive_orders
+from answerking_app.utils.order_documents import rebuild_order_documents
+
+client = Client()
+
+
+class ArchivedOrderTests(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.seedFixture("products", "basic-3.json")
+        self.seedFixture("orders", "closed-4.json")
+        Order.objects.update(
+            created_on=timezone.now() - datetime.timedelta(days=100)
+        )
+        rebuild_order_documents()
+        self.cutoff = timezone.now() - datetime.timedelta(days=90)
+
+    def test_get_archived_order_returns_same_representation(self):
+        live = client.get("/api/orders/1")
+        archive_orders(self.cutoff)
+        archived = client.get("/api/orders/1")
+        assert_that(archived.status_code).is_equal_to(200)
+        assert_that(archived.json()).is_equal_to(live.json())
+        assert_that(archived.has_header("ETag")).is_true()
+
+    def test_get_archived_order_matching_etag_returns_not_modified(self):
+        archive_orders(self.cutoff)
+        etag = client.get("/api/orders/1")["ETag"]
+        response = client.get("/api/orders/1", HTTP_IF_NONE_MATCH=etag)
+        assert_that(response.status_code).is_equal_to(304)
+
+    def test_get_missing_order_returns_not_found(self):
+        archive_orders(self.cutoff)
+        response = client.get("/api/orders/999999")
+        assert_that(response.status_code).is_equal_to(404)
+
+    def test_archive_changes_order_list_etag(self):
+        etag = client.get("/api/orders")["ETag"]
+        archive_orders(self.cutoff)
+        response = client.get("/api/orders", HTTP_IF_NONE_MATCH=etag)
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that([order["id"] for order in response.json()]).is_equal_to(
+            [3]
+        )
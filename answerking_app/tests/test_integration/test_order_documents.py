@@ -0,0 +1,128 @@
+import json
+from io import StringIO
+
+from assertpy import assert_that
+from django.core.management import call_command
+from django.test import Client
+from rest_framework.renderers import JSONRenderer
+
+from answerking_app.models.models import Order, OrderDocument, Product
+from answerking_app.models.read_serializers import OrderReadSerializer
+from answerking_app.tests.BaseTestClass import TestBase
+
+client = Client()
+
+
+def document(order_id):
+    return json.loads(bytes(OrderDocument.objects.get(pk=order_id).document))
+
+
+def live_orders():
+    return json.loads(
+        JSONRenderer().render(
+            OrderReadSerializer(Order.objects.order_by("id")).data
+        )
+    )
+
+
+class OrderDocumentWriteTests(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.seedFixture("products", "basic-3.json")
+
+    def test_create_writes_document(self):
+        created = client.post(
+            "/api/orders",
+            {"lineItems": [{"product": {"id": 1}, "quantity": 2}]},
+            content_type="application/json",
+        ).json()
+        assert_that(document(created["id"])).is_equal_to(created)
+        assert_that([document(created["id"])]).is_equal_to(live_orders())
+
+    def test_update_and_cancel_rewrite_document(self):
+        self.seedFixture("orders", "basic-3.json")
+        updated = client.put(
+            "/api/orders/1",
+            {"lineItems": [{"product": {"id": 3}, "quantity": 3}]},
+            content_type="application/json",
+        ).json()
+        assert_that(document(1)).is_equal_to(updated)
+        client.delete("/api/orders/1")
+        assert_that(document(1)["orderStatus"]).is_equal_to("Cancelled")
+
+
+class OrderDocumentReadTests(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.seedFixture("products", "basic-3.json")
+        self.seedFixture("orders", "basic-3.json")
+
+    def test_get_id_is_one_lookup(self):
+        with self.assertNumQueries(1):
+            response = client.get("/api/orders/1")
+        assert_that(response.json()).is_equal_to(document(1))
+        with self.assertNumQueries(1):
+            response = client.get(
+                "/api/orders/1", HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        assert_that(response.status_code).is_equal_to(304)
+
+    def test_get_keeps_products_as_ordered_until_rebuilt(self):
+        Product.objects.filter(pk=1).update(name="Renamed")
+        response = client.get("/api/orders/1")
+        assert_that(
+            response.json()["lineItems"][0]["product"]["name"]
+        ).is_equal_to("Burger")
+        out = StringIO()
+        call_command("rebuildOrderDocuments", stdout=out)
+        assert_that(out.getvalue()).contains("Rebuilt 3 order documents")
+        response = client.get("/api/orders/1")
+        assert_that(
+            response.json()["lineItems"][0]["product"]["name"]
+        ).is_equal_to("Renamed")
+
+    def test_get_order_without_document_reads_live_tables(self):
+        expected = document(1)
+        OrderDocument.objects.all().delete()
+        response = client.get("/api/orders/1")
+        assert_that(response.json()).is_equal_to(expected)
+
+    def test_get_all_serves_documents(self):
+        with self.assertNumQueries(2):
+            response = client.get("/api/orders")
+        assert_that(response.json()).is_equal_to(live_orders())
+
+    def test_get_all_etag_is_one_lookup_and_follows_writes(self):
+        etag = client.get("/api/orders")["ETag"]
+        with self.assertNumQueries(1):
+            response = client.get("/api/orders", HTTP_IF_NONE_MATCH=etag)
+        assert_that(response.status_code).is_equal_to(304)
+        client.delete("/api/orders/1")
+        response = client.get("/api/orders", HTTP_IF_NONE_MATCH=etag)
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_get_page_serves_documents(self):
+        expected = live_orders()
+        page = client.get("/api/orders?pageSize=2").json()
+        assert_that(page["results"]).is_equal_to(expected[:2])
+        assert_that(page["previous"]).is_none()
+        page = client.get(page["next"]).json()
+        assert_that(page["results"]).is_equal_to(expected[2:])
+        assert_that(page["next"]).is_none()
+
+    def test_stream_serves_documents(self):
+        response = client.get("/api/orders?stream=true")
+        assert_that(
+            json.loads(b"".join(response.streaming_content))
+        ).is_equal_to(live_orders())
+
+    def test_get_all_renders_orders_without_document(self):
+        expected = live_orders()
+        OrderDocument.objects.filter(pk=2).delete()
+        assert_that(client.get("/api/orders").json()).is_equal_to(expected)
+        page = client.get("/api/orders?pageSize=3").json()
+        assert_that(page["results"]).is_equal_to(expected)
+        response = client.get("/api/orders?stream=true")
+        assert_that(
+            json.loads(b"".join(response.streaming_content))
+        ).is_equal_to(expected)
@@ -1,11 +1,22 @@
+import json
 from typing import Any, Dict
+from unittest import mock
+
 from typing_extensions import reveal_type
 from django.core.handlers.wsgi import WSGIHandler, WSGIRequest
-from django.test import Client
+from django.test import Client, override_settings
 from assertpy import assert_that
 from ddt import ddt, data
 
+from answerking_app.models.models import Category, LineItem, Order, Product
 from answerking_app.tests.BaseTestClass import TestBase
+from answerking_app.utils.catalog_snapshot import get_catalog_snapshot
+from answerking_app.utils.response_cache import (
+    get_cached,
+    response_cache_key,
+    set_cached,
+)
+from answerking_app.views.product_views import ProductListView
 
 client = Client()
 
@@ -30,6 +41,63 @@ class GetTests(TestBase):
     #     assert_that(response.json()).is_equal_to(seededData)
     #     assert_that(response.status_code).is_equal_to(200)
 
+    def test_get_all_query_count_does_not_grow_with_products(self):
+        self.seedFixture("products", "basic-3.json")
+        category = Category.objects.create(name="Burgers", description="desc")
+        category.products.add(*Product.objects.all())
+        get_catalog_snapshot()
+        # Only the catalog generation check once the snapshot is built.
+        with self.assertNumQueries(1):
+            response = client.get("/api/products")
+        assert_that(response.json()).is_length(3)
+        assert_that(response.json()[0]["categories"]).is_length(1)
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_get_id_query_count_does_not_grow_with_categories(self):
+        seeded_data = self.seedFixture("products", "basic-1.json")
+        product = Product.objects.get(pk=seeded_data["id"])  # type: ignore[GeneralTypeIssue]
+        for name in ["Burgers", "Mains", "Specials"]:
+            Category.objects.create(name=name).products.add(product)
+        get_catalog_snapshot()
+        # Only the catalog generation check once the snapshot is built.
+        with self.assertNumQueries(1):
+            response = client.get(f"/api/products/{product.id}")
+        assert_that(response.json()["categories"]).is_length(3)
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_get_all_paginated_follows_next_cursor(self):
+        self.seedFixture("products", "basic-3.json")
+        response = client.get("/api/products?pageSize=2")
+        first_page = response.json()
+        next_response = client.get(first_page["next"])
+        second_page = next_response.json()
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(first_page["previous"]).is_none()
+        assert_that(
+            [product["name"] for product in first_page["results"]]
+        ).is_equal_to(["Burger", "Coke"])
+        assert_that(next_response.status_code).is_equal_to(200)
+        assert_that(second_page["next"]).is_none()
+        assert_that(
+            [product["name"] for product in second_page["results"]]
+        ).is_equal_to(["Chips"])
+
+    @override_settings(MAX_PAGE_SIZE=2)
+    def test_get_all_paginated_caps_page_size_from_settings(self):
+        self.seedFixture("products", "basic-3.json")
+        response = client.get("/api/products?pageSize=50")
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.json()["results"]).is_length(2)
+        assert_that(response.json()["next"]).is_not_none()
+
+    @mock.patch.object(ProductListView, "stream_chunk_size", 2)
+    def test_get_all_streamed_matches_full_list(self):
+        self.seedFixture("products", "basic-3.json")
+        response = client.get("/api/products?stream=true")
+        streamed = json.loads(b"".join(response.streaming_content))
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(streamed).is_equal_to(client.get("/api/products").json())
+
     def test_get_invalid_id_returns_bad_request(self):
         response = client.get("/api/products/invalid-id")
         self.assertJSONErrorResponse(response.json())
@@ -191,3 +259,148 @@ class DeleteTests(TestBase):
         response = client.delete("/api/products/1")
         self.assertJSONErrorResponse(response.json())
         assert_that(response.status_code).is_equal_to(404)
+
+
+class ResponseCacheTests(TestBase):
+    def test_get_all_cache_hit_issues_no_queries(self):
+        self.seedFixture("products", "basic-3.json")
+        expected = client.get("/api/products").json()
+        with self.assertNumQueries(0):
+            response = client.get("/api/products")
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.json()).is_equal_to(expected)
+
+    def test_get_all_cache_hit_returns_same_headers(self):
+        self.seedFixture("products", "basic-3.json")
+        miss = client.get("/api/products")
+        with self.assertNumQueries(0):
+            hit = client.get("/api/products")
+        assert_that(miss.headers).contains_key("Vary", "Allow")
+        assert_that(dict(hit.headers)).is_equal_to(dict(miss.headers))
+
+    def test_put_invalidates_cached_list(self):
+        seeded_data = self.seedFixture("products", "basic-1.json")
+        client.get("/api/products")
+        client.put(
+            f"/api/products/{seeded_data['id']}",  # type: ignore[GeneralTypeIssue]
+            self.getFixture("products", "basic-1-update.json"),
+            content_type="application/json",
+        )
+        response = client.get("/api/products")
+        assert_that(response.json()[0]["name"]).is_equal_to("BurgerTwo")
+
+    def test_response_stored_after_invalidation_is_not_served(self):
+        seeded_data = self.seedFixture("products", "basic-1.json")
+        key = response_cache_key("/api/products")
+        stale = client.get("/api/products")
+        # A request that read the products before the update, and stores
+        # its response after the update committed.
+        _, version = get_cached(key)
+        client.put(
+            f"/api/products/{seeded_data['id']}",  # type: ignore[GeneralTypeIssue]
+            self.getFixture("products", "basic-1-update.json"),
+            content_type="application/json",
+        )
+        set_cached(
+            key, version, stale.content, {"Content-Type": "application/json"}
+        )
+        response = client.get("/api/products")
+        assert_that(response.json()[0]["name"]).is_equal_to("BurgerTwo")
+
+    def test_category_products_change_invalidates_cached_lists(self):
+        self.seedFixture("products", "basic-1.json")
+        category = Category.objects.create(name="Burgers", description="desc")
+        client.get("/api/products")
+        client.get("/api/categories")
+        category.products.add(*Product.objects.all())
+        products = client.get("/api/products").json()
+        categories = client.get("/api/categories").json()
+        category_products = client.get(
+            f"/api/categories/{category.id}/products"
+        )
+        assert_that(products[0]["categories"]).is_length(1)
+        assert_that(categories[0]["products"]).is_length(1)
+        assert_that(category_products.json()).is_length(1)
+
+    def test_category_save_invalidates_cached_category_products(self):
+        seeded_data = self.seedFixture("products", "basic-1.json")
+        category = Category.objects.create(name="Burgers", description="desc")
+        category.products.add(seeded_data["id"])  # type: ignore[GeneralTypeIssue]
+        url = f"/api/categories/{category.id}/products"
+        client.get(url)
+        category.name = "Mains"
+        category.save()
+        response = client.get(url)
+        assert_that(response.json()[0]["categories"][0]["name"]).is_equal_to(
+            "Mains"
+        )
+
+
+class ConditionalGetTests(TestBase):
+    def test_get_id_returns_validators(self):
+        seeded_data = self.seedFixture("products", "basic-1.json")
+        url = f"/api/products/{seeded_data['id']}"  # type: ignore[GeneralTypeIssue]
+        response = client.get(url)
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response["ETag"]).matches(r'^"[^"]+"$')
+        assert_that(response.has_header("Last-Modified")).is_true()
+
+    def test_get_id_matching_etag_returns_not_modified(self):
+        seeded_data = self.seedFixture("products", "basic-1.json")
+        url = f"/api/products/{seeded_data['id']}"  # type: ignore[GeneralTypeIssue]
+        etag = client.get(url)["ETag"]
+        # Only the catalog generation check runs, no serializer reads.
+        with self.assertNumQueries(1):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert_that(response.status_code).is_equal_to(304)
+        assert_that(response.content).is_empty()
+
+    def test_get_all_cached_matching_etag_returns_not_modified(self):
+        self.seedFixture("products", "basic-3.json")
+        etag = client.get("/api/products")["ETag"]
+        with self.assertNumQueries(0):
+            response = client.get("/api/products", HTTP_IF_NONE_MATCH=etag)
+        assert_that(response.status_code).is_equal_to(304)
+
+    def test_put_changes_etag(self):
+        seeded_data = self.seedFixture("products", "basic-1.json")
+        url = f"/api/products/{seeded_data['id']}"  # type: ignore[GeneralTypeIssue]
+        etag = client.get(url)["ETag"]
+        client.put(
+            url,
+            self.getFixture("products", "basic-1-update.json"),
+            content_type="application/json",
+        )
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response["ETag"]).is_not_equal_to(etag)
+
+    def test_category_products_change_changes_etag(self):
+        seeded_data = self.seedFixture("products", "basic-1.json")
+        url = f"/api/products/{seeded_data['id']}"  # type: ignore[GeneralTypeIssue]
+        category = Category.objects.create(name="Burgers", description="desc")
+        etag = client.get(url)["ETag"]
+        category.products.add(seeded_data["id"])  # type: ignore[GeneralTypeIssue]
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.json()["categories"]).is_length(1)
+
+    def test_get_order_id_product_change_changes_etag(self):
+        self.seedFixture("products", "basic-1.json")
+        product = Product.objects.get()
+        order = Order.objects.create()
+        LineItem.objects.create(
+            order=order, product=product, quantity=1, sub_total=product.price
+        )
+        url = f"/api/orders/{order.id}"
+        etag = client.get(url)["ETag"]
+        assert_that(
+            client.get(url, HTTP_IF_NONE_MATCH=etag).status_code
+        ).is_equal_to(304)
+        product.name = "Cheeseburger"
+        product.save()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(
+            response.json()["lineItems"][0]["product"]["name"]
+        ).is_equal_to("Cheeseburger")
@@ -0,0 +1,162 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.http import HttpResponse
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from assertpy import assert_that
+
+from answerking_app.models.models import (
+    Category,
+    LineItem,
+    Order,
+    OrderDocument,
+    Product,
+)
+from answerking_app.tests.BaseTestClass import TestBase
+from answerking_app.utils.benchmark import seed_catalog, seed_orders
+from answerking_app.utils.query_plans import (
+    PLAN_READERS,
+    analyze_tables,
+    full_table_scans,
+)
+
+client = Client()
+
+# Tables that grow with traffic and must only be read through an index.
+LARGE_TABLES: set[str] = {
+    Order._meta.db_table,
+    LineItem._meta.db_table,
+    OrderDocument._meta.db_table,
+}
+
+
+@skipUnless(
+    connection.vendor in PLAN_READERS,
+    f"Query plans are not read on {connection.vendor}",
+)
+class QueryPlanTests(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.products: list[Product] = seed_catalog(50, 5)
+        seed_orders(500, self.products)
+        seed_orders(500, self.products, order_status=Order.Status.PAID)
+        analyze_tables(
+            LARGE_TABLES | {Product._meta.db_table, Category._meta.db_table}
+        )
+        self.order: Order = Order.objects.first()  # type: ignore[assignment]
+
+    def assertNoFullTableScans(
+        self, method: str, path: str, allowed: set[str] | None = None, **kwargs
+    ) -> HttpResponse:
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(client, method)(path, **kwargs)
+        scans: list[tuple[str, str]] = [
+            (table, query["sql"])
+            for query in queries.captured_queries
+            for table in full_table_scans(
+                query["sql"], LARGE_TABLES - (allowed or set())
+            )
+        ]
+        assert_that(scans).described_as(path).is_empty()
+        return response
+
+    def test_get_order_id(self):
+        response = self.assertNoFullTableScans(
+            "get", f"/api/orders/{self.order.id}"
+        )
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_get_orders(self):
+        # The unpaginated list returns every live order, so only the order
+        # table itself may be read in full, joined to documents by key.
+        response = self.assertNoFullTableScans(
+            "get", "/api/orders", allowed={Order._meta.db_table}
+        )
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_get_products(self):
+        response = self.assertNoFullTableScans("get", "/api/products")
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_get_categories(self):
+        response = self.assertNoFullTableScans("get", "/api/categories")
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_get_orders_page(self):
+        response = self.assertNoFullTableScans(
+            "get", "/api/orders?pageSize=10"
+        )
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_post_order(self):
+        response = self.assertNoFullTableScans(
+            "post",
+            "/api/orders",
+            data={
+                "lineItems": [
+                    {"product": {"id": self.products[0].id}, "quantity": 2}
+                ]
+            },
+            content_type="application/json",
+        )
+        assert_that(response.status_code).is_equal_to(201)
+
+    def test_put_order(self):
+        response = self.assertNoFullTableScans(
+            "put",
+            f"/api/orders/{self.order.id}",
+            data={
+                "lineItems": [
+                    {"product": {"id": self.products[1].id}, "quantity": 1}
+                ]
+            },
+            content_type="application/json",
+        )
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_cancel_order(self):
+        response = self.assertNoFullTableScans(
+            "delete", f"/api/orders/{self.order.id}"
+        )
+        assert_that(response.status_code).is_equal_to(204)
+
+    def test_retire_product_in_active_order(self):
+        response = self.assertNoFullTableScans(
+            "delete", f"/api/products/{self.products[0].id}"
+        )
+        assert_that(response.status_code).is_equal_to(400)
+
+    def test_retire_product_without_orders(self):
+        product: Product = Product.objects.create(name="Unordered")
+        response = self.assertNoFullTableScans(
+            "delete", f"/api/products/{product.id}"
+        )
+        assert_that(response.status_code).is_equal_to(204)
+
+    def test_get_product_id(self):
+        response = self.assertNoFullTableScans(
+            "get", f"/api/products/{self.products[0].id}"
+        )
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_get_category_products(self):
+        category: Category = Category.objects.first()  # type: ignore[assignment]
+        response = self.assertNoFullTableScans(
+            "get", f"/api/categories/{category.id}/products"
+        )
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_get_orders_filtered_by_status_and_date(self):
+        response = self.assertNoFullTableScans(
+            "get",
+            "/api/orders?orderStatus=Paid"
+            "&createdAfter=2000-01-01T00:00:00Z&pageSize=10",
+        )
+        assert_that(response.status_code).is_equal_to(200)
+
+    def test_get_orders_sorted_by_creation(self):
+        response = self.assertNoFullTableScans(
+            "get", "/api/orders?sort=-createdOn&pageSize=10"
+        )
+        assert_that(response.status_code).is_equal_to(200)
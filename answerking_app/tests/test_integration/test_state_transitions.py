@@ -0,0 +1,72 @@
+from assertpy import assert_that
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from answerking_app.models.models import OrderDocument
+from answerking_app.tests.BaseTestClass import TestBase
+from answerking_app.utils.catalog_snapshot import current_generation
+
+client = Client()
+
+
+class StateTransitionTests(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.seedFixture("products", "basic-3.json")
+        self.seedFixture("categories", "basic-1.json")
+        self.seedFixture("orders", "basic-1.json")
+
+    def delete(self, path):
+        """The status, and how many UPDATE statements were issued."""
+        with CaptureQueriesContext(connection) as context:
+            response = client.delete(path)
+        self.updates = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith("UPDATE")
+        ]
+        return response.status_code, len(self.updates)
+
+    def test_retire_product_is_one_update(self):
+        generation = current_generation()
+        # The product, then the catalog generation.
+        assert_that(self.delete("/api/products/2")).is_equal_to((204, 2))
+        assert_that(self.updates[0]).contains('"retired" = ')
+        assert_that(self.updates[0]).does_not_contain('"name" = ')
+        assert_that(current_generation()).is_not_equal_to(generation)
+        assert_that(client.get("/api/products/2").json()["retired"]).is_true()
+
+    def test_retire_product_refusals(self):
+        # Refusals are an UPDATE of no rows, with no generation bump.
+        assert_that(self.delete("/api/products/2")[0]).is_equal_to(204)
+        assert_that(self.delete("/api/products/2")).is_equal_to((410, 1))
+        assert_that(self.delete("/api/products/999999")).is_equal_to((404, 1))
+        # Product 1 is in an active order.
+        assert_that(self.delete("/api/products/1")).is_equal_to((400, 1))
+
+    def test_retire_category(self):
+        assert_that(self.delete("/api/categories/1")[0]).is_equal_to(204)
+        assert_that(
+            client.get("/api/categories/1").json()["retired"]
+        ).is_true()
+        assert_that(self.delete("/api/categories/1")).is_equal_to((410, 1))
+        assert_that(self.delete("/api/categories/999999")).is_equal_to(
+            (404, 1)
+        )
+
+    def test_cancel_order_is_one_update(self):
+        # The order, then the order list version.
+        assert_that(self.delete("/api/orders/1")).is_equal_to((204, 2))
+        assert_that(self.updates[0]).contains('"order_status" = ')
+        assert_that(bytes(OrderDocument.objects.get(pk=1).document)).contains(
+            b"Cancelled"
+        )
+        assert_that(
+            client.get("/api/orders/1").json()["orderStatus"]
+        ).is_equal_to("Cancelled")
+
+    def test_cancel_order_refusals(self):
+        self.delete("/api/orders/1")
+        assert_that(self.delete("/api/orders/1")).is_equal_to((400, 1))
+        assert_that(self.delete("/api/orders/999999")).is_equal_to((404, 1))
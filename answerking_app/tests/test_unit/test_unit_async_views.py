@@ -0,0 +1,21 @@
+from django.test import override_settings
+
+from answerking_app.tests.test_unit.UnitTestBaseClass import UnitTestBase
+from answerking_app.views import async_views, order_views
+
+
+class ReadViewTests(UnitTestBase):
+    def test_read_view_only_routes_async_when_enabled(self):
+        with override_settings(ASYNC_READ_VIEWS=False):
+            view = async_views.read_view(
+                order_views.OrderListView, async_views.OrderListAsyncView
+            )
+        self.assertIs(view.cls, order_views.OrderListView)
+        self.assertIs(view.view_class, order_views.OrderListView)
+        with override_settings(ASYNC_READ_VIEWS=True):
+            view = async_views.read_view(
+                order_views.OrderListView, async_views.OrderListAsyncView
+            )
+        self.assertIs(view.view_class, async_views.OrderListAsyncView)
+        self.assertIs(view.cls, order_views.OrderListView)
+        self.assertTrue(view.csrf_exempt)
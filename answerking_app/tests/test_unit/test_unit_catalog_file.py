@@ -0,0 +1,117 @@
+import datetime
+import os
+import tempfile
+from decimal import Decimal
+from unittest import mock
+
+from django.test import override_settings
+
+from answerking_app.models.models import Category, Product
+from answerking_app.models.serializers import CategorySerializer
+from answerking_app.tests.test_unit.UnitTestBaseClass import UnitTestBase
+from answerking_app.utils.catalog_file import MappedCatalog, write_catalog_file
+from answerking_app.utils.catalog_snapshot import (
+    build_snapshot,
+    current_generation,
+    get_catalog_snapshot,
+)
+
+
+class CatalogFileUnitTests(UnitTestBase):
+    UTB = UnitTestBase()
+    test_prod_1_data: dict = UTB.get_fixture(
+        "products", "plain_burger_data.json"
+    )
+    test_prod_2_data: dict = UTB.get_fixture(
+        "products", "margarita_pizza_data.json"
+    )
+    test_cat_data: dict = UTB.get_fixture(
+        "categories", "burgers_cat_data.json"
+    )
+
+    def setUp(self):
+        burger: Product = Product.objects.create(**self.test_prod_1_data)
+        Product.objects.create(**self.test_prod_2_data)
+        Category.objects.create(**self.test_cat_data).products.add(burger)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path: str = os.path.join(directory.name, "catalog.bin")
+
+    def tearDown(self):
+        Category.objects.all().delete()
+        Product.objects.all().delete()
+
+    def test_catalog_file_round_trip(self):
+        last_modified = datetime.datetime(
+            2022, 1, 1, 12, 0, 0, 5, tzinfo=datetime.timezone.utc
+        )
+        write_catalog_file(
+            self.path,
+            42,
+            last_modified,
+            [
+                (3, b'{"id":3}'),
+                (7, b'{"id":7}'),
+            ],
+            b"[]",
+        )
+        catalog: MappedCatalog | None = MappedCatalog.open(self.path)
+        assert catalog is not None
+        self.assertEqual(catalog.generation, 42)
+        self.assertEqual(catalog.last_modified, last_modified)
+        self.assertEqual(catalog.product_list_json, b'[{"id":3},{"id":7}]')
+        self.assertEqual(catalog.category_list_json, b"[]")
+        self.assertEqual(catalog.get_product_json(7), b'{"id":7}')
+        self.assertIsNone(catalog.get_product_json(5))
+
+    def test_open_invalid_file_returns_none(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a catalog")
+        self.assertIsNone(MappedCatalog.open(self.path))
+        self.assertIsNone(MappedCatalog.open(self.path + ".missing"))
+
+    def test_mapped_catalog_matches_in_process_snapshot(self):
+        with override_settings(CATALOG_SNAPSHOT_PATH=self.path):
+            catalog = get_catalog_snapshot()
+        snapshot = build_snapshot(current_generation())
+        self.assertIsInstance(catalog, MappedCatalog)
+        self.assertEqual(catalog.product_list_json, snapshot.product_list_json)
+        self.assertEqual(
+            catalog.category_list_json, snapshot.category_list_json
+        )
+        self.assertEqual(catalog.last_modified, snapshot.last_modified)
+
+    def test_catalog_write_rewrites_file(self):
+        with override_settings(CATALOG_SNAPSHOT_PATH=self.path):
+            get_catalog_snapshot()
+            product: Product = Product.objects.get(name="Plain Burger")
+            product.price = Decimal("9.99")
+            product.save()
+            catalog: MappedCatalog | None = MappedCatalog.open(self.path)
+            assert catalog is not None
+        self.assertEqual(catalog.generation, current_generation())
+        self.assertIn(b'"price":9.99', catalog.get_product_json(product.id))
+
+    def test_category_write_rewrites_file_once(self):
+        category: Category = Category.objects.get()
+        with override_settings(CATALOG_SNAPSHOT_PATH=self.path):
+            get_catalog_snapshot()
+            with mock.patch(
+                "answerking_app.utils.catalog_snapshot.write_catalog_file",
+                wraps=write_catalog_file,
+            ) as write:
+                CategorySerializer().update(
+                    category,
+                    {
+                        "name": "Mains",
+                        "description": "Mains",
+                        "products": [
+                            {"id": product.id}
+                            for product in Product.objects.all()
+                        ],
+                    },
+                )
+            catalog: MappedCatalog | None = MappedCatalog.open(self.path)
+        write.assert_called_once()
+        assert catalog is not None
+        self.assertEqual(catalog.generation, current_generation())
@@ -0,0 +1,95 @@
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.renderers import JSONRenderer
+
+from answerking_app.models.models import CatalogGeneration, Category, Product
+from answerking_app.models.read_serializers import (
+    CategoryReadSerializer,
+    ProductReadSerializer,
+)
+from answerking_app.tests.test_unit.UnitTestBaseClass import UnitTestBase
+from answerking_app.utils.catalog_snapshot import (
+    CatalogSnapshot,
+    current_generation,
+    get_catalog_snapshot,
+)
+from answerking_app.utils.mixins.ApiExceptions import ProblemDetails
+from answerking_app.utils.serializer_data_functions import products_check
+
+
+@override_settings(CATALOG_SNAPSHOT_PATH=None)
+class CatalogSnapshotUnitTests(UnitTestBase):
+    UTB = UnitTestBase()
+    test_prod_1_data: dict = UTB.get_fixture(
+        "products", "plain_burger_data.json"
+    )
+    test_prod_2_data: dict = UTB.get_fixture(
+        "products", "margarita_pizza_data.json"
+    )
+    test_cat_data: dict = UTB.get_fixture(
+        "categories", "burgers_cat_data.json"
+    )
+
+    def setUp(self):
+        burger: Product = Product.objects.create(**self.test_prod_1_data)
+        Product.objects.create(**self.test_prod_2_data)
+        Category.objects.create(**self.test_cat_data).products.add(burger)
+
+    def tearDown(self):
+        Category.objects.all().delete()
+        Product.objects.all().delete()
+
+    def test_snapshot_reused_until_generation_changes(self):
+        snapshot: CatalogSnapshot = get_catalog_snapshot()
+        with self.assertNumQueries(1):
+            self.assertIs(get_catalog_snapshot(), snapshot)
+        product: Product = Product.objects.get(name="Plain Burger")
+        product.name = "Cheeseburger"
+        product.save()
+        rebuilt: CatalogSnapshot = get_catalog_snapshot()
+        self.assertNotEqual(rebuilt.generation, snapshot.generation)
+        self.assertIn(
+            b'"name":"Cheeseburger"', rebuilt.product_json[product.id]
+        )
+
+    def test_snapshot_matches_read_serializers(self):
+        snapshot: CatalogSnapshot = get_catalog_snapshot()
+        renderer = JSONRenderer()
+        self.assertEqual(
+            snapshot.product_list_json,
+            renderer.render(
+                ProductReadSerializer(Product.objects.order_by("id")).data
+            ),
+        )
+        self.assertEqual(
+            snapshot.category_list_json,
+            renderer.render(
+                CategoryReadSerializer(Category.objects.order_by("id")).data
+            ),
+        )
+
+    def test_category_products_change_bumps_generation(self):
+        snapshot: CatalogSnapshot = get_catalog_snapshot()
+        category: Category = Category.objects.get()
+        category.products.set(Product.objects.all())
+        rebuilt: CatalogSnapshot = get_catalog_snapshot()
+        self.assertEqual(len(rebuilt.category_products[category.id]), 2)
+        self.assertNotEqual(rebuilt.generation, snapshot.generation)
+
+    def test_generation_row_exists_before_catalog_writes(self):
+        CatalogGeneration.objects.all().delete()
+        call_command("flush", interactive=False, verbosity=0)
+        self.assertIsNotNone(current_generation())
+        self.assertIs(get_catalog_snapshot(), get_catalog_snapshot())
+
+    def test_snapshot_not_kept_without_generation_row(self):
+        CatalogGeneration.objects.all().delete()
+        self.assertIsNot(get_catalog_snapshot(), get_catalog_snapshot())
+
+    def test_products_check_sees_retired_product_fail(self):
+        product: Product = Product.objects.get(name="Plain Burger")
+        get_catalog_snapshot()
+        product.retired = True
+        product.save()
+        with self.assertRaises(ProblemDetails):
+            products_check({"products": [{"id": product.id}]})
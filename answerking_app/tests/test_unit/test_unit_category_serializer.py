@@ -106,3 +106,20 @@ class CategorySerializerUnitTests(UnitTestBase):
         expected: str = self.frozen_time
         actual: str = test_serializer_data["lastUpdated"]
         self.assertEqual(actual, expected)
+
+    def test_cat_serializer_products_validation_does_not_query(self):
+        test_prod: Product = Product.objects.get(
+            name=self.test_prod_data["name"]
+        )
+        data: dict = {
+            "name": "Sides",
+            "description": "desc",
+            "products": [test_prod.id],
+        }
+        test_serializer = CategorySerializer(data=data)
+        with self.assertNumQueries(0):
+            is_valid: bool = test_serializer.is_valid()
+        self.assertTrue(is_valid)
+        self.assertEqual(
+            test_serializer.validated_data["products"], [{"id": test_prod.id}]
+        )
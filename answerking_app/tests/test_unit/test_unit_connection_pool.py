@@ -0,0 +1,76 @@
+import threading
+
+from django.test import SimpleTestCase
+
+from answerking_app.utils.connection_pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    def __init__(self, usable: bool = True):
+        self.usable = usable
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def test_released_connection_is_reused(self):
+        pool = ConnectionPool(max_size=2, timeout=0.1)
+        connection = pool.checkout(FakeConnection)
+        pool.release(connection)
+        self.assertIs(pool.checkout(FakeConnection), connection)
+        self.assertEqual(pool.stats()["size"], 1)
+        self.assertEqual(pool.stats()["checkouts"], 2)
+
+    def test_checkout_beyond_max_size_times_out(self):
+        pool = ConnectionPool(max_size=1, timeout=0.01)
+        pool.checkout(FakeConnection)
+        with self.assertRaises(PoolTimeout):
+            pool.checkout(FakeConnection)
+        stats: dict[str, int] = pool.stats()
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(stats["in_use"], 1)
+        self.assertEqual(stats["waits"], 1)
+        self.assertEqual(stats["timeouts"], 1)
+
+    def test_waiting_checkout_gets_released_connection(self):
+        pool = ConnectionPool(max_size=1, timeout=5)
+        connection = pool.checkout(FakeConnection)
+        timer = threading.Timer(0.05, pool.release, [connection])
+        timer.start()
+        self.assertIs(pool.checkout(FakeConnection), connection)
+        timer.join()
+        self.assertEqual(pool.stats()["waits"], 1)
+        self.assertEqual(pool.stats()["timeouts"], 0)
+
+    def test_unusable_connection_is_replaced(self):
+        pool = ConnectionPool(
+            max_size=1, timeout=0.1, is_usable=lambda c: c.usable
+        )
+        broken = FakeConnection(usable=False)
+        pool.release(pool.checkout(lambda: broken))
+        connection = pool.checkout(FakeConnection)
+        self.assertIsNot(connection, broken)
+        self.assertTrue(broken.closed)
+        self.assertEqual(pool.stats()["size"], 1)
+        self.assertEqual(pool.stats()["discarded"], 1)
+
+    def test_non_reusable_release_frees_slot(self):
+        pool = ConnectionPool(max_size=1, timeout=0.01)
+        connection = pool.checkout(FakeConnection)
+        pool.release(connection, reusable=False)
+        self.assertTrue(connection.closed)
+        self.assertIsNot(pool.checkout(FakeConnection), connection)
+        self.assertEqual(pool.stats()["size"], 1)
+
+    def test_failed_connect_frees_slot(self):
+        pool = ConnectionPool(max_size=1, timeout=0.01)
+
+        def refuse():
+            raise ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            pool.checkout(refuse)
+        self.assertEqual(pool.stats()["size"], 0)
+        pool.checkout(FakeConnection)
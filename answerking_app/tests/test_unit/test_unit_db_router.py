@@ -0,0 +1,91 @@
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from freezegun import freeze_time
+
+from answerking_app.models.models import Product
+from answerking_app.utils.db_router import (
+    STICKY_COOKIE,
+    ReplicaRouter,
+    ReplicaRoutingMiddleware,
+)
+
+factory = RequestFactory()
+router = ReplicaRouter()
+
+
+class ReadAliasRecorder:
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.alias: str | None = None
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        self.alias = router.db_for_read(Product)
+        return HttpResponse(status=self.status)
+
+
+@override_settings(
+    REPLICA_DATABASES=["replica1", "replica2"], REPLICA_STICKY_SECONDS=5
+)
+class ReplicaRouterTests(SimpleTestCase):
+    def route(
+        self, request: HttpRequest, status: int = 200
+    ) -> tuple[str | None, HttpResponse]:
+        recorder = ReadAliasRecorder(status)
+        response = ReplicaRoutingMiddleware(recorder)(request)
+        return recorder.alias, response
+
+    def test_get_reads_from_replica(self):
+        alias, response = self.route(factory.get("/api/orders"))
+        self.assertIn(alias, ["replica1", "replica2"])
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+    def test_post_reads_from_primary_and_sets_sticky_cookie(self):
+        alias, response = self.route(factory.post("/api/orders"), 201)
+        self.assertEqual(alias, "default")
+        self.assertEqual(response.cookies[STICKY_COOKIE]["max-age"], 5)
+
+    def test_failed_write_does_not_set_sticky_cookie(self):
+        alias, response = self.route(factory.put("/api/orders/1"), 400)
+        self.assertEqual(alias, "default")
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+    def test_get_after_write_sticks_to_primary(self):
+        with freeze_time("2026-10-18 12:00:00"):
+            _, response = self.route(factory.delete("/api/orders/1"), 204)
+            request = factory.get("/api/orders/1")
+            request.COOKIES[STICKY_COOKIE] = response.cookies[
+                STICKY_COOKIE
+            ].value
+            alias, _ = self.route(request)
+        self.assertEqual(alias, "default")
+
+    def test_get_after_sticky_window_reads_from_replica(self):
+        with freeze_time("2026-10-18 12:00:00"):
+            _, response = self.route(factory.delete("/api/orders/1"), 204)
+        request = factory.get("/api/orders/1")
+        request.COOKIES[STICKY_COOKIE] = response.cookies[STICKY_COOKIE].value
+        with freeze_time("2026-10-18 12:00:06"):
+            alias, _ = self.route(request)
+        self.assertIn(alias, ["replica1", "replica2"])
+
+    def test_invalid_sticky_cookie_is_ignored(self):
+        request = factory.get("/api/orders")
+        request.COOKIES[STICKY_COOKIE] = "soon"
+        alias, _ = self.route(request)
+        self.assertIn(alias, ["replica1", "replica2"])
+
+    @override_settings(REPLICA_DATABASES=[])
+    def test_without_replicas_reads_use_default_routing(self):
+        alias, _ = self.route(factory.get("/api/orders"))
+        self.assertIsNone(alias)
+
+    def test_outside_request_reads_use_default_routing(self):
+        self.assertIsNone(router.db_for_read(Product))
+
+    def test_writes_go_to_primary(self):
+        self.route(factory.get("/api/orders"))
+        self.assertEqual(router.db_for_write(Product), "default")
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(router.allow_migrate("replica1", "answerking_app"))
+        self.assertIsNone(router.allow_migrate("default", "answerking_app"))
@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+from answerking_app.models.models import Product
+from answerking_app.tests.test_unit.UnitTestBaseClass import UnitTestBase
+
+
+class DirtyFieldsTests(UnitTestBase):
+    def setUp(self):
+        self.product: Product = Product.objects.create(
+            name="Burger", description="Tasty", price=1.5
+        )
+
+    def test_save_without_changes_skips_update(self):
+        product: Product = Product.objects.get(pk=self.product.id)
+        with self.assertNumQueries(0):
+            product.save()
+        product.price = 9
+        product.save()
+        self.assertEqual(Product.objects.get(pk=product.pk).price, 9)
+        with self.assertNumQueries(0):
+            product.save()
+
+    def test_save_writes_assigned_deferred_field(self):
+        product: Product = Product.objects.only("id", "price").get(
+            pk=self.product.id
+        )
+        product.name = "Big Burger"
+        product.save()
+        self.assertEqual(Product.objects.get(pk=product.pk).name, "Big Burger")
+
+    def test_save_after_reading_deferred_field_skips_update(self):
+        product: Product = Product.objects.only("id", "price").get(
+            pk=self.product.id
+        )
+        self.assertEqual(product.name, "Burger")
+        with self.assertNumQueries(0):
+            product.save()
+
+    def test_save_after_refresh_compares_with_refreshed_values(self):
+        product: Product = Product.objects.get(pk=self.product.id)
+        Product.objects.filter(pk=product.pk).update(price=3)
+        product.refresh_from_db()
+        product.price = Decimal("1.50")
+        product.save()
+        self.assertEqual(Product.objects.get(pk=product.pk).price, 1.5)
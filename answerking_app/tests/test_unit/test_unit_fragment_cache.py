@@ -0,0 +1,84 @@
+from unittest import mock
+
+from django.core.cache import caches
+from rest_framework.renderers import JSONRenderer
+
+from answerking_app.models.models import Category, Product
+from answerking_app.models.read_serializers import (
+    ProductReadSerializer,
+    product_representation,
+)
+from answerking_app.tests.test_unit.UnitTestBaseClass import UnitTestBase
+from answerking_app.utils.catalog_snapshot import (
+    CatalogSnapshot,
+    build_snapshot,
+)
+from answerking_app.utils.fragment_cache import (
+    FRAGMENT_CACHE_ALIAS,
+    split_fragment,
+)
+
+snapshot_path = "answerking_app.utils.catalog_snapshot."
+
+
+class FragmentCacheUnitTests(UnitTestBase):
+    UTB = UnitTestBase()
+    test_prod_1_data: dict = UTB.get_fixture(
+        "products", "plain_burger_data.json"
+    )
+    test_prod_2_data: dict = UTB.get_fixture(
+        "products", "margarita_pizza_data.json"
+    )
+    test_cat_data: dict = UTB.get_fixture(
+        "categories", "burgers_cat_data.json"
+    )
+
+    def setUp(self):
+        caches[FRAGMENT_CACHE_ALIAS].clear()
+        burger: Product = Product.objects.create(**self.test_prod_1_data)
+        pizza: Product = Product.objects.create(**self.test_prod_2_data)
+        Category.objects.create(**self.test_cat_data).products.add(
+            burger, pizza
+        )
+
+    def tearDown(self):
+        Category.objects.all().delete()
+        Product.objects.all().delete()
+
+    def test_split_fragment_ignores_field_name_inside_strings(self):
+        rendered: bytes = JSONRenderer().render(
+            {"name": '"categories":[]', "categories": [], "retired": False}
+        )
+        head, tail = split_fragment(rendered, "categories")
+        self.assertEqual(head, b'{"name":"\\"categories\\":[]","categories":[')
+        self.assertEqual(tail, b'],"retired":false}')
+
+    def test_product_edit_renders_only_that_product(self):
+        build_snapshot(None)
+        product: Product = Product.objects.get(name="Plain Burger")
+        product.price = 9
+        product.save()
+        with mock.patch(
+            snapshot_path + "product_representation",
+            wraps=product_representation,
+        ) as render_mock:
+            snapshot: CatalogSnapshot = build_snapshot(None)
+        render_mock.assert_called_once()
+        self.assertEqual(render_mock.call_args.args[0], product.id)
+        self.assertEqual(
+            snapshot.product_list_json,
+            JSONRenderer().render(
+                ProductReadSerializer(Product.objects.order_by("id")).data
+            ),
+        )
+
+    def test_category_rename_updates_nested_categories(self):
+        build_snapshot(None)
+        Category.objects.update(name="Mains")
+        snapshot: CatalogSnapshot = build_snapshot(None)
+        self.assertEqual(
+            snapshot.product_list_json,
+            JSONRenderer().render(
+                ProductReadSerializer(Product.objects.order_by("id")).data
+            ),
+        )
@@ -4,7 +4,10 @@ from decimal import Decimal
 from rest_framework import serializers
 
 from answerking_app.models.models import Product, Order, LineItem
-from answerking_app.models.serializers import LineItemSerializer
+from answerking_app.models.serializers import (
+    LineItemSerializer,
+    OrderSerializer,
+)
 from answerking_app.tests.test_unit.UnitTestBaseClass import UnitTestBase
 
 
@@ -28,10 +31,9 @@ class LineItemSerializerUnitTests(UnitTestBase):
     def setUp(self):
         prod: Product = Product.objects.create(**self.prod_data)
         order: Order = Order.objects.create()
-        line_item: LineItem = LineItem.objects.create(
-            order=order, product=prod, quantity=self.quant
+        OrderSerializer().create_order_line_items(
+            order, [{"product": {"id": prod.id}, "quantity": self.quant}]
         )
-        line_item.calculate_sub_total()
 
     def tearDown(self):
         Product.objects.all().delete()
@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 from answerking_app.models.models import Order, Product, LineItem
+from answerking_app.models.serializers import OrderSerializer
 from answerking_app.tests.test_unit.UnitTestBaseClass import UnitTestBase
 
 
@@ -18,14 +19,13 @@ class ModelTests(UnitTestBase):
         quant_2 = 1
         prod_2 = Product.objects.get(name="Pepperoni pizza")
         test_order: Order = Order.objects.create()
-        test_order_line_1 = LineItem.objects.create(
-            order=test_order, product=prod_1, quantity=quant_1
-        )
-        test_order_line_2 = LineItem.objects.create(
-            order=test_order, product=prod_2, quantity=quant_2
+        OrderSerializer().create_order_line_items(
+            test_order,
+            [
+                {"product": {"id": prod_1.id}, "quantity": quant_1},
+                {"product": {"id": prod_2.id}, "quantity": quant_2},
+            ],
         )
-        test_order_line_1.calculate_sub_total()
-        test_order_line_2.calculate_sub_total()
 
         test_order.calculate_total()
 
@@ -62,20 +62,3 @@ class ModelTests(UnitTestBase):
         self.assertEqual(calculated_tot, expected_tot)
         self.assertEqual(test_order_line_1.product.id, prod.id)
         self.assertEqual(test_order_line_1.quantity, quant)
-
-    def test_calculate_sub_total(self):
-        to_seed = {"margarita_pizza_data.json": "products"}
-        self.seed_data(to_seed)
-        prod = Product.objects.get(name="Margarita pizza")
-        quant = 2
-        test_order: Order = Order.objects.create()
-        test_order_line_1 = LineItem.objects.create(
-            order=test_order, product=prod, quantity=quant
-        )
-        test_order_line_1.calculate_sub_total()
-        calculated_sub_tot: Decimal = test_order_line_1.sub_total
-        expected_sub_tot: Decimal = prod.price * 2
-
-        self.assertEqual(calculated_sub_tot, expected_sub_tot)
-        self.assertEqual(test_order_line_1.product.id, prod.id)
-        self.assertEqual(test_order_line_1.quantity, quant)
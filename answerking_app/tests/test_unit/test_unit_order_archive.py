@@ -0,0 +1,60 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from answerking_app.models.models import (
+    ArchivedLineItem,
+    ArchivedOrder,
+    LineItem,
+    Order,
+)
+from answerking_app.tests.test_unit.UnitTestBaseClass import UnitTestBase
+from answerking_app.utils.benchmark import seed_catalog, seed_orders
+from answerking_app.utils.order_archive import archive_orders
+from answerking_app.utils.order_documents import rebuild_order_documents
+
+
+class OrderArchiveTests(UnitTestBase):
+    def setUp(self):
+        self.products = seed_catalog(product_count=3, category_count=1)
+        seed_orders(3, self.products, order_status=Order.Status.PAID)
+        seed_orders(2, self.products, order_status=Order.Status.CANCELLED)
+        seed_orders(2, self.products)
+        Order.objects.update(
+            created_on=timezone.now() - datetime.timedelta(days=100)
+        )
+        rebuild_order_documents()
+        seed_orders(1, self.products, order_status=Order.Status.PAID)
+        self.cutoff = timezone.now() - datetime.timedelta(days=90)
+
+    def test_archives_old_closed_orders_only(self):
+        archived_ids = list(
+            Order.objects.filter(
+                order_status__in=[
+                    Order.Status.PAID,
+                    Order.Status.CANCELLED,
+                ],
+                created_on__lt=self.cutoff,
+            ).values_list("id", flat=True)
+        )
+        self.assertEqual(archive_orders(self.cutoff, batch_size=2), 5)
+        self.assertCountEqual(
+            ArchivedOrder.objects.values_list("id", flat=True), archived_ids
+        )
+        self.assertFalse(Order.objects.filter(id__in=archived_ids).exists())
+        self.assertEqual(Order.objects.count(), 3)
+        self.assertEqual(ArchivedLineItem.objects.count(), 15)
+        self.assertFalse(
+            LineItem.objects.filter(order_id__in=archived_ids).exists()
+        )
+
+    def test_archive_is_idempotent(self):
+        archive_orders(self.cutoff)
+        self.assertEqual(archive_orders(self.cutoff), 0)
+
+    def test_command_reports_archived_count(self):
+        out = StringIO()
+        call_command("archiveOrders", "--days", "90", stdout=out)
+        self.assertIn("Archived 5 orders", out.getvalue())
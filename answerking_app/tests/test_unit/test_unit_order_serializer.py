@@ -2,7 +2,9 @@ from decimal import Decimal
 from typing import OrderedDict
 from unittest import mock
 
+from django.db import connection
 from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
 from freezegun import freeze_time
 from rest_framework.utils.serializer_helpers import ReturnDict
 
@@ -42,11 +44,11 @@ class OrderSerializerUnitTests(UnitTestBase):
             "id"
         ] = product_pizza.id
 
-        line_item = LineItem.objects.create(
-            order=valid_order, product=product_burger, quantity=3
+        line_items: list[LineItem] = OrderSerializer().create_order_line_items(
+            valid_order,
+            [{"product": {"id": product_burger.id}, "quantity": 3}],
         )
-        line_item.calculate_sub_total()
-        valid_order.calculate_total()
+        valid_order.calculate_total(line_items)
 
     def tearDown(self):
         Order.objects.all().delete()
@@ -124,6 +126,22 @@ class OrderSerializerUnitTests(UnitTestBase):
         self.assertEqual(actual_total, expected_total)
         self.assertEqual(orders.count(), 1)
 
+    def test_order_serializer_eager_loading_query_count(self):
+        product_pizza: Product = Product.objects.get(name="Margarita pizza")
+        for quantity in range(1, 4):
+            order: Order = Order.objects.create()
+            LineItem.objects.create(
+                order=order, product=product_pizza, quantity=quantity
+            )
+        orders: QuerySet[Order] = OrderSerializer.setup_eager_loading(
+            Order.objects.all()
+        )
+        with self.assertNumQueries(3):
+            test_serializer_data: ReturnDict = OrderSerializer(
+                orders, many=True
+            ).data
+        self.assertEqual(len(test_serializer_data), 4)
+
     @freeze_time(frozen_time)
     def test_order_serializer_created_on_and_last_updated_field_content(self):
         orders: QuerySet[Order] = Order.objects.all()
@@ -450,6 +468,113 @@ class OrderSerializerUnitTests(UnitTestBase):
         self.assertEqual(actual_status, expected_status)
         self.assertEqual(orders.count(), 1)
 
+    def test_create_order_line_items_merges_duplicate_products(self):
+        existing_order: Order = Order.objects.create()
+        existing_product: Product = Product.objects.get(name="Margarita pizza")
+        line_items_data: list[OrderedDict] = [
+            OrderedDict(product={"id": existing_product.id}, quantity=2),
+            OrderedDict(product={"id": existing_product.id}, quantity=3),
+        ]
+        serializer = OrderSerializer()
+        serializer.create_order_line_items(existing_order, line_items_data)
+
+        new_line_item = LineItem.objects.get(
+            order=existing_order, product=existing_product
+        )
+
+        self.assertEqual(new_line_item.quantity, 5)
+        self.assertEqual(new_line_item.sub_total, Decimal(30.00))
+
+    def test_order_create_write_statement_count(self):
+        product_burger: Product = Product.objects.get(name="Plain Burger")
+        product_pizza: Product = Product.objects.get(name="Margarita pizza")
+        validated_data: dict = {
+            "lineitem_set": [
+                OrderedDict(product={"id": product_burger.id}, quantity=1),
+                OrderedDict(product={"id": product_pizza.id}, quantity=2),
+            ]
+        }
+        serializer = OrderSerializer()
+        with CaptureQueriesContext(connection) as context:
+            new_order_object = serializer.create(validated_data)
+        write_statements: list[str] = [
+            query["sql"].split(" ")[0]
+            for query in context.captured_queries
+            if not query["sql"].startswith(
+                ("SELECT", "BEGIN", "SAVEPOINT", "RELEASE")
+            )
+        ]
+
+        # Order, line items, total, then the order's read document and the
+        # order list version.
+        self.assertEqual(
+            write_statements,
+            ["INSERT", "INSERT", "UPDATE", "INSERT", "UPDATE"],
+        )
+        self.assertEqual(new_order_object.lineitem_set.count(), 2)
+        self.assertEqual(new_order_object.order_total, Decimal(18.00))
+
+    def update_write_statements(
+        self, order: Order, line_items_data: list[OrderedDict]
+    ) -> list[str]:
+        with CaptureQueriesContext(connection) as context:
+            OrderSerializer().update(order, {"lineitem_set": line_items_data})
+        return [
+            query["sql"].split(" ")[0]
+            for query in context.captured_queries
+            if not query["sql"].startswith(
+                ("SELECT", "BEGIN", "SAVEPOINT", "RELEASE")
+            )
+        ]
+
+    def test_order_update_changes_only_changed_line(self):
+        order: Order = Order.objects.get()
+        burger_line: LineItem = order.lineitem_set.get()
+        write_statements: list[str] = self.update_write_statements(
+            order,
+            [OrderedDict(product={"id": burger_line.product_id}, quantity=1)],
+        )
+
+        # The changed line, the total, then the order's read document and
+        # the order list version.
+        self.assertEqual(
+            write_statements, ["UPDATE", "UPDATE", "INSERT", "UPDATE"]
+        )
+        updated_line: LineItem = order.lineitem_set.get()
+        self.assertEqual(updated_line.pk, burger_line.pk)
+        self.assertEqual(updated_line.quantity, 1)
+        self.assertEqual(order.order_total, updated_line.sub_total)
+
+    def test_order_update_inserts_and_deletes_only_changed_lines(self):
+        order: Order = Order.objects.get()
+        burger_line: LineItem = order.lineitem_set.get()
+        pizza: Product = Product.objects.get(name="Margarita pizza")
+        write_statements: list[str] = self.update_write_statements(
+            order,
+            [
+                OrderedDict(
+                    product={"id": burger_line.product_id}, quantity=3
+                ),
+                OrderedDict(product={"id": pizza.id}, quantity=1),
+            ],
+        )
+        self.assertEqual(
+            write_statements, ["INSERT", "UPDATE", "INSERT", "UPDATE"]
+        )
+        self.assertTrue(LineItem.objects.filter(pk=burger_line.pk).exists())
+
+        write_statements = self.update_write_statements(
+            order, [OrderedDict(product={"id": pizza.id}, quantity=1)]
+        )
+        self.assertEqual(
+            write_statements, ["DELETE", "UPDATE", "INSERT", "UPDATE"]
+        )
+        self.assertEqual(
+            list(order.lineitem_set.values_list("product_id", flat=True)),
+            [pizza.id],
+        )
+        self.assertEqual(order.order_total, pizza.price)
+
     @mock.patch(
         serializer_path + "products_check",
     )
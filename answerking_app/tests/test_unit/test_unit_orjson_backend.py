@@ -0,0 +1,60 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
+from django.test import TestCase
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from answerking_app.utils.orjson_backend import ORJSONParser, ORJSONRenderer
+
+
+class ORJSONBackendTests(TestCase):
+    payload: dict = {
+        "id": 1,
+        "name": "Plain Burger",
+        "description": "Plain   burger é",
+        "price": Decimal("12.99"),
+        "orderTotal": Decimal("0.00"),
+        "categories": [{"id": 2, "name": "Burgers", "retired": False}],
+        "createdOn": "2022-01-01T12:00:00.000000Z",
+        "ref": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "empty": None,
+    }
+
+    def test_renderer_matches_json_renderer(self):
+        self.assertEqual(
+            ORJSONRenderer().render(self.payload),
+            JSONRenderer().render(self.payload),
+        )
+
+    def test_renderer_formats_datetimes_with_datetime_format(self):
+        created_on = datetime.datetime(
+            2022, 1, 1, 12, 0, 0, 5, tzinfo=datetime.timezone.utc
+        )
+        self.assertEqual(
+            ORJSONRenderer().render({"createdOn": created_on}),
+            b'{"createdOn":"2022-01-01T12:00:00.000005Z"}',
+        )
+
+    def test_renderer_renders_none_as_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_renderer_indent_falls_back_to_json_renderer(self):
+        context: dict = {"indent": 2}
+        self.assertEqual(
+            ORJSONRenderer().render(self.payload, renderer_context=context),
+            JSONRenderer().render(self.payload, renderer_context=context),
+        )
+
+    def test_parser_parses_json(self):
+        stream = io.BytesIO(b'{"lineItems": [{"product": {"id": 1}}]}')
+        self.assertEqual(
+            ORJSONParser().parse(stream),
+            {"lineItems": [{"product": {"id": 1}}]},
+        )
+
+    def test_parser_invalid_json_raises_parse_error(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"name": }'))
@@ -0,0 +1,97 @@
+from django.db.models import QuerySet
+from rest_framework.renderers import JSONRenderer
+
+from answerking_app.models.models import Category, LineItem, Order, Product
+from answerking_app.models.read_serializers import (
+    CategoryReadSerializer,
+    OrderReadSerializer,
+    ProductReadSerializer,
+)
+from answerking_app.models.serializers import (
+    CategorySerializer,
+    OrderSerializer,
+    ProductSerializer,
+)
+from answerking_app.tests.test_unit.UnitTestBaseClass import UnitTestBase
+
+
+class ReadSerializerUnitTests(UnitTestBase):
+    UTB = UnitTestBase()
+    test_prod_1_data: dict = UTB.get_fixture(
+        "products", "plain_burger_data.json"
+    )
+    test_prod_2_data: dict = UTB.get_fixture(
+        "products", "margarita_pizza_data.json"
+    )
+    test_prod_3_data: dict = UTB.get_fixture(
+        "products", "retired_product_data.json"
+    )
+    test_cat_1_data: dict = UTB.get_fixture(
+        "categories", "burgers_cat_data.json"
+    )
+    test_cat_2_data: dict = UTB.get_fixture(
+        "categories", "pizzas_cat_data.json"
+    )
+
+    def setUp(self):
+        burger: Product = Product.objects.create(**self.test_prod_1_data)
+        pizza: Product = Product.objects.create(**self.test_prod_2_data)
+        Product.objects.create(**self.test_prod_3_data)
+        burgers: Category = Category.objects.create(**self.test_cat_1_data)
+        pizzas: Category = Category.objects.create(**self.test_cat_2_data)
+        burgers.products.add(burger)
+        pizzas.products.add(burger, pizza)
+        Order.objects.create()
+        order: Order = Order.objects.create()
+        for product, quantity in [(burger, 2), (pizza, 1)]:
+            LineItem.objects.create(
+                order=order,
+                product=product,
+                quantity=quantity,
+                sub_total=product.price * quantity,
+            )
+        order.calculate_total()
+
+    def tearDown(self):
+        Order.objects.all().delete()
+        Category.objects.all().delete()
+        Product.objects.all().delete()
+
+    def assertRendersIdentically(self, read_data, serializer_data):
+        renderer = JSONRenderer()
+        self.assertEqual(
+            renderer.render(read_data), renderer.render(serializer_data)
+        )
+
+    def test_product_read_serializer_matches_product_serializer(self):
+        products: QuerySet[Product] = Product.objects.order_by("id")
+        with self.assertNumQueries(2):
+            read_data: list[dict] = ProductReadSerializer(products).data
+        self.assertRendersIdentically(
+            read_data, ProductSerializer(products, many=True).data
+        )
+
+    def test_category_read_serializer_matches_category_serializer(self):
+        categories: QuerySet[Category] = Category.objects.order_by("id")
+        with self.assertNumQueries(2):
+            read_data: list[dict] = CategoryReadSerializer(categories).data
+        self.assertRendersIdentically(
+            read_data, CategorySerializer(categories, many=True).data
+        )
+
+    def test_order_read_serializer_matches_order_serializer(self):
+        orders: QuerySet[Order] = Order.objects.order_by("id")
+        with self.assertNumQueries(3):
+            read_data: list[dict] = OrderReadSerializer(orders).data
+        self.assertRendersIdentically(
+            read_data, OrderSerializer(orders, many=True).data
+        )
+
+    def test_read_serializer_ignores_prefetch_lookups(self):
+        orders: QuerySet[Order] = OrderSerializer.setup_eager_loading(
+            Order.objects.order_by("id")
+        )
+        self.assertRendersIdentically(
+            OrderReadSerializer(orders).data,
+            OrderSerializer(orders, many=True).data,
+        )
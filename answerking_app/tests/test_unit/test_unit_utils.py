@@ -2,15 +2,19 @@ import json
 from unittest.mock import Mock, MagicMock
 import copy
 from answerking_app.utils.serializer_data_functions import products_check
+from answerking_app.utils.catalog_snapshot import get_catalog_snapshot
 from django.http import Http404, JsonResponse
 from django.core.exceptions import ObjectDoesNotExist
 from rest_framework.serializers import ValidationError
 from rest_framework.exceptions import ParseError
 from django.db import IntegrityError
 from MySQLdb.constants.ER import DUP_ENTRY
-from answerking_app.models.models import Product
+from answerking_app.models.models import LineItem, Order, Product
 from answerking_app.tests.test_unit.UnitTestBaseClass import UnitTestBase
 from answerking_app.utils.mixins.ApiExceptions import ProblemDetails
+from answerking_app.utils.mixins.RetireMixin import (
+    product_active_order_check,
+)
 from answerking_app.utils.url_parameter_check import check_url_parameter
 from answerking_app.utils.json404_middleware_config import json404_response
 from answerking_app.utils.exceptions_handler import wrapper
@@ -234,3 +238,72 @@ class UtilsTests(UnitTestBase):
         self.assertEqual(
             context.exception.detail, "This product has been retired"
         )
+
+    def test_products_check_one_query_keeps_input_order_pass(self):
+        to_seed: dict = {
+            "margarita_pizza_data.json": "products",
+            "pepperoni_pizza_data.json": "products",
+        }
+        self.seed_data(to_seed)
+        prod_1: Product = Product.objects.get(name="Margarita pizza")
+        prod_2: Product = Product.objects.get(name="Pepperoni pizza")
+        validated_data: dict = {
+            "products": [
+                {"id": prod_2.id},
+                {"id": prod_1.id},
+                {"id": prod_2.id},
+            ]
+        }
+        get_catalog_snapshot()
+        # Products come from the snapshot after its generation check.
+        with self.assertNumQueries(1):
+            actual: list[Product] = products_check(validated_data)
+
+        self.assertEqual(actual, [prod_2, prod_1, prod_2])
+
+    def test_products_check_reports_missing_and_retired_together_fail(self):
+        to_seed: dict = {"retired_product_data.json": "products"}
+        self.seed_data(to_seed)
+        retired_prod: Product = Product.objects.get(name="Old Pizza")
+        missing_id: int = retired_prod.id + 100
+        validated_data: dict = {
+            "products": [{"id": missing_id}, {"id": retired_prod.id}]
+        }
+        with self.assertRaises(ProblemDetails) as context:
+            products_check(validated_data)
+
+        self.assertEqual(
+            context.exception.status_code, status.HTTP_400_BAD_REQUEST
+        )
+        self.assertEqual(
+            context.exception.extensions["errors"],
+            {"missing": [missing_id], "retired": [retired_prod.id]},
+        )
+
+    def test_product_active_order_check_ignores_closed_orders_pass(self):
+        test_prod: Product = Product.objects.get(
+            name=self.test_prod_data["name"]
+        )
+        for order_status in [Order.Status.PAID, Order.Status.CANCELLED]:
+            order: Order = Order.objects.create(order_status=order_status)
+            LineItem.objects.create(order=order, product=test_prod, quantity=1)
+
+        with self.assertNumQueries(1):
+            product_active_order_check(test_prod)
+
+    def test_product_active_order_check_active_order_fail(self):
+        test_prod: Product = Product.objects.get(
+            name=self.test_prod_data["name"]
+        )
+        order: Order = Order.objects.create()
+        LineItem.objects.create(order=order, product=test_prod, quantity=1)
+
+        with self.assertRaises(ProblemDetails) as context:
+            product_active_order_check(test_prod)
+
+        self.assertEqual(
+            context.exception.status_code, status.HTTP_400_BAD_REQUEST
+        )
+        self.assertEqual(
+            context.exception.detail, "This product is in an active order"
+        )
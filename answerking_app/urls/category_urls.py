@@ -2,7 +2,8 @@ from functools import partial
 
 from django.urls import path
 
-from answerking_app.views import category_views
+from answerking_app.views import async_views, category_views
+from answerking_app.views.async_views import read_view
 
 urlpatterns: list[partial] = [
     path(
@@ -12,7 +13,10 @@ urlpatterns: list[partial] = [
     ),
     path(
         "categories/<pk>",
-        category_views.CategoryDetailView.as_view(),
+        read_view(
+            category_views.CategoryDetailView,
+            async_views.CategoryDetailAsyncView,
+        ),
         name="category_detail",
     ),
     path(
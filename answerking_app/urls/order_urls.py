@@ -2,13 +2,20 @@ from functools import partial
 
 from django.urls import path
 
-from answerking_app.views import order_views
+from answerking_app.views import async_views, order_views
+from answerking_app.views.async_views import read_view
 
 urlpatterns: list[partial] = [
-    path("orders", order_views.OrderListView.as_view(), name="order_list"),
+    path(
+        "orders",
+        read_view(order_views.OrderListView, async_views.OrderListAsyncView),
+        name="order_list",
+    ),
     path(
         "orders/<pk>",
-        order_views.OrderDetailView.as_view(),
+        read_view(
+            order_views.OrderDetailView, async_views.OrderDetailAsyncView
+        ),
         name="order_detail",
     ),
 ]
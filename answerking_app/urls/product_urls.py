@@ -2,7 +2,8 @@ from functools import partial
 
 from django.urls import path
 
-from answerking_app.views import product_views
+from answerking_app.views import async_views, product_views
+from answerking_app.views.async_views import read_view
 
 urlpatterns: list[partial] = [
     path(
@@ -12,7 +13,9 @@ urlpatterns: list[partial] = [
     ),
     path(
         "products/<pk>",
-        product_views.ProductDetailView.as_view(),
+        read_view(
+            product_views.ProductDetailView, async_views.ProductDetailAsyncView
+        ),
         name="product_detail",
     ),
 ]
@@ -0,0 +1,120 @@
+import statistics
+import time
+from decimal import Decimal
+from typing import Any, Callable
+
+from django.db import connection
+
+from answerking_app.models.models import Category, LineItem, Order, Product
+from answerking_app.utils.order_documents import (
+    REBUILD_BATCH_SIZE,
+    write_order_documents,
+)
+
+SEED_BATCH_SIZE = 5000
+
+
+class BenchmarkResult:
+    def __init__(self, timings: list[float], queries: int):
+        self.timings = timings
+        self.queries = queries
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.timings) * 1000
+
+    @property
+    def best_ms(self) -> float:
+        return min(self.timings) * 1000
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def measure(func: Callable[[], Any], repeat: int = 5) -> BenchmarkResult:
+    timings: list[float] = []
+    counter = QueryCounter()
+    for _ in range(repeat):
+        counter.count = 0
+        with connection.execute_wrapper(counter):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    return BenchmarkResult(timings, counter.count)
+
+
+def seed_catalog(product_count: int, category_count: int) -> list[Product]:
+    product_names: list[str] = [
+        f"Benchmark product {i}" for i in range(product_count)
+    ]
+    category_names: list[str] = [
+        f"Benchmark category {i}" for i in range(category_count)
+    ]
+    Product.objects.bulk_create(
+        Product(
+            name=name,
+            description="desc",
+            price=Decimal("1.50") + i % 10,
+        )
+        for i, name in enumerate(product_names)
+    )
+    Category.objects.bulk_create(
+        Category(name=name, description="desc") for name in category_names
+    )
+    # Names are unique, so these are exactly the rows just created.
+    products: list[Product] = list(
+        Product.objects.filter(name__in=product_names).order_by("id")
+    )
+    categories: list[Category] = list(
+        Category.objects.filter(name__in=category_names).order_by("id")
+    )
+    Category.products.through.objects.bulk_create(
+        Category.products.through(
+            category_id=categories[i % len(categories)].id,
+            product_id=product.id,
+        )
+        for i, product in enumerate(products)
+    )
+    return products
+
+
+def seed_orders(
+    count: int,
+    products: list[Product],
+    lines_per_order: int = 3,
+    order_status: str = Order.Status.CREATED,
+) -> list[int]:
+    last_id: int = (
+        Order.objects.order_by("-id").values_list("id", flat=True).first() or 0
+    )
+    for offset in range(0, count, SEED_BATCH_SIZE):
+        batch_size: int = min(SEED_BATCH_SIZE, count - offset)
+        Order.objects.bulk_create(
+            Order(order_status=order_status) for _ in range(batch_size)
+        )
+    order_ids: list[int] = list(
+        Order.objects.filter(id__gt=last_id).values_list("id", flat=True)
+    )
+    line_items: list[LineItem] = []
+    for i, order_id in enumerate(order_ids):
+        for line in range(lines_per_order):
+            product: Product = products[(i + line) % len(products)]
+            line_items.append(
+                LineItem(
+                    order_id=order_id,
+                    product=product,
+                    quantity=line + 1,
+                    sub_total=product.price * (line + 1),
+                )
+            )
+    LineItem.objects.bulk_create(line_items, batch_size=SEED_BATCH_SIZE)
+    for offset in range(0, len(order_ids), REBUILD_BATCH_SIZE):
+        end: int = offset + REBUILD_BATCH_SIZE
+        write_order_documents(order_ids[offset:end])
+    return order_ids
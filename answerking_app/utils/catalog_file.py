@@ -0,0 +1,155 @@
+import contextlib
+import datetime
+import mmap
+import os
+import struct
+import tempfile
+from typing import Iterable
+
+try:
+    import fcntl
+except ImportError:  # Windows, where workers are not forked.
+    fcntl = None  # type: ignore[assignment]
+
+MAGIC = b"AKCAT002"
+# magic, generation, last modified (epoch microseconds, -1 when unknown),
+# product count, then offset and length of the product and category lists.
+HEADER = struct.Struct("<8sqqIQQQQ")
+# id, then offset and length of the product's JSON.
+RECORD = struct.Struct("<qQI")
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def write_catalog_file(
+    path: str,
+    generation: int,
+    last_modified: datetime.datetime | None,
+    products: Iterable[tuple[int, bytes]],
+    category_list_json: bytes,
+):
+    """Write the catalog to `path`, replacing any previous file atomically.
+
+    Product JSON fragments are laid out as the product list array itself,
+    so each record's offset points into the list response.
+    """
+    records: list[bytes] = []
+    fragments: list[bytes] = []
+    body_offset: int = 1
+    for product_id, fragment in products:
+        records.append(RECORD.pack(product_id, body_offset, len(fragment)))
+        fragments.append(fragment)
+        body_offset += len(fragment) + 1
+    product_list_json: bytes = b"[" + b",".join(fragments) + b"]"
+    product_offset: int = HEADER.size + RECORD.size * len(records)
+    category_offset: int = product_offset + len(product_list_json)
+    header: bytes = HEADER.pack(
+        MAGIC,
+        generation,
+        int((last_modified - EPOCH) / datetime.timedelta(microseconds=1))
+        if last_modified
+        else -1,
+        len(records),
+        product_offset,
+        len(product_list_json),
+        category_offset,
+        len(category_list_json),
+    )
+    directory: str = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(header)
+            tmp.writelines(records)
+            tmp.write(product_list_json)
+            tmp.write(category_list_json)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def catalog_file_lock(path: str):
+    """Hold an exclusive lock between processes on the catalog at `path`.
+
+    Taken around the check and rewrite of the file, so after a catalog
+    write one worker rebuilds it and the others only remap.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(f"{path}.lock", "ab") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+class MappedCatalog:
+    """Read-only view of a catalog file shared by every worker process.
+
+    Records are sorted by id and looked up by binary search, so nothing is
+    copied out of the mapping until a JSON slice is requested.
+    """
+
+    def __init__(self, buffer: mmap.mmap):
+        self.buffer = buffer
+        (
+            magic,
+            self.generation,
+            last_modified_us,
+            self.product_count,
+            self.product_offset,
+            self.product_length,
+            self.category_offset,
+            self.category_length,
+        ) = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Not a catalog file")
+        self.last_modified: datetime.datetime | None = (
+            EPOCH + datetime.timedelta(microseconds=last_modified_us)
+            if last_modified_us >= 0
+            else None
+        )
+
+    @classmethod
+    def open(cls, path: str) -> "MappedCatalog | None":
+        try:
+            with open(path, "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            return cls(buffer)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    @property
+    def product_list_json(self) -> bytes:
+        start: int = self.product_offset
+        end: int = start + self.product_length
+        return self.buffer[start:end]
+
+    @property
+    def category_list_json(self) -> bytes:
+        start: int = self.category_offset
+        end: int = start + self.category_length
+        return self.buffer[start:end]
+
+    def find_record(self, product_id: int) -> tuple | None:
+        low, high = 0, self.product_count
+        while low < high:
+            middle: int = (low + high) // 2
+            record: tuple = RECORD.unpack_from(
+                self.buffer, HEADER.size + middle * RECORD.size
+            )
+            if record[0] == product_id:
+                return record
+            if record[0] < product_id:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def get_product_json(self, product_id: int) -> bytes | None:
+        record: tuple | None = self.find_record(product_id)
+        if record is None:
+            return None
+        start: int = self.product_offset + record[1]
+        end: int = start + record[2]
+        return self.buffer[start:end]
@@ -0,0 +1,307 @@
+import datetime
+import secrets
+import threading
+from collections import defaultdict
+from itertools import chain
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, router, transaction
+from django.db.models import F
+from rest_framework.settings import api_settings
+
+from answerking_app.models.models import CatalogGeneration, Category, Product
+from answerking_app.models.read_serializers import (
+    category_detail_representation,
+    category_representation,
+    product_representation,
+)
+from answerking_app.utils.catalog_file import (
+    MappedCatalog,
+    catalog_file_lock,
+    write_catalog_file,
+)
+from answerking_app.utils.fragment_cache import (
+    cached_fragments,
+    split_fragment,
+)
+from answerking_app.utils.response_cache import invalidate
+
+CATALOG_GENERATION_ID = 1
+PRODUCT_FIELDS: tuple[str, ...] = tuple(
+    field.attname for field in Product._meta.concrete_fields
+)
+ID_INDEX, NAME_INDEX, DESCRIPTION_INDEX, PRICE_INDEX, RETIRED_INDEX = (
+    PRODUCT_FIELDS.index(field)
+    for field in ("id", "name", "description", "price", "retired")
+)
+LAST_UPDATED_INDEX: int = PRODUCT_FIELDS.index("last_updated")
+# Argument order of category_representation.
+CATEGORY_FIELDS: tuple[str, ...] = (
+    "id",
+    "name",
+    "description",
+    "created_on",
+    "last_updated",
+    "retired",
+)
+
+
+class CatalogSnapshot(NamedTuple):
+    """Immutable copy of the menu taken at one catalog generation."""
+
+    generation: int | None
+    products: Mapping[int, tuple]
+    category_products: Mapping[int, tuple[int, ...]]
+    product_json: Mapping[int, bytes]
+    product_list_json: bytes
+    category_list_json: bytes
+    last_modified: datetime.datetime | None
+
+    def get_product_json(self, product_id: int) -> bytes | None:
+        return self.product_json.get(product_id)
+
+
+_snapshot: CatalogSnapshot | None = None
+_mapped: MappedCatalog | None = None
+_lock = threading.Lock()
+
+
+def current_generation(using: str | None = None) -> int | None:
+    return (
+        CatalogGeneration.objects.using(using)
+        .filter(pk=CATALOG_GENERATION_ID)
+        .values_list("generation", flat=True)
+        .first()
+    )
+
+
+async def acurrent_generation() -> int | None:
+    return (
+        await CatalogGeneration.objects.filter(pk=CATALOG_GENERATION_ID)
+        .values_list("generation", flat=True)
+        .afirst()
+    )
+
+
+def read_is_current() -> bool:
+    """Whether catalog reads of this request see the primary's latest data.
+
+    False while the replica the request reads from lags behind a write.
+    """
+    alias: str = router.db_for_read(CatalogGeneration)
+    if alias == DEFAULT_DB_ALIAS:
+        return True
+    return current_generation(alias) == current_generation(DEFAULT_DB_ALIAS)
+
+
+def create_catalog_generation(using: str = DEFAULT_DB_ALIAS):
+    """Create the generation row, which migration 0004 inserts.
+
+    Also run after `flush`, which empties the table. A random start keeps
+    a recreated row from repeating a generation that some process still
+    holds a snapshot of.
+    """
+    if not router.allow_migrate_model(using, CatalogGeneration):
+        return
+    tables: list[str] = connections[using].introspection.table_names()
+    if CatalogGeneration._meta.db_table not in tables:
+        return
+    CatalogGeneration.objects.using(using).get_or_create(
+        pk=CATALOG_GENERATION_ID,
+        defaults={"generation": secrets.randbits(62)},
+    )
+
+
+def rebuild_catalog_file():
+    get_catalog_snapshot()
+
+
+def bump_catalog_generation():
+    CatalogGeneration.objects.filter(pk=CATALOG_GENERATION_ID).update(
+        generation=F("generation") + 1
+    )
+    if not settings.CATALOG_SNAPSHOT_PATH:
+        return
+    # Rewrite the shared file here so other workers only have to remap,
+    # once per transaction however many rows it changes.
+    pending: list[tuple] = transaction.get_connection().run_on_commit
+    if all(entry[1] is not rebuild_catalog_file for entry in pending):
+        transaction.on_commit(rebuild_catalog_file)
+
+
+def catalog_changed(keys: list[str]):
+    """Start a new catalog generation and void the cached `keys`."""
+    bump_catalog_generation()
+    invalidate(keys)
+
+
+def build_snapshot(generation: int | None) -> CatalogSnapshot:
+    """Assemble the catalog JSON from per-row fragments.
+
+    Only rows whose values changed since their fragment was cached are
+    rendered again; the rest is byte concatenation.
+    """
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    with transaction.atomic(using=router.db_for_read(Product)):
+        product_rows: dict[int, tuple] = {
+            row[0]: row
+            for row in Product.objects.order_by("id").values_list(
+                *PRODUCT_FIELDS
+            )
+        }
+        category_rows: dict[int, tuple] = {
+            row[0]: row
+            for row in Category.objects.order_by("id").values_list(
+                *CATEGORY_FIELDS
+            )
+        }
+        links: list[tuple[int, int]] = list(
+            Category.products.through.objects.order_by(
+                "category_id", "product_id"
+            ).values_list("category_id", "product_id")
+        )
+    category_products: dict[int, list[int]] = defaultdict(list)
+    product_categories: dict[int, list[int]] = defaultdict(list)
+    for category_id, product_id in links:
+        category_products[category_id].append(product_id)
+        product_categories[product_id].append(category_id)
+
+    product_heads = cached_fragments(
+        "product",
+        product_rows,
+        lambda row: split_fragment(
+            renderer.render(
+                product_representation(
+                    row[ID_INDEX],
+                    row[NAME_INDEX],
+                    row[DESCRIPTION_INDEX],
+                    row[PRICE_INDEX],
+                    row[RETIRED_INDEX],
+                    [],
+                )
+            ),
+            "categories",
+        ),
+    )
+    category_details = cached_fragments(
+        "category_detail",
+        {key: row[:3] for key, row in category_rows.items()},
+        lambda row: renderer.render(category_detail_representation(*row)),
+    )
+    category_heads = cached_fragments(
+        "category",
+        category_rows,
+        lambda row: split_fragment(
+            renderer.render(category_representation(*row, [])), "products"
+        ),
+    )
+    product_json: dict[int, bytes] = {}
+    for product_id in product_rows:
+        head, tail = product_heads[product_id]
+        embedded_categories: bytes = b",".join(
+            category_details[category_id]
+            for category_id in product_categories[product_id]
+        )
+        product_json[product_id] = head + embedded_categories + tail
+    category_json: list[bytes] = []
+    for category_id in category_rows:
+        head, tail = category_heads[category_id]
+        product_ids: bytes = b",".join(
+            b"%d" % product_id for product_id in category_products[category_id]
+        )
+        category_json.append(head + product_ids + tail)
+    return CatalogSnapshot(
+        generation=generation,
+        products=MappingProxyType(product_rows),
+        product_json=MappingProxyType(product_json),
+        category_products=MappingProxyType(
+            {key: tuple(ids) for key, ids in category_products.items()}
+        ),
+        product_list_json=b"[" + b",".join(product_json.values()) + b"]",
+        category_list_json=b"[" + b",".join(category_json) + b"]",
+        last_modified=max(
+            chain(
+                (row[LAST_UPDATED_INDEX] for row in product_rows.values()),
+                (
+                    row[CATEGORY_FIELDS.index("last_updated")]
+                    for row in category_rows.values()
+                ),
+            ),
+            default=None,
+        ),
+    )
+
+
+def is_current(
+    catalog: CatalogSnapshot | MappedCatalog | None, generation: int | None
+) -> bool:
+    if generation is None or catalog is None:
+        return False
+    return catalog.generation == generation
+
+
+def get_catalog_snapshot() -> CatalogSnapshot | MappedCatalog:
+    """Return the catalog snapshot, rebuilding it if the catalog changed.
+
+    A fresh snapshot costs a single primary key lookup of the generation
+    row. Without that row, before migration 0004 ran, the snapshot is
+    rebuilt on every call. With CATALOG_SNAPSHOT_PATH set, the snapshot is
+    a file mapped by every worker instead of a copy per process.
+    """
+    global _snapshot
+    if settings.CATALOG_SNAPSHOT_PATH:
+        return get_mapped_catalog(settings.CATALOG_SNAPSHOT_PATH)
+    generation: int | None = current_generation()
+    if is_current(_snapshot, generation):
+        return _snapshot  # type: ignore[return-value]
+    with _lock:
+        if is_current(_snapshot, generation):
+            return _snapshot  # type: ignore[return-value]
+        snapshot: CatalogSnapshot = build_snapshot(generation)
+        if generation is not None:
+            _snapshot = snapshot
+        return snapshot
+
+
+async def aget_catalog_snapshot() -> CatalogSnapshot | MappedCatalog:
+    """get_catalog_snapshot for async views.
+
+    The generation is looked up with the async ORM, and only a rebuild or
+    a remap runs in a thread.
+    """
+    current: CatalogSnapshot | MappedCatalog | None = (
+        _mapped if settings.CATALOG_SNAPSHOT_PATH else _snapshot
+    )
+    if is_current(current, await acurrent_generation()):
+        return current  # type: ignore[return-value]
+    return await sync_to_async(get_catalog_snapshot)()
+
+
+def get_mapped_catalog(path: str) -> CatalogSnapshot | MappedCatalog:
+    global _mapped
+    generation: int | None = current_generation()
+    if is_current(_mapped, generation):
+        return _mapped  # type: ignore[return-value]
+    with _lock, catalog_file_lock(path):
+        # Another worker has usually rewritten the file already. The
+        # generation is read again, as it may have moved while waiting.
+        generation = current_generation()
+        mapped: MappedCatalog | None = MappedCatalog.open(path)
+        if is_current(mapped, generation):
+            _mapped = mapped
+            return mapped  # type: ignore[return-value]
+        snapshot: CatalogSnapshot = build_snapshot(generation)
+        if generation is None:
+            return snapshot
+        write_catalog_file(
+            path,
+            generation,
+            snapshot.last_modified,
+            snapshot.product_json.items(),
+            snapshot.category_list_json,
+        )
+        _mapped = MappedCatalog.open(path)
+        return _mapped or snapshot
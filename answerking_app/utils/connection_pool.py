@@ -0,0 +1,137 @@
+import logging
+import os
+import threading
+from typing import Any, Callable
+
+from django.db import OperationalError
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(OperationalError):
+    pass
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of raw database connections.
+
+    At most `max_size` connections are open at once. A checkout with none
+    idle and none left to open waits up to `timeout` seconds for a release.
+    Database connections are only used from sync code, including the
+    threads ASGI runs the ORM in, so blocking here never stalls the event
+    loop.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        timeout: float,
+        is_usable: Callable[[Any], bool] | None = None,
+    ):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.is_usable = is_usable
+        self.condition = threading.Condition()
+        self.idle: list[Any] = []
+        self.size = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.discarded = 0
+
+    def checkout(self, connect: Callable[[], Any]) -> Any:
+        with self.condition:
+            self.checkouts += 1
+            if not self.idle and self.size >= self.max_size:
+                self.waits += 1
+                if not self.condition.wait_for(
+                    lambda: self.idle or self.size < self.max_size,
+                    self.timeout,
+                ):
+                    self.timeouts += 1
+                    logger.warning(
+                        "Connection pool exhausted: %s", self.stats()
+                    )
+                    raise PoolTimeout(
+                        f"No database connection free after {self.timeout}s"
+                    )
+            # Reuse the most recently released connection, so rarely used
+            # ones are left to time out on the server.
+            connection: Any = self.idle.pop() if self.idle else None
+            self.size += connection is None
+        if connection is not None:
+            if self.is_usable is None or self.is_usable(connection):
+                return connection
+            self.close(connection)
+            with self.condition:
+                self.discarded += 1
+        try:
+            return connect()
+        except BaseException:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise
+
+    def release(self, connection: Any, reusable: bool = True):
+        with self.condition:
+            if reusable:
+                self.idle.append(connection)
+            else:
+                self.size -= 1
+                self.discarded += 1
+            self.condition.notify()
+        if not reusable:
+            self.close(connection)
+
+    @staticmethod
+    def close(connection: Any):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def stats(self) -> dict[str, int]:
+        with self.condition:
+            return {
+                "size": self.size,
+                "idle": len(self.idle),
+                "in_use": self.size - len(self.idle),
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "discarded": self.discarded,
+            }
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_pid: int = os.getpid()
+_pools_lock = threading.Lock()
+
+
+def get_pool(
+    alias: str,
+    max_size: int,
+    timeout: float,
+    is_usable: Callable[[Any], bool] | None = None,
+) -> ConnectionPool:
+    """The process-wide pool of a database alias.
+
+    Connections cannot be shared with a forked child, so a worker forked
+    after the pool was created starts its own.
+    """
+    global _pools_pid
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            _pools.clear()
+            _pools_pid = os.getpid()
+        if alias not in _pools:
+            _pools[alias] = ConnectionPool(max_size, timeout, is_usable)
+        return _pools[alias]
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """Metrics of every pool in this process, by database alias."""
+    with _pools_lock:
+        pools: dict[str, ConnectionPool] = dict(_pools)
+    return {alias: pool.stats() for alias, pool in pools.items()}
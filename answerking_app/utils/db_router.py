@@ -0,0 +1,82 @@
+import random
+import time
+from contextvars import ContextVar
+from typing import Callable
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpRequest, HttpResponse
+from rest_framework.permissions import SAFE_METHODS
+
+STICKY_COOKIE = "primary_until"
+
+# Alias reads of the current request go to, None outside of requests.
+read_alias: ContextVar[str | None] = ContextVar("read_alias", default=None)
+
+
+class ReplicaRouter:
+    """Send reads to the replica chosen for the request, writes to default.
+
+    Replicas are the aliases in settings.REPLICA_DATABASES. Without any, or
+    outside a request, every query goes to the primary.
+    """
+
+    def db_for_read(self, model, **hints) -> str | None:
+        return read_alias.get()
+
+    def db_for_write(self, model, **hints) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints) -> bool | None:
+        if db in settings.REPLICA_DATABASES:
+            return False
+        return None
+
+
+def is_sticky(request: HttpRequest) -> bool:
+    """Whether the client wrote recently enough that replicas may lag."""
+    try:
+        return time.time() < float(request.COOKIES.get(STICKY_COOKIE, 0))
+    except ValueError:
+        return False
+
+
+class ReplicaRoutingMiddleware:
+    """Pick the database a request reads from.
+
+    Safe requests read from one replica, chosen at random per request so
+    its reads are consistent with each other. Any other request, and every
+    request for REPLICA_STICKY_SECONDS after a successful one, uses the
+    primary so clients always read their own writes.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.REPLICA_DATABASES:
+            return self.get_response(request)
+        safe: bool = request.method in SAFE_METHODS
+        token = read_alias.set(
+            random.choice(settings.REPLICA_DATABASES)
+            if safe and not is_sticky(request)
+            else DEFAULT_DB_ALIAS
+        )
+        try:
+            response: HttpResponse = self.get_response(request)
+        finally:
+            read_alias.reset(token)
+        if not safe and response.status_code < 400:
+            window: int = settings.REPLICA_STICKY_SECONDS
+            response.set_cookie(
+                STICKY_COOKIE,
+                str(time.time() + window),
+                max_age=window,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -0,0 +1,217 @@
+from functools import lru_cache
+
+from rest_framework import serializers
+from rest_framework.request import Request
+
+FIELDS_PARAM = "fields"
+EXPAND_PARAM = "expand"
+
+# A serializer's fields, with the fields of nested serializers, or None
+# for plain fields.
+Schema = dict[str, "Schema | None"]
+
+
+def serializer_schema(serializer: serializers.BaseSerializer) -> Schema:
+    schema: Schema = {}
+    for name, field in serializer.fields.items():
+        if isinstance(field, serializers.ListSerializer):
+            field = field.child
+        schema[name] = (
+            serializer_schema(field)
+            if isinstance(field, serializers.BaseSerializer)
+            else None
+        )
+    return schema
+
+
+@lru_cache
+def schema_for(serializer_class: type[serializers.BaseSerializer]) -> Schema:
+    return serializer_schema(serializer_class())
+
+
+def parse_fields(value: str) -> Schema:
+    """Dotted paths to a tree, where None selects a field in full."""
+    tree: Schema = {}
+    for path in filter(None, (path.strip() for path in value.split(","))):
+        node: Schema | None = tree
+        *parents, leaf = path.split(".")
+        for name in parents:
+            if node.setdefault(name, {}) is None:
+                break
+            node = node[name]
+        else:
+            node[leaf] = None
+    return tree
+
+
+class FieldSelection:
+    """The part of a representation requested with ?fields= and ?expand=.
+
+    `fields` takes comma separated, dotted paths and drops everything not
+    on one of them. `expand` lists the related objects (nested objects with
+    an id) to embed, and the others are reduced to their ids. Naming fields
+    inside a related object expands it. Without either parameter the full
+    representation is returned.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        fields: Schema | None = None,
+        expand: set[str] | None = None,
+    ):
+        self.schema = schema
+        self.fields = fields
+        self.expand = expand
+        self.is_full: bool = fields is None and expand is None
+
+    @classmethod
+    def from_request(
+        cls,
+        request: Request,
+        serializer_class: type[serializers.BaseSerializer],
+    ) -> "FieldSelection":
+        params = request.query_params
+        if FIELDS_PARAM not in params and EXPAND_PARAM not in params:
+            return cls({})
+        schema: Schema = schema_for(serializer_class)
+        fields: Schema | None = None
+        expand: set[str] | None = None
+        errors: dict[str, list[str]] = {}
+        if FIELDS_PARAM in params:
+            fields = parse_fields(params[FIELDS_PARAM])
+            unknown: list[str] = cls.unknown_fields(fields, schema)
+            if unknown:
+                errors[FIELDS_PARAM] = [
+                    f"Unknown fields: {', '.join(unknown)}."
+                ]
+        if EXPAND_PARAM in params:
+            expand = {
+                path.strip()
+                for path in params[EXPAND_PARAM].split(",")
+                if path.strip()
+            }
+            unknown = sorted(
+                path for path in expand if not cls.is_relation(schema, path)
+            )
+            if unknown:
+                errors[EXPAND_PARAM] = [
+                    f"Cannot expand: {', '.join(unknown)}."
+                ]
+        if errors:
+            raise serializers.ValidationError(errors)
+        return cls(schema, fields, expand)
+
+    @classmethod
+    def unknown_fields(
+        cls, fields: Schema, schema: Schema | None, prefix: str = ""
+    ) -> list[str]:
+        unknown: list[str] = []
+        for name, children in fields.items():
+            if schema is None or name not in schema:
+                unknown.append(prefix + name)
+            elif children is not None:
+                unknown += cls.unknown_fields(
+                    children, schema[name], f"{prefix}{name}."
+                )
+        return unknown
+
+    @staticmethod
+    def node(tree: Schema | None, path: str) -> tuple[bool, Schema | None]:
+        """Whether the path is in the tree, and its subtree."""
+        for name in path.split("."):
+            if tree is None:
+                return True, None
+            if name not in tree:
+                return False, None
+            tree = tree[name]
+        return True, tree
+
+    @classmethod
+    def is_relation(cls, schema: Schema, path: str) -> bool:
+        found, node = cls.node(schema, path)
+        return found and node is not None and "id" in node
+
+    def collapses(self, path: str) -> bool:
+        if self.expand is None or not self.is_relation(self.schema, path):
+            return False
+        if any(
+            expanded == path or expanded.startswith(path + ".")
+            for expanded in self.expand
+        ):
+            return False
+        return self.node(self.fields, path)[1] is None
+
+    def renders(self, path: str) -> bool:
+        """Whether any of the field at the dotted path is returned."""
+        if not self.node(self.fields, path)[0]:
+            return False
+        names: list[str] = path.split(".")
+        return not any(
+            self.collapses(".".join(names[:depth]))
+            for depth in range(1, len(names))
+        )
+
+    def embeds(self, path: str) -> bool:
+        """Whether the related object at the path is returned in full."""
+        return self.renders(path) and not self.collapses(path)
+
+    def apply(self, data: dict) -> dict:
+        if self.is_full:
+            return data
+        return self.shape(data, self.fields, self.schema, "")
+
+    def shape(
+        self, data: dict, fields: Schema | None, schema: Schema, prefix: str
+    ) -> dict:
+        shaped: dict = {}
+        for name, value in data.items():
+            if fields is not None and name not in fields:
+                continue
+            children: Schema | None = schema.get(name)
+            if children is None or value is None:
+                shaped[name] = value
+                continue
+            path: str = prefix + name
+            if self.collapses(path):
+                shaped[name] = (
+                    [item["id"] for item in value]
+                    if isinstance(value, list)
+                    else value["id"]
+                )
+                continue
+            subfields: Schema | None = None if fields is None else fields[name]
+            shaped[name] = (
+                [
+                    self.shape(item, subfields, children, path + ".")
+                    for item in value
+                ]
+                if isinstance(value, list)
+                else self.shape(value, subfields, children, path + ".")
+            )
+        return shaped
+
+
+class SelectedFieldsSerializerMixin:
+    """Render only the fields selected by the view's FieldSelection.
+
+    Unselected fields, including nested serializers and their queries, are
+    skipped, the rest is shaped like the read serializers' output.
+    """
+
+    @property
+    def _readable_fields(self):
+        selection: FieldSelection | None = self.context.get("field_selection")
+        fields = super()._readable_fields
+        if selection is None or selection.is_full:
+            return fields
+        return (
+            field for field in fields if selection.renders(field.field_name)
+        )
+
+    def to_representation(self, instance) -> dict:
+        data: dict = super().to_representation(instance)
+        selection: FieldSelection | None = self.context.get("field_selection")
+        if selection is None:
+            return data
+        return selection.apply(data)
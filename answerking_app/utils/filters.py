@@ -0,0 +1,122 @@
+from django.db.models import QuerySet
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request
+
+SORT_PARAM = "sort"
+# Parameters read by pagination, streaming, content negotiation and the
+# field selection.
+RESERVED_PARAMS: set[str] = {
+    "cursor",
+    "pageSize",
+    "stream",
+    "format",
+    "fields",
+    "expand",
+}
+SCHEMA_TYPES: dict[type, dict] = {
+    serializers.BooleanField: {"type": "boolean"},
+    serializers.IntegerField: {"type": "integer"},
+    serializers.DecimalField: {"type": "number"},
+    serializers.DateTimeField: {"type": "string", "format": "date-time"},
+}
+
+
+class QueryParameterFilter(BaseFilterBackend):
+    """Filter and sort list views by validated query parameters.
+
+    The fields of the view's `filter_serializer_class` are the accepted
+    filters, each with the ORM lookup it translates to as its source.
+    `ordering_fields` maps the names accepted by ?sort= to model fields.
+    Both should only name indexed columns. Any other parameter is rejected
+    with a 400 before the view queries anything.
+    """
+
+    def get_filters(self, request: Request, view) -> dict:
+        serializer_class: type[
+            serializers.Serializer
+        ] = view.filter_serializer_class
+        params: dict[str, str] = request.query_params.dict()
+        known: set[str] = {
+            *serializer_class().fields,
+            *RESERVED_PARAMS,
+            SORT_PARAM,
+        }
+        unknown: list[str] = sorted(set(params).difference(known))
+        if unknown:
+            raise serializers.ValidationError(
+                {param: ["Unknown query parameter."] for param in unknown}
+            )
+        serializer = serializer_class(data=params)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    def get_ordering(self, request: Request, queryset: QuerySet, view):
+        # Also used by the cursor pagination to page in the same order.
+        sort: str | None = request.query_params.get(SORT_PARAM)
+        if not sort:
+            return ("id",)
+        if request.query_params.get("stream") == "true":
+            raise serializers.ValidationError(
+                {SORT_PARAM: ["Streamed lists are always sorted by id."]}
+            )
+        descending: bool = sort.startswith("-")
+        field: str | None = view.ordering_fields.get(sort.lstrip("-"))
+        if field is None:
+            choices: str = ", ".join(view.ordering_fields)
+            raise serializers.ValidationError(
+                {
+                    SORT_PARAM: [
+                        f"Must be one of: {choices}, optionally prefixed "
+                        "with -."
+                    ]
+                }
+            )
+        prefix: str = "-" if descending else ""
+        if field == "id":
+            return (prefix + field,)
+        return (prefix + field, prefix + "id")
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view
+    ) -> QuerySet:
+        filters: dict = self.get_filters(request, view)
+        if filters:
+            queryset = queryset.filter(**filters)
+        if SORT_PARAM in request.query_params:
+            queryset = queryset.order_by(
+                *self.get_ordering(request, queryset, view)
+            )
+        return queryset
+
+    def get_schema_operation_parameters(self, view) -> list[dict]:
+        parameters: list[dict] = [
+            {
+                "name": name,
+                "required": False,
+                "in": "query",
+                "description": str(field.help_text or ""),
+                "schema": SCHEMA_TYPES.get(type(field), {"type": "string"})
+                if not isinstance(field, serializers.ChoiceField)
+                else {"type": "string", "enum": list(field.choices)},
+            }
+            for name, field in view.filter_serializer_class().fields.items()
+        ]
+        parameters.append(
+            {
+                "name": SORT_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Field to sort by, prefixed with - for "
+                "descending order.",
+                "schema": {
+                    "type": "string",
+                    "enum": [
+                        prefix + name
+                        for name in view.ordering_fields
+                        for prefix in ("", "-")
+                    ],
+                },
+            }
+        )
+        return parameters
@@ -0,0 +1,52 @@
+import hashlib
+from typing import Callable
+
+from django.core.cache import caches
+
+FRAGMENT_CACHE_ALIAS = "fragments"
+
+
+def row_version(row: tuple) -> str:
+    """Version of a database row, changing whenever any of its values do."""
+    return hashlib.blake2b(repr(row).encode(), digest_size=8).hexdigest()
+
+
+def split_fragment(rendered: bytes, field: str) -> tuple[bytes, bytes]:
+    """Split a rendered object around its empty `field` array.
+
+    Strings are escaped in JSON, so `"field":[]` only matches the key
+    itself. The array contents are spliced between the two halves.
+    """
+    marker: bytes = b'"%s":[' % field.encode()
+    cut: int = rendered.index(marker + b"]") + len(marker)
+    return rendered[:cut], rendered[cut:]
+
+
+def cached_fragments(
+    kind: str,
+    rows: dict[int, tuple],
+    render: Callable[[tuple], bytes | tuple[bytes, bytes]],
+) -> dict[int, bytes | tuple[bytes, bytes]]:
+    """Rendered fragment of every row, re-rendering only rows not cached.
+
+    Fragments are keyed by kind, id and row version, so a changed row gets
+    a new key instead of invalidating anything.
+    """
+    fragment_cache = caches[FRAGMENT_CACHE_ALIAS]
+    keys: dict[str, int] = {
+        f"fragment:{kind}:{object_id}:{row_version(row)}": object_id
+        for object_id, row in rows.items()
+    }
+    fragments: dict[int, bytes | tuple[bytes, bytes]] = {
+        keys[key]: fragment
+        for key, fragment in fragment_cache.get_many(list(keys)).items()
+    }
+    rendered: dict[str, bytes | tuple[bytes, bytes]] = {
+        key: render(rows[object_id])
+        for key, object_id in keys.items()
+        if object_id not in fragments
+    }
+    if rendered:
+        fragment_cache.set_many(rendered)
+        fragments.update({keys[key]: value for key, value in rendered.items()})
+    return fragments
@@ -0,0 +1,50 @@
+import datetime
+from abc import abstractmethod
+
+from django.db.models import QuerySet
+from django.http import Http404, HttpResponseBase
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from answerking_app.models.read_serializers import ReadSerializer
+from answerking_app.utils.mixins.FastReadMixins import FastRetrieveMixin
+
+
+class ArchiveFallbackRetrieveMixin(FastRetrieveMixin):
+    """Retrieve from the archive tables when the object is not live.
+
+    The live lookup runs first, so only requests for archived objects pay
+    for the second lookup. Validators then come from the archive querysets.
+    """
+
+    archive_queryset: QuerySet
+    archive_read_serializer_class: type[ReadSerializer]
+    archived: bool = False
+
+    @abstractmethod
+    def get_archive_version_querysets(self) -> list[tuple[QuerySet, str]]:
+        ...
+
+    def retrieve(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            self.archived = True
+            return self.conditional_response(request, self.archive_response)
+
+    def get_validators(self) -> tuple[str, datetime.datetime | None]:
+        if self.archived:
+            return self.validators_for(self.get_archive_version_querysets())
+        return super().get_validators()
+
+    def archive_response(self) -> Response:
+        lookup_url_kwarg: str = self.lookup_url_kwarg or self.lookup_field
+        data: list[dict] = self.archive_read_serializer_class(
+            self.archive_queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            ),
+            self.get_field_selection(),
+        ).data
+        if not data:
+            raise Http404
+        return Response(data[0])
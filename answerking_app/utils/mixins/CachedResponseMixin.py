@@ -0,0 +1,84 @@
+from wsgiref.util import is_hop_by_hop
+
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+from answerking_app.utils.catalog_snapshot import read_is_current
+from answerking_app.utils.response_cache import (
+    get_cached,
+    is_plain_json_get,
+    response_cache_key,
+    set_cached,
+)
+
+# Headers that describe one exchange rather than the resource.
+PER_REQUEST_HEADERS = frozenset({"content-length", "date", "set-cookie"})
+
+
+class CachedResponseMixin:
+    """Serve plain GET requests from the rendered response cache.
+
+    Only requests without query parameters that accept JSON are cached, and
+    a hit returns the stored bytes, or a 304 when the stored validators
+    match, before any view code or query runs. Entries are voided by the
+    signal handlers in answerking_app.signals, and are not stored while the
+    request's read replica is behind the primary.
+    """
+
+    def dispatch(self, request: HttpRequest, *args, **kwargs):
+        if not is_plain_json_get(request):
+            return super().dispatch(request, *args, **kwargs)
+        key: str = response_cache_key(request.path)
+        # The version is read before the response is built, so a write that
+        # commits meanwhile voids the entry stored below.
+        cached, version = get_cached(key)
+        if cached is not None:
+            if hasattr(request, "session"):
+                # A miss authenticates from the session, for which
+                # SessionMiddleware adds "Vary: Cookie". So does a hit.
+                request.session.accessed = True
+            return self.cached_response(request, *cached)
+        response = super().dispatch(request, *args, **kwargs)
+        if isinstance(response, Response):
+            response.render()
+        if self.is_cacheable(response):
+            headers: dict[str, str] = {
+                header: value
+                for header, value in response.items()
+                if not is_cached_header_excluded(header)
+            }
+            set_cached(key, version, response.content, headers)
+        return response
+
+    @staticmethod
+    def is_cacheable(response: HttpResponse) -> bool:
+        if response.status_code != status.HTTP_200_OK or response.streaming:
+            return False
+        if not response["Content-Type"].startswith("application/json"):
+            return False
+        # A lagging replica's response would outlive the invalidation.
+        return read_is_current()
+
+    @staticmethod
+    def cached_response(
+        request: HttpRequest, content: bytes, headers: dict[str, str]
+    ) -> HttpResponse:
+        last_modified: str | None = headers.get("Last-Modified")
+        not_modified = get_conditional_response(
+            request,
+            etag=headers.get("ETag"),
+            last_modified=last_modified and parse_http_date(last_modified),
+        )
+        if not_modified is not None:
+            return not_modified
+        response = HttpResponse(content)
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+
+def is_cached_header_excluded(header: str) -> bool:
+    return is_hop_by_hop(header) or header.lower() in PER_REQUEST_HEADERS
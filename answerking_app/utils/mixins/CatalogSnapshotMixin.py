@@ -0,0 +1,63 @@
+import datetime
+
+from django.http import Http404, HttpResponse
+from django.utils.http import quote_etag
+from rest_framework.response import Response
+
+from answerking_app.utils.catalog_file import MappedCatalog
+from answerking_app.utils.catalog_snapshot import (
+    CatalogSnapshot,
+    get_catalog_snapshot,
+)
+from answerking_app.utils.mixins.FastReadMixins import (
+    FastListMixin,
+    FastReadMixin,
+    FastRetrieveMixin,
+)
+from answerking_app.utils.response_cache import is_plain_json_get
+
+
+class CatalogSnapshotReadMixin(FastReadMixin):
+    """Serve plain GET requests from the pre-rendered catalog snapshot.
+
+    The snapshot generation doubles as the ETag, so a request costs one
+    lookup of the generation row. Other requests, such as paginated or
+    streamed lists, go through the FastReadMixins.
+    """
+
+    snapshot: CatalogSnapshot | MappedCatalog
+
+    def get_validators(self) -> tuple[str, datetime.datetime | None]:
+        self.snapshot = get_catalog_snapshot()
+        if self.snapshot.generation is None:
+            return super().get_validators()
+        return (
+            quote_etag(f"catalog-{self.snapshot.generation}"),
+            self.snapshot.last_modified,
+        )
+
+
+class CatalogSnapshotListMixin(CatalogSnapshotReadMixin, FastListMixin):
+    snapshot_json_field: str
+
+    def list_response(self) -> Response | HttpResponse:
+        if not is_plain_json_get(self.request):
+            return super().list_response()
+        return HttpResponse(
+            getattr(self.snapshot, self.snapshot_json_field),
+            content_type="application/json",
+        )
+
+
+class ProductSnapshotRetrieveMixin(
+    CatalogSnapshotReadMixin, FastRetrieveMixin
+):
+    def retrieve_response(self) -> Response | HttpResponse:
+        if not is_plain_json_get(self.request):
+            return super().retrieve_response()
+        data: bytes | None = self.snapshot.get_product_json(
+            int(self.kwargs["pk"])
+        )
+        if data is None:
+            raise Http404
+        return HttpResponse(data, content_type="application/json")
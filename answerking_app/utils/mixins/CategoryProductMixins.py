@@ -1,20 +1,28 @@
 from django.db.models import QuerySet
+from django.http import HttpResponseBase
 from rest_framework import status
-from rest_framework.request import Request
 from rest_framework.response import Response
 
 from answerking_app.models.models import Product
-from answerking_app.models.serializers import ProductSerializer
+from answerking_app.models.read_serializers import ProductReadSerializer
 from answerking_app.utils.mixins.ApiExceptions import ProblemDetails
+from answerking_app.utils.mixins.ConditionalGetMixin import (
+    ConditionalGetMixin,
+)
 
 
-class CategoryProductListMixin:
-    def list(self, **kwargs) -> Response:
+class CategoryProductListMixin(ConditionalGetMixin):
+    def list(self, **kwargs) -> HttpResponseBase:
+        return self.conditional_response(
+            self.request, lambda: self.list_response(**kwargs)
+        )
+
+    def list_response(self, **kwargs) -> Response:
         products: QuerySet[Product] = Product.objects.filter(
             category__id=kwargs["pk"]
         )
-        if not products:
+        response: list[dict] = ProductReadSerializer(products).data
+        if not response:
             raise ProblemDetails(status=status.HTTP_404_NOT_FOUND)
-        response = ProductSerializer(products, many=True).data
 
         return Response(response, status=status.HTTP_200_OK)
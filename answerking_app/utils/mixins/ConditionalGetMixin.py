@@ -0,0 +1,114 @@
+import datetime
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.request import Request
+
+from answerking_app.utils.response_cache import is_plain_json_get
+
+
+class ConditionalGetMixin(ABC):
+    """ETag and Last-Modified validators for plain GET requests.
+
+    Views return the querysets their representation is built from, each with
+    the column that changes on every write (last_updated, or the id of
+    append-only link rows). The validators come from one COUNT/MAX
+    aggregate per queryset, so a matching If-None-Match or
+    If-Modified-Since is answered with a 304 without running serializers.
+    """
+
+    @abstractmethod
+    def get_version_querysets(self) -> list[tuple[QuerySet, str]]:
+        ...
+
+    def get_validators(self) -> tuple[str, datetime.datetime | None]:
+        return self.validators_for(self.get_version_querysets())
+
+    @staticmethod
+    def validators_for(
+        version_querysets: list[tuple[QuerySet, str]]
+    ) -> tuple[str, datetime.datetime | None]:
+        return validators_from(
+            [
+                (queryset, queryset.aggregate(**version_aggregate(field)))
+                for queryset, field in version_querysets
+            ]
+        )
+
+    def conditional_response(
+        self, request: Request, respond: Callable[[], HttpResponseBase]
+    ) -> HttpResponseBase:
+        if not is_plain_json_get(request):
+            return respond()
+        etag, last_modified = self.get_validators()
+        response: HttpResponseBase | None = not_modified(
+            request, etag, last_modified
+        )
+        if response is not None:
+            return response
+        return with_validators(respond(), etag, last_modified)
+
+
+def version_aggregate(field: str) -> dict:
+    return {"count": Count("pk"), "version": Max(field)}
+
+
+async def avalidators_for(
+    version_querysets: list[tuple[QuerySet, str]]
+) -> tuple[str, datetime.datetime | None]:
+    """ConditionalGetMixin.validators_for with the async ORM."""
+    return validators_from(
+        [
+            (queryset, await queryset.aaggregate(**version_aggregate(field)))
+            for queryset, field in version_querysets
+        ]
+    )
+
+
+def validators_from(
+    aggregates: list[tuple[QuerySet, dict]]
+) -> tuple[str, datetime.datetime | None]:
+    versions: list[str] = []
+    last_modified: datetime.datetime | None = None
+    for queryset, aggregate in aggregates:
+        version = aggregate["version"]
+        versions.append(
+            f"{queryset.model._meta.label}:{aggregate['count']}:{version}"
+        )
+        if isinstance(version, datetime.datetime):
+            last_modified = max(version, last_modified or version)
+    digest: str = hashlib.sha1("|".join(versions).encode()).hexdigest()
+    return quote_etag(digest), last_modified
+
+
+def not_modified(
+    request: HttpRequest, etag: str, last_modified: datetime.datetime | None
+) -> HttpResponseBase | None:
+    """The 304 answering the request's preconditions, if they match."""
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp())
+        if last_modified
+        else None,
+    )
+
+
+def with_validators(
+    response: HttpResponseBase,
+    etag: str,
+    last_modified: datetime.datetime | None,
+) -> HttpResponseBase:
+    if response.status_code == status.HTTP_200_OK:
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(
+                int(last_modified.timestamp())
+            )
+    return response
@@ -0,0 +1,72 @@
+from django.db.models import QuerySet
+from django.http import Http404, HttpResponseBase
+from rest_framework import mixins
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from answerking_app.models.read_serializers import ReadSerializer
+from answerking_app.utils.mixins.ConditionalGetMixin import (
+    ConditionalGetMixin,
+)
+from answerking_app.utils.mixins.FieldSelectionMixin import (
+    FieldSelectionMixin,
+)
+from answerking_app.utils.mixins.StreamingListMixin import (
+    StreamingListMixin,
+)
+
+
+class FastReadMixin(FieldSelectionMixin, ConditionalGetMixin):
+    read_serializer_class: type[ReadSerializer]
+
+    def read_data(self, queryset: QuerySet) -> list[dict]:
+        return self.read_serializer_class(
+            queryset, self.get_field_selection()
+        ).data
+
+
+class FastListMixin(FastReadMixin, StreamingListMixin):
+    def list(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        if request.query_params.get("stream") == "true":
+            return super().list(request, *args, **kwargs)
+        return self.conditional_response(request, self.list_response)
+
+    def list_response(self) -> Response:
+        queryset: QuerySet = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset.prefetch_related(None))
+        if page is not None:
+            if not queryset.ordered:
+                queryset = queryset.order_by("pk")
+            return self.get_paginated_response(
+                self.read_data(
+                    queryset.filter(pk__in=[item.pk for item in page])
+                )
+            )
+        return Response(self.read_data(queryset))
+
+    def serialize_chunk(self, queryset: QuerySet) -> list:
+        # Shaped in shape_chunk, after the stream has read the ids.
+        return self.read_serializer_class(
+            queryset, self.get_field_selection()
+        ).representations()
+
+    def shape_chunk(self, data: list) -> list:
+        selection = self.get_field_selection()
+        return [selection.apply(item) for item in data]
+
+
+class FastRetrieveMixin(FastReadMixin, mixins.RetrieveModelMixin):
+    def retrieve(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        return self.conditional_response(request, self.retrieve_response)
+
+    def retrieve_response(self) -> Response:
+        lookup_url_kwarg: str = self.lookup_url_kwarg or self.lookup_field
+        queryset: QuerySet = self.filter_queryset(self.get_queryset())
+        data: list[dict] = self.read_data(
+            queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        )
+        if not data:
+            raise Http404
+        return Response(data[0])
@@ -0,0 +1,23 @@
+from answerking_app.utils.field_selection import FieldSelection
+
+
+class FieldSelectionMixin:
+    """Select the fields to render with ?fields= and ?expand=.
+
+    The selection is parsed once per request, against the fields of the
+    view's serializer, and passed to its serializers in their context.
+    """
+
+    field_selection: FieldSelection
+
+    def get_field_selection(self) -> FieldSelection:
+        if not hasattr(self, "field_selection"):
+            self.field_selection = FieldSelection.from_request(
+                self.request, self.get_serializer_class()
+            )
+        return self.field_selection
+
+    def get_serializer_context(self) -> dict:
+        return super().get_serializer_context() | {
+            "field_selection": self.get_field_selection()
+        }
@@ -0,0 +1,145 @@
+import datetime
+import json
+from typing import Iterable, Iterator
+
+from django.db.models import QuerySet
+from django.http import HttpResponse
+from django.utils.http import quote_etag
+from rest_framework.response import Response
+
+from answerking_app.models.models import OrderDocument
+from answerking_app.utils.field_selection import FieldSelection
+from answerking_app.utils.fragment_cache import split_fragment
+from answerking_app.utils.mixins.ArchiveFallbackMixin import (
+    ArchiveFallbackRetrieveMixin,
+)
+from answerking_app.utils.mixins.FastReadMixins import FastListMixin
+from answerking_app.utils.order_documents import with_missing_documents
+
+
+def document_data(documents: Iterable[bytes]) -> list[dict]:
+    """Parsed documents, for renderers other than JSON."""
+    return [json.loads(bytes(document)) for document in documents]
+
+
+def document_etag(pk: int | str, last_updated: datetime.datetime) -> str:
+    version: int = int(last_updated.timestamp() * 1000000)
+    return quote_etag(f"order-{pk}-{version}")
+
+
+class OrderDocumentListMixin(FastListMixin):
+    """Serve order lists by concatenating the stored order documents.
+
+    The view's queryset still decides which orders are listed, in which
+    order, and paginates them, only the representation comes from
+    OrderDocument. Orders without a document are rendered from the live
+    tables.
+    """
+
+    @staticmethod
+    def documents(queryset: QuerySet) -> QuerySet:
+        """`(order id, document)` rows, the document None if not stored."""
+        if not queryset.ordered:
+            queryset = queryset.order_by("pk")
+        return queryset.prefetch_related(None).values_list(
+            "pk", "document__document"
+        )
+
+    def list_response(self) -> Response | HttpResponse:
+        queryset: QuerySet = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset.prefetch_related(None))
+        if page is None:
+            documents: list[bytes] = with_missing_documents(
+                self.documents(queryset)
+            )
+        else:
+            by_id: dict[int, bytes] = dict(
+                OrderDocument.objects.filter(
+                    pk__in=[order.id for order in page]
+                ).values_list("pk", "document")
+            )
+            documents = with_missing_documents(
+                (order.id, by_id.get(order.id)) for order in page
+            )
+        renderer = self.request.accepted_renderer
+        selection: FieldSelection = self.get_field_selection()
+        if renderer.format != "json" or not selection.is_full:
+            data: list[dict] = [
+                selection.apply(item) for item in document_data(documents)
+            ]
+            if page is None:
+                return Response(data)
+            return self.get_paginated_response(data)
+        body: bytes = b",".join(bytes(document) for document in documents)
+        if page is None:
+            return HttpResponse(
+                b"[" + body + b"]", content_type="application/json"
+            )
+        head, tail = split_fragment(
+            renderer.render(self.get_paginated_response([]).data), "results"
+        )
+        return HttpResponse(
+            head + body + tail, content_type="application/json"
+        )
+
+    def stream_list(self, queryset: QuerySet) -> Iterator[bytes]:
+        documents: QuerySet = self.documents(queryset.order_by("pk"))
+        selection: FieldSelection = self.get_field_selection()
+        renderer = self.get_renderers()[0]
+        separator: bytes = b""
+        last_id: int = 0
+        yield b"["
+        while True:
+            chunk_size: int = self.stream_chunk_size
+            rows: list[tuple[int, bytes | None]] = list(
+                documents.filter(pk__gt=last_id)[:chunk_size]
+            )
+            if not rows:
+                break
+            chunk: list[bytes] = with_missing_documents(rows)
+            if selection.is_full:
+                body: bytes = b",".join(chunk)
+            else:
+                body = renderer.render(
+                    [selection.apply(item) for item in document_data(chunk)]
+                )[1:-1]
+            if body:
+                yield separator + body
+                separator = b","
+            last_id = rows[-1][0]
+        yield b"]"
+
+
+class OrderDocumentRetrieveMixin(ArchiveFallbackRetrieveMixin):
+    """Serve an order from its stored document with one primary key lookup.
+
+    Orders without a document, such as ones written before the documents
+    were backfilled, are read from the live and then the archive tables.
+    """
+
+    document_row: tuple[bytes, datetime.datetime] | None
+
+    def get_document(self) -> tuple[bytes, datetime.datetime] | None:
+        if not hasattr(self, "document_row"):
+            self.document_row = (
+                OrderDocument.objects.filter(pk=self.kwargs["pk"])
+                .values_list("document", "last_updated")
+                .first()
+            )
+        return self.document_row
+
+    def get_validators(self) -> tuple[str, datetime.datetime | None]:
+        row = None if self.archived else self.get_document()
+        if row is None:
+            return super().get_validators()
+        return document_etag(self.kwargs["pk"], row[1]), row[1]
+
+    def retrieve_response(self) -> Response | HttpResponse:
+        row = self.get_document()
+        if row is None:
+            return super().retrieve_response()
+        selection: FieldSelection = self.get_field_selection()
+        renderer = self.request.accepted_renderer
+        if renderer.format != "json" or not selection.is_full:
+            return Response(selection.apply(json.loads(bytes(row[0]))))
+        return HttpResponse(bytes(row[0]), content_type="application/json")
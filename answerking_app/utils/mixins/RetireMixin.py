@@ -1,54 +1,114 @@
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+from django.http import Http404
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.exceptions import ParseError
 from rest_framework.generics import GenericAPIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from answerking_app.models.models import Category, Product, Order, LineItem
+from answerking_app.models.models import Category, Product, Order
+from answerking_app.utils.catalog_snapshot import catalog_changed
 from answerking_app.utils.mixins.ApiExceptions import ProblemDetails
+from answerking_app.utils.order_documents import write_order_documents
+from answerking_app.utils.response_cache import catalog_keys
 
 
 class RetireMixin(GenericAPIView):
+    """Retire with one conditional UPDATE, which also skips the signals.
+
+    The row count tells a retirement apart from a refusal, and only a
+    refusal reads the row again to pick the error. Cache invalidation
+    usually done by the post_save handlers is done here instead.
+    """
+
     def retire(self, request: Request, *args, **kwargs) -> Response:
-        instance: Category | Product = self.get_object()
-        if instance.retired:
-            raise ProblemDetails(
-                status=status.HTTP_410_GONE,
-                detail="This object has already been retired",
+        pk = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        model: type[Category] | type[Product] = self.get_queryset().model
+        if model is Category:
+            retiring: QuerySet = Category.objects.filter(pk=pk)
+        elif model is Product:
+            retiring = Product.objects.filter(pk=pk).exclude(
+                Exists(active_orders_with(OuterRef("pk")))
             )
-        if isinstance(instance, Category):
-            instance.retired = True
-            instance.save()
-        elif isinstance(instance, Product):
-            product_active_order_check(instance)
-            instance.retired = True
-            instance.save()
         else:
             raise ParseError
+        with transaction.atomic():
+            retired: int = retiring.filter(retired=False).update(
+                retired=True, last_updated=timezone.now()
+            )
+            if retired:
+                catalog_changed(retired_keys(model, pk))
+        if not retired:
+            raise_retire_refusal(model, pk)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class CancelOrderMixin(GenericAPIView):
     def cancel_order(self, request: Request, *args, **kwargs) -> Response:
-        instance: Order = self.get_object()
-        if instance.order_status == "Cancelled":
-            raise ProblemDetails(
-                status=status.HTTP_400_BAD_REQUEST,
-                detail="This order has already been cancelled",
+        pk = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        with transaction.atomic():
+            cancelled: int = (
+                Order.objects.filter(pk=pk)
+                .exclude(order_status=Order.Status.CANCELLED)
+                .update(
+                    order_status=Order.Status.CANCELLED,
+                    last_updated=timezone.now(),
+                )
             )
-        instance.order_status = "Cancelled"
-        instance.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+            if cancelled:
+                write_order_documents([pk])
+        if cancelled:
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        if not Order.objects.filter(pk=pk).exists():
+            raise Http404
+        raise ProblemDetails(
+            status=status.HTTP_400_BAD_REQUEST,
+            detail="This order has already been cancelled",
+        )
+
+
+def active_orders_with(product) -> QuerySet[Order]:
+    return Order.objects.filter(
+        order_status=Order.Status.CREATED, lineitem__product=product
+    )
 
 
 def product_active_order_check(instance: Product):
-    existing_order_products: QuerySet[LineItem] = LineItem.objects.filter(
-        product=instance.id
+    if active_orders_with(instance.id).exists():
+        raise ProblemDetails(
+            status=status.HTTP_400_BAD_REQUEST,
+            detail="This product is in an active order",
+        )
+
+
+def retired_keys(model: type[Category] | type[Product], pk) -> list[str]:
+    if model is Category:
+        # Products embed their categories, so every product list is stale.
+        return catalog_keys(
+            products=True, categories=True, category_ids={int(pk)}
+        )
+    return catalog_keys(
+        products=True,
+        category_ids=set(
+            Category.objects.filter(products=pk).values_list("id", flat=True)
+        ),
+    )
+
+
+def raise_retire_refusal(model: type[Category] | type[Product], pk):
+    retired: bool | None = (
+        model.objects.filter(pk=pk).values_list("retired", flat=True).first()
+    )
+    if retired is None:
+        raise Http404
+    if retired:
+        raise ProblemDetails(
+            status=status.HTTP_410_GONE,
+            detail="This object has already been retired",
+        )
+    raise ProblemDetails(
+        status=status.HTTP_400_BAD_REQUEST,
+        detail="This product is in an active order",
     )
-    for order_product in existing_order_products:
-        if order_product.order.order_status == "Created":
-            raise ProblemDetails(
-                status=status.HTTP_400_BAD_REQUEST,
-                detail="This product is in an active order",
-            )
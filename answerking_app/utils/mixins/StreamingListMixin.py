@@ -0,0 +1,45 @@
+from typing import Iterator
+
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework import mixins
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+class StreamingListMixin(mixins.ListModelMixin):
+    stream_chunk_size: int = 500
+
+    def list(
+        self, request: Request, *args, **kwargs
+    ) -> Response | StreamingHttpResponse:
+        if request.query_params.get("stream") != "true":
+            return super().list(request, *args, **kwargs)
+        queryset: QuerySet = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(
+            self.stream_list(queryset), content_type="application/json"
+        )
+
+    def stream_list(self, queryset: QuerySet) -> Iterator[bytes]:
+        renderer = self.get_renderers()[0]
+        separator: bytes = b""
+        last_id: int = 0
+        yield b"["
+        while True:
+            data: list = self.serialize_chunk(
+                queryset.filter(pk__gt=last_id).order_by("pk")[
+                    : self.stream_chunk_size
+                ]
+            )
+            if not data:
+                break
+            last_id = data[-1]["id"]
+            yield separator + renderer.render(self.shape_chunk(data))[1:-1]
+            separator = b","
+        yield b"]"
+
+    def serialize_chunk(self, queryset: QuerySet) -> list:
+        return self.get_serializer(queryset, many=True).data
+
+    def shape_chunk(self, data: list) -> list:
+        return data
@@ -0,0 +1,83 @@
+import datetime
+import time
+
+from django.db import connection, transaction
+
+from answerking_app.models.models import (
+    ArchivedLineItem,
+    ArchivedOrder,
+    LineItem,
+    Order,
+)
+from answerking_app.utils.order_documents import touch_order_list_version
+
+ARCHIVED_STATUSES: list[str] = [Order.Status.PAID, Order.Status.CANCELLED]
+
+
+def archive_batch(created_before: datetime.datetime, batch_size: int) -> int:
+    """Move up to `batch_size` closed orders into the archive tables.
+
+    The batch is locked for its own short transaction only, and rows
+    another transaction holds are skipped where the database supports it,
+    so live order updates are never kept waiting for long.
+    """
+    with transaction.atomic():
+        orders: list[Order] = list(
+            Order.objects.select_for_update(
+                skip_locked=connection.features.has_select_for_update_skip_locked
+            )
+            .filter(
+                order_status__in=ARCHIVED_STATUSES,
+                created_on__lt=created_before,
+            )
+            .order_by("id")[:batch_size]
+        )
+        if not orders:
+            return 0
+        order_ids: list[int] = [order.id for order in orders]
+        line_items: list[LineItem] = list(
+            LineItem.objects.filter(order_id__in=order_ids)
+        )
+        ArchivedOrder.objects.bulk_create(
+            ArchivedOrder(
+                id=order.id,
+                order_status=order.order_status,
+                order_total=order.order_total,
+                created_on=order.created_on,
+                last_updated=order.last_updated,
+            )
+            for order in orders
+        )
+        ArchivedLineItem.objects.bulk_create(
+            ArchivedLineItem(
+                id=line_item.id,
+                order_id=line_item.order_id,
+                product_id=line_item.product_id,
+                quantity=line_item.quantity,
+                sub_total=line_item.sub_total,
+            )
+            for line_item in line_items
+        )
+        LineItem.objects.filter(order_id__in=order_ids).delete()
+        Order.objects.filter(id__in=order_ids).delete()
+        touch_order_list_version()
+    return len(orders)
+
+
+def archive_orders(
+    created_before: datetime.datetime,
+    batch_size: int = 1000,
+    pause: float = 0.0,
+) -> int:
+    """Archive every closed order created before `created_before`.
+
+    Sleeps `pause` seconds between batches to leave the tables to other
+    writers. Returns the number of orders archived.
+    """
+    archived: int = 0
+    while True:
+        count: int = archive_batch(created_before, batch_size)
+        archived += count
+        if count < batch_size:
+            return archived
+        time.sleep(pause)
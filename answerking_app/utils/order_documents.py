@@ -0,0 +1,112 @@
+from typing import Iterable
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections, router
+from django.utils import timezone
+from rest_framework.settings import api_settings
+
+from answerking_app.models.models import (
+    Order,
+    OrderDocument,
+    OrderListVersion,
+)
+from answerking_app.models.read_serializers import OrderReadSerializer
+
+REBUILD_BATCH_SIZE = 1000
+ORDER_LIST_VERSION_ID = 1
+
+
+def create_order_list_version(using: str = DEFAULT_DB_ALIAS):
+    """Create the version row, which migration 0009 inserts.
+
+    Also run after `flush`, which empties the table.
+    """
+    if not router.allow_migrate_model(using, OrderListVersion):
+        return
+    tables: list[str] = connections[using].introspection.table_names()
+    if OrderListVersion._meta.db_table in tables:
+        OrderListVersion.objects.using(using).get_or_create(
+            pk=ORDER_LIST_VERSION_ID
+        )
+
+
+def touch_order_list_version():
+    """Change the validators of the order list.
+
+    Called last in order writes, so the row is only locked for the rest
+    of the transaction.
+    """
+    OrderListVersion.objects.filter(pk=ORDER_LIST_VERSION_ID).update(
+        last_updated=timezone.now()
+    )
+
+
+def render_order_documents(order_ids: Iterable[int]) -> dict[int, bytes]:
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    return {
+        data["id"]: renderer.render(data)
+        for data in OrderReadSerializer(
+            Order.objects.filter(id__in=list(order_ids))
+        ).data
+    }
+
+
+def with_missing_documents(
+    rows: Iterable[tuple[int, bytes | None]]
+) -> list[bytes]:
+    """The documents of `(order id, document)` rows, in order.
+
+    Orders without a stored document, such as ones written before the
+    documents were backfilled, are rendered from the live tables.
+    """
+    rows = list(rows)
+    rendered: dict[int, bytes] = {}
+    missing: list[int] = [pk for pk, document in rows if document is None]
+    if missing:
+        rendered = render_order_documents(missing)
+    return [
+        rendered[pk] if document is None else bytes(document)
+        for pk, document in rows
+        if document is not None or pk in rendered
+    ]
+
+
+def write_order_documents(order_ids: Iterable[int]):
+    """Render the orders and store the result as their read documents.
+
+    Called in the same transaction as the order write, so the document
+    never disagrees with the committed order.
+    """
+    documents: dict[int, bytes] = render_order_documents(order_ids)
+    now = timezone.now()
+    OrderDocument.objects.bulk_create(
+        [
+            OrderDocument(
+                order_id=order_id, document=document, last_updated=now
+            )
+            for order_id, document in documents.items()
+        ],
+        update_conflicts=True,
+        # MySQL upserts on any unique key and takes no conflict target.
+        unique_fields=["order"]
+        if connection.features.supports_update_conflicts_with_target
+        else None,
+        update_fields=["document", "last_updated"],
+    )
+    touch_order_list_version()
+
+
+def rebuild_order_documents(batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """Re-render the documents of every order, returning how many."""
+    last_id: int = 0
+    rebuilt: int = 0
+    while True:
+        order_ids: list[int] = list(
+            Order.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not order_ids:
+            return rebuilt
+        write_order_documents(order_ids)
+        rebuilt += len(order_ids)
+        last_id = order_ids[-1]
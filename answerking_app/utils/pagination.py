@@ -0,0 +1,29 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """Opt-in cursor pagination ordered on the primary key.
+
+    Set as `pagination_class` on the list views that page. They return the
+    full list unless the request carries a cursor or page size, so existing
+    clients keep receiving plain arrays.
+    Pages are fetched with `WHERE id > cursor` rather than OFFSET.
+    """
+
+    ordering = "id"
+    page_size_query_param = "pageSize"
+
+    def __init__(self):
+        # Read per paginator, so the sizes follow the current settings.
+        self.page_size: int = settings.PAGE_SIZE
+        self.max_page_size: int = settings.MAX_PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        requested: set[str] = {
+            self.cursor_query_param,
+            self.page_size_query_param,
+        }
+        if requested.isdisjoint(request.query_params):
+            return None
+        return super().paginate_queryset(queryset, request, view)
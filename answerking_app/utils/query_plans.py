@@ -0,0 +1,87 @@
+import re
+
+from django.db import connection
+
+# Table references in Django SQL, optionally followed by a subquery alias.
+TABLE_REFERENCE = re.compile(r"[`\"](\w+)[`\"](?: (?:AS )?(U\d+))?")
+EXPLAINABLE = ("SELECT", "UPDATE", "DELETE")
+
+
+def table_aliases(sql: str) -> dict[str, str]:
+    """Map every name a table goes by in `sql` to the table itself."""
+    aliases: dict[str, str] = {}
+    for table, alias in TABLE_REFERENCE.findall(sql):
+        aliases.setdefault(table, table)
+        if alias:
+            aliases[alias] = table
+    return aliases
+
+
+def sqlite_scans(cursor, sql: str) -> list[str]:
+    cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+    details: list[str] = [row[-1] for row in cursor.fetchall()]
+    if is_bounded_sqlite_scan(sql, details):
+        return []
+    # Index scans are reported as "SCAN t USING [COVERING] INDEX i".
+    return [
+        match.group(1)
+        for match in (
+            re.fullmatch(r"SCAN (?:TABLE )?(\w+)(?: AS \w+)?", detail)
+            for detail in details
+        )
+        if match
+    ]
+
+
+def mysql_scans(cursor, sql: str) -> list[str]:
+    cursor.execute(f"EXPLAIN {sql}")
+    columns: list[str] = [column[0] for column in cursor.description]
+    return [
+        plan["table"]
+        for plan in (dict(zip(columns, row)) for row in cursor.fetchall())
+        if plan["type"] == "ALL"
+    ]
+
+
+# Plan readers by database vendor, listing the tables read in full.
+PLAN_READERS = {"sqlite": sqlite_scans, "mysql": mysql_scans}
+
+
+def full_table_scans(sql: str, tables: set[str]) -> list[str]:
+    """Tables from `tables` the database would read in full to run `sql`.
+
+    `sql` is a query as captured by CaptureQueriesContext, with parameters
+    already interpolated. Only vendors in PLAN_READERS are supported.
+    """
+    if not sql.lstrip().upper().startswith(EXPLAINABLE):
+        return []
+    aliases: dict[str, str] = table_aliases(sql)
+    with connection.cursor() as cursor:
+        scanned: list[str] = PLAN_READERS[connection.vendor](cursor, sql)
+    return [
+        aliases.get(table, table)
+        for table in scanned
+        if aliases.get(table, table) in tables
+    ]
+
+
+def is_bounded_sqlite_scan(sql: str, details: list[str]) -> bool:
+    """Whether SQLite stops reading after the first rows of a scan.
+
+    SQLite reports walking a table in rowid order as a scan, even when an
+    unfiltered `ORDER BY id LIMIT n` only reads n rows. MySQL reports the
+    same plan as an index read rather than a full scan.
+    """
+    if re.search(r"\sLIMIT \d+$", sql) is None or " WHERE " in sql:
+        return False
+    return not any("TEMP B-TREE" in detail for detail in details)
+
+
+def analyze_tables(tables: set[str]):
+    """Refresh planner statistics so plans reflect the current row counts."""
+    with connection.cursor() as cursor:
+        if connection.vendor == "mysql":
+            cursor.execute(f"ANALYZE TABLE {', '.join(sorted(tables))}")
+            cursor.fetchall()
+        else:
+            cursor.execute("ANALYZE")
@@ -0,0 +1,80 @@
+import secrets
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest
+from django.urls import reverse
+
+RESPONSE_CACHE_PREFIX = "response:"
+
+
+def is_plain_json_get(request: HttpRequest) -> bool:
+    """A GET without query parameters that is not for the browsable API."""
+    accepts_html: bool = "text/html" in request.headers.get("Accept", "")
+    return request.method == "GET" and not request.GET and not accepts_html
+
+
+def response_cache_key(path: str) -> str:
+    return f"{RESPONSE_CACHE_PREFIX}{path}"
+
+
+def version_key(key: str) -> str:
+    return f"{key}#version"
+
+
+def new_version() -> str:
+    return secrets.token_hex(8)
+
+
+def get_cached(key: str) -> tuple[tuple | None, str | None]:
+    """Return the entry stored under `key` and the key's current version.
+
+    The entry is None unless it was stored at the current version. The
+    version is None only if the cache evicted it as soon as it was added.
+    """
+    values: dict = cache.get_many([key, version_key(key)])
+    version: str | None = values.get(version_key(key))
+    if version is None:
+        cache.add(version_key(key), new_version(), timeout=None)
+        version = cache.get(version_key(key))
+    entry: tuple | None = values.get(key)
+    if entry is None or version is None or entry[0] != version:
+        return None, version
+    return entry[1:], version
+
+
+def set_cached(key: str, version: str | None, *value):
+    """Store `value` under the version read before the response was built."""
+    if version is not None:
+        cache.set(key, (version, *value))
+
+
+def catalog_keys(
+    products: bool = False,
+    categories: bool = False,
+    category_ids: set[int] | None = None,
+) -> list[str]:
+    keys: list[str] = []
+    if products:
+        keys.append(response_cache_key(reverse("product_list")))
+    if categories:
+        keys.append(response_cache_key(reverse("category_list")))
+    for category_id in category_ids or ():
+        keys.append(
+            response_cache_key(
+                reverse("category_product_list", args=[category_id])
+            )
+        )
+    return keys
+
+
+def invalidate(keys: list[str]):
+    # New versions void every entry stored before the commit, including one
+    # a concurrent request built from the old rows and stores afterwards.
+    if keys:
+        transaction.on_commit(
+            lambda: cache.set_many(
+                {version_key(key): new_version() for key in keys},
+                timeout=None,
+            )
+        )
@@ -1,3 +1,5 @@
+from drf_spectacular.utils import OpenApiParameter
+
 from answerking_app.utils.model_types import (
     ProductType,
     CategoryType,
@@ -10,6 +12,26 @@ from answerking_app.utils.model_types import (
 
 example_time = "2022-11-23T10:15:36.622Z"
 
+stream_parameter = OpenApiParameter(
+    "stream",
+    bool,
+    description="Stream the full list as a chunked JSON array.",
+)
+
+fields_parameter = OpenApiParameter(
+    "fields",
+    str,
+    description="Comma separated fields to return, with dots for nested "
+    "fields, e.g. id,lineItems.product.name,lineItems.quantity.",
+)
+
+expand_parameter = OpenApiParameter(
+    "expand",
+    str,
+    description="Comma separated related objects to embed in full. Other "
+    "related objects are returned as their ids.",
+)
+
 category_product_example: int = 0
 
 product_category_example: CategoryType = {
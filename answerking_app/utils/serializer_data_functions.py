@@ -1,6 +1,5 @@
 import re
 
-from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import status
 
 from answerking_app.models.models import Product
@@ -12,23 +11,32 @@ def compress_white_spaces(value: str) -> str:
 
 
 def products_check(validated_data: dict) -> list[Product]:
-    products: list[Product] = []
     if "products" not in validated_data:
-        return products
-    for product in validated_data["products"]:
-        try:
-            product = Product.objects.get(pk=product["id"])
-            if product.retired:
-                raise ProblemDetails(
-                    status=status.HTTP_410_GONE,
-                    detail="This product has been retired",
-                )
-            products.append(product)
-        except ObjectDoesNotExist as exc:
-            raise ProblemDetails(
-                status=status.HTTP_400_BAD_REQUEST,
-                detail="Product was not Found",
-                title="Product not found",
-                extensions={"errors": exc.args},
-            )
-    return products
+        return []
+    product_ids: list[int] = [
+        product["id"] for product in validated_data["products"]
+    ]
+    found: dict[int, Product] = Product.objects.in_bulk(product_ids)
+    missing_ids: list[int] = list(
+        dict.fromkeys(pk for pk in product_ids if pk not in found)
+    )
+    retired_ids: list[int] = list(
+        dict.fromkeys(
+            pk for pk in product_ids if pk in found and found[pk].retired
+        )
+    )
+    errors: dict = {"missing": missing_ids, "retired": retired_ids}
+    if missing_ids:
+        raise ProblemDetails(
+            status=status.HTTP_400_BAD_REQUEST,
+            detail="Product was not Found",
+            title="Product not found",
+            extensions={"errors": errors},
+        )
+    if retired_ids:
+        raise ProblemDetails(
+            status=status.HTTP_410_GONE,
+            detail="This product has been retired",
+            extensions={"errors": errors},
+        )
+    return [found[pk] for pk in product_ids]
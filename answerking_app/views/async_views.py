@@ -0,0 +1,210 @@
+import datetime
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.http import quote_etag
+from django.views import View
+from rest_framework.settings import api_settings
+
+from answerking_app.models.models import Category, OrderDocument
+from answerking_app.models.read_serializers import CategoryReadSerializer
+from answerking_app.utils.catalog_file import MappedCatalog
+from answerking_app.utils.catalog_snapshot import (
+    CatalogSnapshot,
+    aget_catalog_snapshot,
+)
+from answerking_app.utils.mixins.ConditionalGetMixin import (
+    avalidators_for,
+    not_modified,
+    with_validators,
+)
+from answerking_app.utils.mixins.OrderDocumentMixins import (
+    OrderDocumentListMixin,
+    document_etag,
+)
+from answerking_app.utils.order_documents import with_missing_documents
+from answerking_app.utils.response_cache import is_plain_json_get
+from answerking_app.views import category_views, order_views
+
+
+class AsyncReadView(View, ABC):
+    """Answer plain GET requests on the event loop with the async ORM.
+
+    `get` returns the response, or None to leave the request to
+    `sync_view`, the DRF view of the same URL. Every other request, such as
+    writes, filtered, paginated or streamed lists, and errors, is handed to
+    the DRF view in a thread, so responses match the synchronous API.
+    """
+
+    sync_view: Callable[..., HttpResponseBase] | None = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # The DRF view does its own CSRF checks, and documents the URL in
+        # the schema.
+        view.csrf_exempt = True
+        view.cls = initkwargs["sync_view"].cls
+        view.initkwargs = initkwargs["sync_view"].initkwargs
+        return view
+
+    async def dispatch(
+        self, request: HttpRequest, *args, **kwargs
+    ) -> HttpResponseBase:
+        if is_plain_json_get(request):
+            response: HttpResponseBase | None = await self.get(
+                request, *args, **kwargs
+            )
+            if response is not None:
+                return response
+        return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+
+    @abstractmethod
+    async def get(
+        self, request: HttpRequest, *args, **kwargs
+    ) -> HttpResponseBase | None:
+        ...
+
+
+def json_response(
+    request: HttpRequest,
+    etag: str,
+    last_modified: datetime.datetime | None,
+    content: bytes,
+) -> HttpResponseBase:
+    return not_modified(request, etag, last_modified) or with_validators(
+        HttpResponse(content, content_type="application/json"),
+        etag,
+        last_modified,
+    )
+
+
+def positive_int(value: str) -> int | None:
+    """The id in the URL, or None for the DRF view to reject."""
+    return int(value) if value.isdigit() and int(value) > 0 else None
+
+
+class ProductDetailAsyncView(AsyncReadView):
+    async def get(
+        self, request: HttpRequest, *args, **kwargs
+    ) -> HttpResponseBase | None:
+        pk: int | None = positive_int(kwargs["pk"])
+        if pk is None:
+            return None
+        snapshot: CatalogSnapshot | MappedCatalog = (
+            await aget_catalog_snapshot()
+        )
+        content: bytes | None = snapshot.get_product_json(pk)
+        if snapshot.generation is None or content is None:
+            return None
+        return json_response(
+            request,
+            quote_etag(f"catalog-{snapshot.generation}"),
+            snapshot.last_modified,
+            content,
+        )
+
+
+class CategoryDetailAsyncView(AsyncReadView):
+    async def get(
+        self, request: HttpRequest, *args, **kwargs
+    ) -> HttpResponseBase | None:
+        pk: int | None = positive_int(kwargs["pk"])
+        if pk is None:
+            return None
+        etag, last_modified = await avalidators_for(
+            category_views.CategoryDetailView(
+                kwargs={"pk": pk}
+            ).get_version_querysets()
+        )
+        response: HttpResponseBase | None = not_modified(
+            request, etag, last_modified
+        )
+        if response is not None:
+            return response
+        data: list[dict] = await CategoryReadSerializer(
+            Category.objects.filter(pk=pk)
+        ).adata()
+        if not data:
+            return None
+        return with_validators(
+            HttpResponse(
+                api_settings.DEFAULT_RENDERER_CLASSES[0]().render(data[0]),
+                content_type="application/json",
+            ),
+            etag,
+            last_modified,
+        )
+
+
+class OrderListAsyncView(AsyncReadView):
+    async def get(
+        self, request: HttpRequest, *args, **kwargs
+    ) -> HttpResponseBase | None:
+        etag, last_modified = await avalidators_for(
+            order_views.OrderListView().get_version_querysets()
+        )
+        response: HttpResponseBase | None = not_modified(
+            request, etag, last_modified
+        )
+        if response is not None:
+            return response
+        # Plain requests are not paginated, so this is the whole list, as
+        # the DRF view returns it.
+        rows: list[tuple[int, bytes | None]] = [
+            row
+            async for row in OrderDocumentListMixin.documents(
+                order_views.OrderListView.queryset.all()
+            )
+        ]
+        if any(document is None for _, document in rows):
+            documents: list[bytes] = await sync_to_async(
+                with_missing_documents
+            )(rows)
+        else:
+            documents = [bytes(document) for _, document in rows]
+        return with_validators(
+            HttpResponse(
+                b"[" + b",".join(documents) + b"]",
+                content_type="application/json",
+            ),
+            etag,
+            last_modified,
+        )
+
+
+class OrderDetailAsyncView(AsyncReadView):
+    async def get(
+        self, request: HttpRequest, *args, **kwargs
+    ) -> HttpResponseBase | None:
+        pk: int | None = positive_int(kwargs["pk"])
+        if pk is None:
+            return None
+        row: tuple[bytes, datetime.datetime] | None = (
+            await OrderDocument.objects.filter(pk=pk)
+            .values_list("document", "last_updated")
+            .afirst()
+        )
+        if row is None:
+            # Orders without a document, archived or missing ones.
+            return None
+        return json_response(
+            request, document_etag(pk, row[1]), row[1], bytes(row[0])
+        )
+
+
+def read_view(
+    view_class: type[View], async_view_class: type[AsyncReadView]
+) -> Callable[..., HttpResponseBase]:
+    """The view for a URL, serving GETs asynchronously if enabled.
+
+    Only for ASGI servers, under WSGI an async view would need an event
+    loop per request.
+    """
+    sync_view: Callable[..., HttpResponseBase] = view_class.as_view()
+    if not settings.ASYNC_READ_VIEWS:
+        return sync_view
+    return async_view_class.as_view(sync_view=sync_view)
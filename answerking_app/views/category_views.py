@@ -1,9 +1,11 @@
 from django.db.models import QuerySet
+from django.http import HttpResponseBase
 from rest_framework import generics, mixins
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from answerking_app.models.models import Category
+from answerking_app.models.models import Category, Product
+from answerking_app.models.read_serializers import CategoryReadSerializer
 from answerking_app.models.serializers import (
     CategorySerializer,
     ProblemDetailSerializer,
@@ -11,7 +13,15 @@ from answerking_app.models.serializers import (
 from answerking_app.utils.mixins.CategoryProductMixins import (
     CategoryProductListMixin,
 )
+from answerking_app.utils.mixins.CachedResponseMixin import (
+    CachedResponseMixin,
+)
 from answerking_app.utils.mixins.RetireMixin import RetireMixin
+from answerking_app.utils.mixins.CatalogSnapshotMixin import (
+    CatalogSnapshotListMixin,
+)
+from answerking_app.utils.mixins.FastReadMixins import FastRetrieveMixin
+from answerking_app.utils.pagination import KeysetPagination
 from answerking_app.utils.url_parameter_check import check_url_parameter
 
 from drf_spectacular.utils import (
@@ -26,20 +36,34 @@ from answerking_app.utils.schema.schema_examples import (
     problem_detail_example,
     category_products_body_example,
     product_example,
+    stream_parameter,
+    fields_parameter,
+    expand_parameter,
 )
 
 
 class CategoryListView(
-    mixins.ListModelMixin,
+    CachedResponseMixin,
+    CatalogSnapshotListMixin,
     mixins.CreateModelMixin,
     generics.GenericAPIView,
 ):
     queryset: QuerySet = Category.objects.all()
     serializer_class: CategorySerializer = CategorySerializer
+    read_serializer_class = CategoryReadSerializer
+    snapshot_json_field: str = "category_list_json"
+    pagination_class = KeysetPagination
+
+    def get_version_querysets(self) -> list[tuple[QuerySet, str]]:
+        return [
+            (Category.objects.all(), "last_updated"),
+            (Category.products.through.objects.all(), "id"),
+        ]
 
     @extend_schema(
         tags=["Inventory"],
         summary="Get all categories.",
+        parameters=[stream_parameter, fields_parameter, expand_parameter],
         responses={
             200: OpenApiResponse(
                 response=CategorySerializer,
@@ -54,7 +78,7 @@ class CategoryListView(
             )
         },
     )
-    def get(self, request: Request, *args, **kwargs) -> Response:
+    def get(self, request: Request, *args, **kwargs) -> HttpResponseBase:
         return self.list(request, *args, **kwargs)
 
     @extend_schema(
@@ -95,7 +119,7 @@ class CategoryListView(
 
 
 class CategoryDetailView(
-    mixins.RetrieveModelMixin,
+    FastRetrieveMixin,
     mixins.UpdateModelMixin,
     RetireMixin,
     mixins.DestroyModelMixin,
@@ -103,10 +127,23 @@ class CategoryDetailView(
 ):
     queryset: QuerySet = Category.objects.all()
     serializer_class: CategorySerializer = CategorySerializer
+    read_serializer_class = CategoryReadSerializer
+
+    def get_version_querysets(self) -> list[tuple[QuerySet, str]]:
+        return [
+            (Category.objects.filter(pk=self.kwargs["pk"]), "last_updated"),
+            (
+                Category.products.through.objects.filter(
+                    category_id=self.kwargs["pk"]
+                ),
+                "id",
+            ),
+        ]
 
     @extend_schema(
         tags=["Inventory"],
         summary="Get a single category.",
+        parameters=[fields_parameter, expand_parameter],
         responses={
             200: OpenApiResponse(
                 response=CategorySerializer,
@@ -143,7 +180,7 @@ class CategoryDetailView(
             ),
         },
     )
-    def get(self, request: Request, *args, **kwargs) -> Response:
+    def get(self, request: Request, *args, **kwargs) -> HttpResponseBase:
         check_url_parameter(kwargs["pk"])
         return self.retrieve(request, *args, **kwargs)
 
@@ -243,12 +280,23 @@ class CategoryDetailView(
 
 
 class CategoryProductListView(
+    CachedResponseMixin,
     CategoryProductListMixin,
     generics.GenericAPIView,
 ):
     queryset: QuerySet = Category.objects.all()
     serializer_class: CategorySerializer = CategorySerializer
 
+    def get_version_querysets(self) -> list[tuple[QuerySet, str]]:
+        return [
+            (
+                Product.objects.filter(category=self.kwargs["pk"]),
+                "last_updated",
+            ),
+            (Category.objects.all(), "last_updated"),
+            (Category.products.through.objects.all(), "id"),
+        ]
+
     @extend_schema(
         tags=["Inventory"],
         summary="Get all products in a category.",
@@ -288,6 +336,6 @@ class CategoryProductListView(
             ),
         },
     )
-    def get(self, request: Request, **kwargs) -> Response:
+    def get(self, request: Request, **kwargs) -> HttpResponseBase:
         check_url_parameter(kwargs["pk"])
         return self.list(**kwargs)
@@ -1,16 +1,35 @@
 from typing import Literal
 
 from django.db.models import QuerySet
+from django.http import HttpResponseBase
 from rest_framework import generics, mixins
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from answerking_app.models.models import Order
+from answerking_app.models.filter_serializers import OrderFilterSerializer
+from answerking_app.models.models import (
+    ArchivedOrder,
+    Category,
+    Order,
+    OrderListVersion,
+    Product,
+)
+from answerking_app.models.read_serializers import (
+    ArchivedOrderReadSerializer,
+    OrderReadSerializer,
+)
 from answerking_app.models.serializers import (
     OrderSerializer,
     ProblemDetailSerializer,
 )
+from answerking_app.utils.filters import QueryParameterFilter
+from answerking_app.utils.mixins.OrderDocumentMixins import (
+    OrderDocumentListMixin,
+    OrderDocumentRetrieveMixin,
+)
 from answerking_app.utils.mixins.RetireMixin import CancelOrderMixin
+from answerking_app.utils.order_documents import ORDER_LIST_VERSION_ID
+from answerking_app.utils.pagination import KeysetPagination
 from answerking_app.utils.url_parameter_check import check_url_parameter
 
 from drf_spectacular.utils import (
@@ -23,20 +42,41 @@ from answerking_app.utils.schema.schema_examples import (
     order_example,
     order_body_example,
     problem_detail_example,
+    stream_parameter,
+    fields_parameter,
+    expand_parameter,
 )
 
 
 class OrderListView(
-    mixins.ListModelMixin,
+    OrderDocumentListMixin,
     mixins.CreateModelMixin,
     generics.GenericAPIView,
 ):
-    queryset: QuerySet = Order.objects.all()
+    queryset: QuerySet = OrderSerializer.setup_eager_loading(
+        Order.objects.all()
+    )
     serializer_class: OrderSerializer = OrderSerializer
+    read_serializer_class = OrderReadSerializer
+    filter_backends = [QueryParameterFilter]
+    filter_serializer_class = OrderFilterSerializer
+    pagination_class = KeysetPagination
+    ordering_fields: dict[str, str] = {"id": "id", "createdOn": "created_on"}
+
+    def get_version_querysets(self) -> list[tuple[QuerySet, str]]:
+        # One row touched by every order write, rather than an aggregate
+        # over all orders.
+        return [
+            (
+                OrderListVersion.objects.filter(pk=ORDER_LIST_VERSION_ID),
+                "last_updated",
+            )
+        ]
 
     @extend_schema(
         tags=["Orders"],
         summary="Get all orders.",
+        parameters=[stream_parameter, fields_parameter, expand_parameter],
         responses={
             200: OpenApiResponse(
                 response=OrderSerializer,
@@ -44,10 +84,21 @@ class OrderListView(
                 examples=[
                     OpenApiExample("Category example", value=order_example)
                 ],
-            )
+            ),
+            400: OpenApiResponse(
+                response=ProblemDetailSerializer,
+                description="Unknown or invalid query parameters are provided.",
+                examples=[
+                    OpenApiExample(
+                        "Problem response",
+                        value=problem_detail_example,
+                        response_only=True,
+                    )
+                ],
+            ),
         },
     )
-    def get(self, request: Request, *args, **kwargs) -> Response:
+    def get(self, request: Request, *args, **kwargs) -> HttpResponseBase:
         return self.list(request, *args, **kwargs)
 
     @extend_schema(
@@ -88,20 +139,79 @@ class OrderListView(
 
 
 class OrderDetailView(
-    mixins.RetrieveModelMixin,
+    OrderDocumentRetrieveMixin,
     mixins.DestroyModelMixin,
     mixins.UpdateModelMixin,
     CancelOrderMixin,
     generics.GenericAPIView,
 ):
 
-    queryset: QuerySet = Order.objects.all()
+    queryset: QuerySet = OrderSerializer.setup_eager_loading(
+        Order.objects.all()
+    )
     serializer_class: OrderSerializer = OrderSerializer
+    read_serializer_class = OrderReadSerializer
+    archive_queryset: QuerySet = ArchivedOrder.objects.all()
+    archive_read_serializer_class = ArchivedOrderReadSerializer
+
+    def get_queryset(self) -> QuerySet:
+        return OrderSerializer.setup_eager_loading(
+            Order.objects.all(), self.get_field_selection()
+        )
+
+    def get_version_querysets(self) -> list[tuple[QuerySet, str]]:
+        return [
+            (Order.objects.filter(pk=self.kwargs["pk"]), "last_updated"),
+            (
+                Product.objects.filter(lineitem__order=self.kwargs["pk"]),
+                "last_updated",
+            ),
+            (
+                Category.objects.filter(
+                    products__lineitem__order=self.kwargs["pk"]
+                ),
+                "last_updated",
+            ),
+            (
+                Category.products.through.objects.filter(
+                    product__lineitem__order=self.kwargs["pk"]
+                ),
+                "id",
+            ),
+        ]
+
+    def get_archive_version_querysets(self) -> list[tuple[QuerySet, str]]:
+        return [
+            (
+                ArchivedOrder.objects.filter(pk=self.kwargs["pk"]),
+                "last_updated",
+            ),
+            (
+                Product.objects.filter(
+                    archivedlineitem__order=self.kwargs["pk"]
+                ),
+                "last_updated",
+            ),
+            (
+                Category.objects.filter(
+                    products__archivedlineitem__order=self.kwargs["pk"]
+                ),
+                "last_updated",
+            ),
+            (
+                Category.products.through.objects.filter(
+                    product__archivedlineitem__order=self.kwargs["pk"]
+                ),
+                "id",
+            ),
+        ]
+
     lookup_url_kwarg: Literal["pk"] = "pk"
 
     @extend_schema(
         tags=["Orders"],
         summary="Get a single order.",
+        parameters=[fields_parameter, expand_parameter],
         responses={
             200: OpenApiResponse(
                 response=OrderSerializer,
@@ -127,7 +237,7 @@ class OrderDetailView(
             ),
         },
     )
-    def get(self, request: Request, *args, **kwargs) -> Response:
+    def get(self, request: Request, *args, **kwargs) -> HttpResponseBase:
         check_url_parameter(kwargs["pk"])
         return self.retrieve(request, *args, **kwargs)
 
@@ -1,14 +1,26 @@
 from django.db.models import QuerySet
+from django.http import HttpResponseBase
 from rest_framework import generics, mixins
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from answerking_app.models.models import Product
+from answerking_app.models.filter_serializers import ProductFilterSerializer
+from answerking_app.models.models import Category, Product
+from answerking_app.models.read_serializers import ProductReadSerializer
 from answerking_app.models.serializers import (
     ProductSerializer,
     ProblemDetailSerializer,
 )
+from answerking_app.utils.filters import QueryParameterFilter
+from answerking_app.utils.mixins.CachedResponseMixin import (
+    CachedResponseMixin,
+)
 from answerking_app.utils.mixins.RetireMixin import RetireMixin
+from answerking_app.utils.pagination import KeysetPagination
+from answerking_app.utils.mixins.CatalogSnapshotMixin import (
+    CatalogSnapshotListMixin,
+    ProductSnapshotRetrieveMixin,
+)
 from answerking_app.utils.url_parameter_check import check_url_parameter
 
 from drf_spectacular.utils import (
@@ -22,21 +34,43 @@ from answerking_app.utils.schema.schema_examples import (
     product_body_example,
     problem_detail_example,
     product_categories_body_example,
+    stream_parameter,
+    fields_parameter,
+    expand_parameter,
 )
 
 
 class ProductListView(
-    mixins.ListModelMixin,
+    CachedResponseMixin,
+    CatalogSnapshotListMixin,
     mixins.CreateModelMixin,
     generics.GenericAPIView,
 ):
 
-    queryset: QuerySet = Product.objects.all()
+    queryset: QuerySet = Product.objects.prefetch_related("category_set")
     serializer_class: ProductSerializer = ProductSerializer
+    read_serializer_class = ProductReadSerializer
+    snapshot_json_field: str = "product_list_json"
+    filter_backends = [QueryParameterFilter]
+    filter_serializer_class = ProductFilterSerializer
+    pagination_class = KeysetPagination
+    ordering_fields: dict[str, str] = {
+        "id": "id",
+        "name": "name",
+        "price": "price",
+    }
+
+    def get_version_querysets(self) -> list[tuple[QuerySet, str]]:
+        return [
+            (Product.objects.all(), "last_updated"),
+            (Category.objects.all(), "last_updated"),
+            (Category.products.through.objects.all(), "id"),
+        ]
 
     @extend_schema(
         tags=["Inventory"],
         summary="Get all products.",
+        parameters=[stream_parameter, fields_parameter, expand_parameter],
         responses={
             200: OpenApiResponse(
                 response=ProductSerializer,
@@ -48,10 +82,21 @@ class ProductListView(
                         response_only=True,
                     )
                 ],
-            )
+            ),
+            400: OpenApiResponse(
+                response=ProblemDetailSerializer,
+                description="Unknown or invalid query parameters are provided.",
+                examples=[
+                    OpenApiExample(
+                        "Problem response",
+                        value=problem_detail_example,
+                        response_only=True,
+                    )
+                ],
+            ),
         },
     )
-    def get(self, request: Request, *args, **kwargs) -> Response:
+    def get(self, request: Request, *args, **kwargs) -> HttpResponseBase:
         return self.list(request, *args, **kwargs)
 
     @extend_schema(
@@ -92,17 +137,34 @@ class ProductListView(
 
 
 class ProductDetailView(
-    mixins.RetrieveModelMixin,
+    ProductSnapshotRetrieveMixin,
     mixins.UpdateModelMixin,
     RetireMixin,
     generics.GenericAPIView,
 ):
-    queryset: QuerySet = Product.objects.all()
+    queryset: QuerySet = Product.objects.prefetch_related("category_set")
     serializer_class: ProductSerializer = ProductSerializer
+    read_serializer_class = ProductReadSerializer
+
+    def get_version_querysets(self) -> list[tuple[QuerySet, str]]:
+        return [
+            (Product.objects.filter(pk=self.kwargs["pk"]), "last_updated"),
+            (
+                Category.objects.filter(products=self.kwargs["pk"]),
+                "last_updated",
+            ),
+            (
+                Category.products.through.objects.filter(
+                    product_id=self.kwargs["pk"]
+                ),
+                "id",
+            ),
+        ]
 
     @extend_schema(
         tags=["Inventory"],
         summary="Get a single product.",
+        parameters=[fields_parameter, expand_parameter],
         responses={
             200: OpenApiResponse(
                 response=ProductSerializer,
@@ -139,7 +201,7 @@ class ProductDetailView(
             ),
         },
     )
-    def get(self, request: Request, *args, **kwargs) -> Response:
+    def get(self, request: Request, *args, **kwargs) -> HttpResponseBase:
         check_url_parameter(kwargs["pk"])
         return self.retrieve(request, *args, **kwargs)
 